@@ -0,0 +1,69 @@
+"""
+Serialized size of gauge figures with the shared gauge template, against figures that inline
+plotly's default template, the common layout block and the per-trace defaults.
+
+Usage:
+    python -m benchmarks.bench_figure_bytes [--gauges 100]
+"""
+import argparse
+import copy
+import gzip
+
+import plotly.io as pio
+from dash import html
+from dash._utils import to_json
+
+from dash_gauge_component.template import TEMPLATE_NAME
+from tests.helpers import make_gauges
+
+
+def merge_defaults(target, defaults):
+    """Copy the keys of ``defaults`` missing from ``target``, recursing into dicts."""
+    for key, value in defaults.items():
+        if key not in target:
+            target[key] = copy.deepcopy(value)
+        elif isinstance(value, dict) and isinstance(target[key], dict):
+            merge_defaults(target[key], value)
+
+
+def inline_template(figure):
+    """Rebuild a figure the way gauges were serialized before the shared template."""
+    figure = copy.deepcopy(figure)
+    template = pio.templates[TEMPLATE_NAME].to_plotly_json()
+    scatter_defaults = {key: value for key, value in template['data']['scatter'][0].items() if key != 'type'}
+    for trace in figure['data']:
+        merge_defaults(trace, scatter_defaults)
+    merge_defaults(figure['layout'], template['layout'])
+    figure['layout']['template'] = pio.templates['plotly'].to_plotly_json()
+    return figure
+
+
+def sizes(payload):
+    raw = to_json(payload).encode()
+    return len(raw), len(gzip.compress(raw))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=100)
+    args = parser.parse_args()
+
+    gauges = make_gauges(args.gauges)
+    figures = [gauge.children[0].figure.to_dict() for gauge in gauges]
+    inlined = [inline_template(figure) for figure in figures]
+
+    results = {'one gauge': (sizes(inlined[0]), sizes(figures[0]))}
+    page_after = sizes(html.Div(gauges))
+    for gauge, figure in zip(gauges, inlined):
+        gauge.children[0].figure = figure
+    results[f"{args.gauges}-gauge page"] = (sizes(html.Div(gauges)), page_after)
+
+    print(f"{'':24} {'raw bytes':>12} {'gzip bytes':>12}")
+    for label, (before, after) in results.items():
+        print(f"{label + ', before':24} {before[0]:12,} {before[1]:12,}")
+        print(f"{label + ', template':24} {after[0]:12,} {after[1]:12,}")
+        print(f"{label + ', saved':24} {before[0] - after[0]:12,} {before[1] - after[1]:12,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,383 @@
+"""
+Load test of gauge-heavy Dash apps: page loads and callback traffic from concurrent users.
+
+Targets the example app (examples/multiple_plots.py), which only serves page loads, or synthetic layouts
+of many gauges refreshed by one GaugeGroup callback, as a dashboard polling its data is. Requests go
+through Flask's test client in this process or, with --server, to a local threaded server in its own
+process, so that the server CPU time is measured without the load generator's.
+
+Each user repeatedly either loads the page, with probability --page-loads, or sends the refresh
+callback. Page loads request the index, layout and dependencies, but not the Dash scripts, which
+browsers cache. With gauges caching their static layers, a share --first-visits of page loads also
+fetches the layers of the layout's hashes, as browsers do until they keep them. With --rate, the
+actions of all users are paced to that many per second overall; without it, each user sends its next
+action as soon as the last one is answered.
+Latency percentiles, requests per second, response bytes and server CPU time are printed per kind of
+request and appended to --output as one JSON line per run. --compare prints the runs of such a file side
+by side.
+
+Usage:
+    python -m benchmarks.bench_load [--app synthetic] [--gauges 100 1000] [--users 8] [--seconds 10]
+                                    [--rate 50] [--page-loads 0.1] [--server] [--gauge-options '{"dial_image": true}']
+                                    [--first-visits 1.0]
+    python -m benchmarks.bench_load --app example --users 4
+    python -m benchmarks.bench_load --compare bench_load.jsonl
+"""
+import argparse
+import datetime
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import threading
+import time
+
+import numpy as np
+
+GAUGE_TYPE = 'load-gauge'
+CPU_ROUTE = '/_bench-load/cpu'
+PAGE_REQUESTS = [('page', 'GET', '/'), ('layout', 'GET', '/_dash-layout'),
+                 ('dependencies', 'GET', '/_dash-dependencies')]
+CALLBACK_PATH = '/_dash-update-component'
+
+
+def make_synthetic_app(count, gauge_options):
+    """A grid of ``count`` gauges refreshed with new random values by one GaugeGroup callback."""
+    import dash
+    from dash import Input, ctx, dcc, html
+
+    from dash_gauge_component import GaugeGroup, serve_static_layers
+    from tests.helpers import make_gauges
+
+    app = dash.Dash(__name__)
+    gauges = make_gauges(count, GAUGE_TYPE, **gauge_options)
+    group = GaugeGroup(gauges)
+    app.layout = html.Div([
+        dcc.Interval(id='load-refresh', interval=1000),
+        html.Div([html.Div([gauge], style={'height': '160px'}) for gauge in gauges],
+                 style={'display': 'grid', 'gridTemplateColumns': 'repeat(10, 1fr)'}),
+    ])
+    if gauge_options.get('cache_static_layers'):
+        serve_static_layers(app, gauges)
+
+    @app.callback(group.output, Input('load-refresh', 'n_intervals'))
+    def refresh(n_intervals):
+        values = np.random.default_rng(n_intervals).uniform(0, 100, count).tolist()
+        return group.update(dict(enumerate(values)), ctx.outputs_list)
+
+    return app
+
+
+def make_app(name, count, gauge_options):
+    """Build the app under test, with a route reporting the CPU time of the serving process."""
+    import flask
+
+    if name == 'example':
+        from examples.multiple_plots import app
+    else:
+        app = make_synthetic_app(count, gauge_options)
+    if 'bench_load_cpu' not in app.server.view_functions:
+        app.server.add_url_rule(CPU_ROUTE, 'bench_load_cpu', lambda: flask.jsonify(time.process_time()))
+    return app
+
+
+def callback_body(name, count, n_intervals):
+    """The request the browser sends for the refresh callback of the synthetic app, or None for the example."""
+    if name == 'example':
+        return None
+    output = json.dumps({'index': ['ALL'], 'subcomponent': 'graph', 'type': GAUGE_TYPE},
+                        separators=(',', ':'), sort_keys=True)
+    return {
+        'output': f"{output}.figure",
+        'outputs': [{'id': {'type': GAUGE_TYPE, 'index': i, 'subcomponent': 'graph'}, 'property': 'figure'}
+                    for i in range(count)],
+        'inputs': [{'id': 'load-refresh', 'property': 'n_intervals', 'value': n_intervals}],
+        'changedPropIds': ['load-refresh.n_intervals'],
+        'state': [],
+    }
+
+
+class TestClientTransport:
+    """Requests through Flask's test client, one per user thread."""
+
+    def __init__(self, app):
+        self.client = app.server.test_client()
+
+    def request(self, method, path, body=None):
+        response = self.client.open(path, method=method, json=body)
+        return response.status_code, len(response.get_data())
+
+    def fetch(self, path):
+        """GET a JSON response."""
+        return self.client.get(path).get_json()
+
+    def cpu_time(self):
+        """The CPU time, in seconds, of the serving process, here this one."""
+        return self.fetch(CPU_ROUTE)
+
+
+class ServerTransport:
+    """Requests over HTTP to a local server, on a new connection each, as the Werkzeug server closes them."""
+
+    def __init__(self, port):
+        self.port = port
+
+    def request(self, method, path, body=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=120)
+        try:
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            connection.request(method, path, body=None if body is None else json.dumps(body), headers=headers)
+            response = connection.getresponse()
+            return response.status, len(response.read())
+        finally:
+            connection.close()
+
+    def fetch(self, path):
+        """GET a JSON response."""
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=120)
+        try:
+            connection.request('GET', path)
+            return json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    def cpu_time(self):
+        """The CPU time, in seconds, of the server process."""
+        return self.fetch(CPU_ROUTE)
+
+
+def serve(name, count, gauge_options, port):
+    """Serve the app under test with a threaded Werkzeug server, in a process of its own."""
+    from werkzeug.serving import make_server
+
+    make_server('127.0.0.1', port, make_app(name, count, gauge_options).server, threaded=True).serve_forever()
+
+
+def start_server(name, count, gauge_options):
+    """Start the server process, returning it and its port once it answers."""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    process = multiprocessing.get_context('spawn').Process(target=serve, args=(name, count, gauge_options, port),
+                                                           daemon=True)
+    process.start()
+    transport = ServerTransport(port)
+    deadline = time.perf_counter() + 300  # Building 1,000 gauges takes a while
+    while True:
+        try:
+            transport.request('GET', CPU_ROUTE)
+            return process, port
+        except OSError:
+            if not process.is_alive() or time.perf_counter() > deadline:
+                process.terminate()
+                raise RuntimeError("The load test server did not start")
+            time.sleep(0.2)
+
+
+def layers_hashes(component):
+    """The distinct static layers hashes of the gauges caching them in a serialized layout, in order."""
+    from dash_gauge_component import Gauge
+
+    hashes = {}
+    if isinstance(component, dict):
+        props = component.get('props', {})
+        store_id = props.get('id')
+        if store_id is not None and isinstance(props.get('data'), dict) and 'hash' in props['data']:
+            if isinstance(store_id, dict) and store_id.get('subcomponent') == 'layers' or \
+                    isinstance(store_id, str) and store_id.endswith(Gauge.layers_id('')):
+                hashes[props['data']['hash']] = None
+        children = props.get('children') or []
+        for child in children if isinstance(children, list) else [children]:
+            hashes.update(layers_hashes(child))
+    elif isinstance(component, list):
+        for child in component:
+            hashes.update(layers_hashes(child))
+    return hashes
+
+
+def page_requests(transport):
+    """
+    The requests of a page load, and of a first visit: these also fetch the static layers of the layout's
+    gauges, as a browser does until it keeps them, in one request.
+    """
+    from dash_gauge_component.layer_cache import LAYERS_ROUTE
+
+    requests = [(kind, method, path, None) for kind, method, path in PAGE_REQUESTS]
+    hashes = list(layers_hashes(transport.fetch('/_dash-layout')))
+    if not hashes:
+        return requests, requests
+    return requests, requests + [('layers', 'GET', f"{LAYERS_ROUTE}?hashes={','.join(hashes)}", None)]
+
+
+def run_users(make_transport, name, count, users, seconds, rate, page_loads, first_visits=1.0):
+    """Run the users for ``seconds``, returning the (kind, latency, bytes, status) samples and the elapsed time."""
+    return_visit, first_visit = page_requests(make_transport())
+    samples = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + seconds
+    interval = users / rate if rate else 0
+
+    def user(seed):
+        rng = random.Random(seed)
+        transport = make_transport()
+        own = []
+        next_action = start + interval * seed / users  # Spread the paced users over one interval
+        while True:
+            if interval:
+                time.sleep(max(0.0, next_action - time.perf_counter()))
+                next_action += interval
+            if time.perf_counter() >= deadline:
+                break
+            body = callback_body(name, count, rng.randrange(1 << 30))
+            if body is None or rng.random() < page_loads:
+                requests = first_visit if rng.random() < first_visits else return_visit
+            else:
+                requests = [('callback', 'POST', CALLBACK_PATH, body)]
+            for kind, method, path, payload in requests:
+                request_start = time.perf_counter()
+                status, size = transport.request(method, path, payload)
+                own.append((kind, time.perf_counter() - request_start, size, status))
+        with lock:
+            samples.extend(own)
+
+    threads = [threading.Thread(target=user, args=(i,)) for i in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start
+
+
+def summarize(samples, elapsed):
+    """Latency percentiles in milliseconds, rates and bytes of some samples."""
+    latencies = np.array([sample[1] for sample in samples]) * 1000
+    sizes = np.array([sample[2] for sample in samples])
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]).tolist() if len(samples) else (None,) * 3
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample[3] >= 400),
+        'rps': len(samples) / elapsed,
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+        'mean_bytes': float(sizes.mean()) if len(samples) else None,
+        'total_bytes': int(sizes.sum()),
+    }
+
+
+def git_commit():
+    """The current commit of the repository, to tell runs apart, or None outside of a checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_test(name, count, gauge_options, users, seconds, rate, page_loads, use_server, first_visits=1.0):
+    """Run one load test, returning its result record."""
+    if use_server:
+        process, port = start_server(name, count, gauge_options)
+        make_transport = lambda: ServerTransport(port)  # noqa: E731
+    else:
+        app = make_app(name, count, gauge_options)
+        make_transport = lambda: TestClientTransport(app)  # noqa: E731
+    try:
+        # Warm up: first-request setup, including the serialization of the layout and its static layers
+        for kind, method, path, body in page_requests(make_transport())[1]:
+            make_transport().request(method, path, body)
+        cpu_start = make_transport().cpu_time()
+        samples, elapsed = run_users(make_transport, name, count, users, seconds, rate, page_loads, first_visits)
+        cpu = make_transport().cpu_time() - cpu_start
+    finally:
+        if use_server:
+            process.terminate()
+            process.join()
+    if not samples:
+        raise RuntimeError("No request was answered in time, run the users for more --seconds")
+
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'app': name,
+        'gauges': None if name == 'example' else count,
+        'gauge_options': gauge_options,
+        'transport': 'server' if use_server else 'test-client',
+        'users': users,
+        'rate': rate,
+        'page_loads': page_loads,
+        'first_visits': first_visits,
+        'seconds': elapsed,
+        'cpu_count': os.cpu_count(),
+        # With the test client, the users run in the serving process, so its CPU time includes theirs
+        'cpu_seconds': cpu,
+        'cpu_utilization': cpu / elapsed,
+        'all': summarize(samples, elapsed),
+        'kinds': {kind: summarize([sample for sample in samples if sample[0] == kind], elapsed)
+                  for kind in sorted({sample[0] for sample in samples})},
+    }
+
+
+def print_result(result):
+    gauges = f"{result['gauges']} gauges" if result['gauges'] is not None else "example app"
+    print(f"{gauges}, {result['users']} users, {result['transport']}, "
+          f"rate {result['rate'] or 'unpaced'}, {result['seconds']:.1f}s, "
+          f"CPU {result['cpu_seconds']:.1f}s ({result['cpu_utilization']:.0%} of one core)")
+    print(f"{'kind':>13} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'mean bytes':>11}")
+    for kind, stats in [*result['kinds'].items(), ('all', result['all'])]:
+        print(f"{kind:>13} {stats['requests']:>9} {stats['errors']:>7} {stats['rps']:8.1f} {stats['p50_ms']:8.1f} "
+              f"{stats['p95_ms']:8.1f} {stats['p99_ms']:8.1f} {stats['mean_bytes']:11,.0f}")
+
+
+def compare(path):
+    """Print the runs saved in a results file side by side."""
+    with open(path) as results:
+        runs = [json.loads(line) for line in results if line.strip()]
+    print(f"{'timestamp':>19} {'commit':>8} {'app':>9} {'gauges':>6} {'transport':>11} {'users':>5} {'rate':>6} "
+          f"{'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'mean bytes':>11} {'cpu':>5}  gauge options")
+    for run in runs:
+        stats = run['all']
+        print(f"{run['timestamp']:>19} {run['commit'] or '-':>8} {run['app']:>9} {run['gauges'] or '-':>6} "
+              f"{run['transport']:>11} {run['users']:>5} {run['rate'] or '-':>6} {stats['rps']:8.1f} "
+              f"{stats['p50_ms']:8.1f} {stats['p95_ms']:8.1f} {stats['p99_ms']:8.1f} {stats['mean_bytes']:11,.0f} "
+              f"{run['cpu_utilization']:5.0%}  {json.dumps(run['gauge_options']) if run['gauge_options'] else '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--app', choices=['synthetic', 'example'], default='synthetic')
+    parser.add_argument('--gauges', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--gauge-options', type=json.loads, default={},
+                        help="Gauge options of the synthetic app, as JSON")
+    parser.add_argument('--users', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--rate', type=float, default=None, help="Actions per second of all users together")
+    parser.add_argument('--page-loads', type=float, default=0.1, help="Share of actions that are page loads")
+    parser.add_argument('--first-visits', type=float, default=1.0,
+                        help="Share of page loads fetching the static layers, with cache_static_layers")
+    parser.add_argument('--server', action='store_true', help="Serve the app from a local server process")
+    parser.add_argument('--output', default='bench_load.jsonl', help="File the results are appended to")
+    parser.add_argument('--compare', metavar='FILE', help="Print the runs saved in FILE and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    counts = [None] if args.app == 'example' else args.gauges
+    for count in counts:
+        result = load_test(args.app, count, args.gauge_options, args.users, args.seconds, args.rate,
+                           args.page_loads, args.server, args.first_visits)
+        print_result(result)
+        with open(args.output, 'a') as output:
+            output.write(json.dumps(result) + '\n')
+    print(f"Results appended to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
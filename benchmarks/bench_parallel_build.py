@@ -0,0 +1,43 @@
+"""
+Wall time of building a large gauge layout against the number of workers.
+
+Usage:
+    python -m benchmarks.bench_parallel_build [--gauges 500] [--workers 1 2 4 8] [--executor process]
+"""
+import argparse
+import os
+import time
+
+from dash_gauge_component import Gauge, build_gauges_parallel
+from tests.helpers import make_specs
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--executor', choices=['thread', 'process'], nargs='+', default=['thread', 'process'])
+    parser.add_argument('--chunksize', type=int, default=8)
+    args = parser.parse_args()
+
+    specs = make_specs(args.gauges)
+    print(f"{args.gauges} gauges, {os.cpu_count()} CPUs")
+
+    serial = time_it(lambda: [Gauge(**spec) for spec in specs])
+    print(f"{'serial':>8} {'-':>8} {serial:8.2f}s")
+
+    for executor in args.executor:
+        for workers in args.workers:
+            elapsed = time_it(lambda: build_gauges_parallel(
+                specs, executor=executor, max_workers=workers, chunksize=args.chunksize))
+            print(f"{executor:>8} {workers:>8} {elapsed:8.2f}s  ({serial / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
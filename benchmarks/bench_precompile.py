@@ -0,0 +1,84 @@
+"""
+Cold start of a gauge layout with and without a precompiled artifact.
+
+Each mode runs in a fresh interpreter, timing imports plus building every gauge, as a worker
+does at startup.
+
+Usage:
+    python -m benchmarks.bench_precompile [--gauges 200] [--distinct 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+WORKER = '''
+import json, sys, time
+start = time.perf_counter()
+from dash_gauge_component import Gauge, PrecompiledGauges
+specs = json.loads(sys.argv[1])
+if len(sys.argv) > 2:
+    with PrecompiledGauges(sys.argv[2]) as artifact:
+        gauges = artifact.build_all(specs)
+else:
+    gauges = [Gauge(**spec) for spec in specs]
+print(time.perf_counter() - start)
+'''
+
+
+def make_cycling_specs(count, distinct):
+    """
+    Gauges cycling through `distinct` dial configurations, as on a dashboard of similar gauges.
+
+    Unlike ``tests.helpers.make_specs``, whose gauges all share one dial, the number of distinct
+    dials is what the artifact's size and warm-up depend on.
+    """
+    return [
+        {
+            'id': f"gauge-{i}",
+            'value': (i * 7) % 100,
+            'color_ranges': [
+                {'min': 0, 'max': 30 + i % distinct, 'color': '#FF0000'},
+                {'min': 30 + i % distinct, 'max': 100, 'color': '#00FF00'},
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def cold_start(specs_json, *artifact):
+    output = subprocess.run([sys.executable, '-c', WORKER, specs_json, *artifact],
+                            check=True, capture_output=True, text=True).stdout
+    return float(output)
+
+
+def main():
+    import json
+
+    from dash_gauge_component import precompile_gauges
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=200)
+    parser.add_argument('--distinct', type=int, default=10, help='number of distinct dial configurations')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    specs = make_cycling_specs(args.gauges, args.distinct)
+    specs_json = json.dumps(specs)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'gauges.dgpc')
+        start = time.perf_counter()
+        entries = precompile_gauges(specs, path)
+        print(f"precompiled {entries} static layers for {args.gauges} gauges in "
+              f"{time.perf_counter() - start:.2f}s ({os.path.getsize(path) / 1024:.0f} KiB)")
+
+        without = min(cold_start(specs_json) for _ in range(args.repeat))
+        with_artifact = min(cold_start(specs_json, path) for _ in range(args.repeat))
+    print(f"cold start without artifact {without:8.2f}s")
+    print(f"cold start with artifact    {with_artifact:8.2f}s  ({without / with_artifact:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Throughput of the shared-memory gauge value store.
+
+Measures single-process update and read rates, then the read rate of several reader processes
+while one writer process updates every gauge.
+
+Usage:
+    python -m benchmarks.bench_shared_store [--gauges 1000] [--seconds 2] [--readers 1 2 4]
+"""
+import argparse
+import multiprocessing
+import time
+
+from dash_gauge_component import SharedValueStore
+
+
+def rate(func, seconds):
+    """Call func repeatedly for about `seconds`, returning calls per second."""
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        func()
+        calls += 1
+    return calls / (time.perf_counter() - start)
+
+
+def writer(name, gauge_ids, stop):
+    store = SharedValueStore(gauge_ids, name=name)
+    k = 0
+    while not stop.is_set():
+        k += 1
+        store.update_many({gauge_id: float(k) for gauge_id in gauge_ids})
+    store.close()
+
+
+def reader(name, gauge_ids, seconds, results):
+    store = SharedValueStore(gauge_ids, name=name)
+    results.put(rate(store.read_many, seconds) * len(gauge_ids))
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=1000)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--readers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    gauge_ids = [f"gauge-{i}" for i in range(args.gauges)]
+    store = SharedValueStore(gauge_ids, create=True)
+    try:
+        values = {gauge_id: 1.0 for gauge_id in gauge_ids}
+        print(f"{args.gauges} gauges")
+        print(f"update          {rate(lambda: store.update('gauge-0', 1.0), args.seconds):14,.0f} records/s")
+        print(f"update_many     {rate(lambda: store.update_many(values), args.seconds) * args.gauges:14,.0f} records/s")
+        print(f"read            {rate(lambda: store.read('gauge-0'), args.seconds):14,.0f} records/s")
+        print(f"read_many       {rate(store.read_many, args.seconds) * args.gauges:14,.0f} records/s")
+        print(f"values view     {rate(lambda: store.values.sum(), args.seconds) * args.gauges:14,.0f} values/s")
+
+        context = multiprocessing.get_context('spawn')
+        for count in args.readers:
+            stop, results = context.Event(), context.Queue()
+            writer_process = context.Process(target=writer, args=(store.name, gauge_ids, stop))
+            readers = [context.Process(target=reader, args=(store.name, gauge_ids, args.seconds, results))
+                       for _ in range(count)]
+            writer_process.start()
+            for process in readers:
+                process.start()
+            total = sum(results.get() for _ in readers)
+            for process in readers:
+                process.join()
+            stop.set()
+            writer_process.join()
+            print(f"{count} reader(s) + 1 writer: {total:14,.0f} records/s read")
+    finally:
+        store.close()
+        store.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Render throughput of gauges shared by many threads, e.g. the request threads of a Dash server.
+
+Each thread renders figures of random values of the same gauges with ``Gauge.render``, while,
+with ``--setters``, other threads keep setting their values.
+
+Usage:
+    python -m benchmarks.bench_threaded_render [--gauges 20] [--renders 400] [--threads 1 2 4 8] [--setters 1]
+"""
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+
+from tests.helpers import make_gauges
+
+
+def run(gauges, renders, threads, setters):
+    """Render ``renders`` figures spread over ``threads`` threads, returning the elapsed time and the setter count."""
+    stop = threading.Event()
+    sets = [0] * setters
+
+    def render(seed):
+        rng = np.random.default_rng(seed)
+        for i, value in enumerate(rng.uniform(0, 100, renders // threads).tolist()):
+            gauges[i % len(gauges)].render(value)
+
+    def set_values(seed):
+        rng = np.random.default_rng(seed)
+        while not stop.is_set():
+            gauges[int(rng.integers(len(gauges)))].value = float(rng.uniform(0, 100))
+            sets[seed] += 1
+
+    background = [threading.Thread(target=set_values, args=(i,)) for i in range(setters)]
+    workers = [threading.Thread(target=render, args=(i,)) for i in range(threads)]
+    for thread in background:
+        thread.start()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in background:
+        thread.join()
+    return elapsed, sum(sets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=20)
+    parser.add_argument('--renders', type=int, default=400)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--setters', type=int, default=1)
+    args = parser.parse_args()
+
+    gauges = make_gauges(args.gauges, value_font_color='auto')
+    for gauge in gauges:
+        gauge.render()  # Split off the static layers up front
+    print(f"{args.gauges} gauges, {args.renders} renders, {args.setters} setter threads, {os.cpu_count()} CPUs")
+    print(f"{'threads':>8} {'time':>8} {'renders/s':>10} {'sets/s':>8}")
+
+    for threads in args.threads:
+        elapsed, sets = run(gauges, args.renders, threads, args.setters)
+        print(f"{threads:>8} {elapsed:7.2f}s {args.renders / elapsed:10,.0f} {sets / elapsed:8,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Throughput of the vectorized zone engine against a per-value Python loop.
+
+Usage:
+    python -m benchmarks.bench_zones [--values 100000] [--ranges 5] [--repeat 20]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dash_gauge_component import ZoneEngine, compile_ranges
+
+
+def make_ranges(count, rng):
+    edges = np.sort(rng.uniform(0, 100, count - 1))
+    edges = np.concatenate([[0], edges, [100]])
+    return [{'min': lo, 'max': hi, 'color': '#000000'} for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def python_loop(values, per_gauge_ranges, state, hysteresis):
+    """The loop the engine replaces: find each value's zone, keeping it in its previous zone within the band."""
+    zones = []
+    for value, ranges, zone in zip(values, per_gauge_ranges, state):
+        if zone >= 0 and ranges[zone]['min'] - hysteresis <= value <= ranges[zone]['max'] + hysteresis:
+            zones.append(zone)
+            continue
+        for i, color_range in enumerate(ranges):
+            if color_range['min'] <= value <= color_range['max']:
+                zones.append(i)
+                break
+        else:
+            zones.append(-1)
+    return zones
+
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=100000)
+    parser.add_argument('--ranges', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 100, args.values)
+    shared = make_ranges(args.ranges, rng)
+    per_gauge = [make_ranges(args.ranges, rng) for _ in range(args.values)]
+
+    for label, ranges in (('shared ranges', shared), ('per-gauge ranges', per_gauge)):
+        engine = ZoneEngine(compile_ranges(ranges), hysteresis=1.0)
+        engine.update(values)
+        elapsed = best_of(args.repeat, lambda: engine.update(values))
+        print(f"engine, {label:17} {elapsed * 1000:8.2f} ms per {args.values:,} values "
+              f"({args.values / elapsed:14,.0f} values/s)")
+
+    state = [-1] * args.values
+    loop_ranges = per_gauge
+    elapsed = best_of(max(1, args.repeat // 10), lambda: python_loop(values.tolist(), loop_ranges, state, 1.0))
+    print(f"python loop             {elapsed * 1000:8.2f} ms per {args.values:,} values "
+          f"({args.values / elapsed:14,.0f} values/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,15 @@
+from .alerts import RangeBoundaries, ZoneEngine, ZoneUpdate, compile_ranges, zone_indices
+from .data_source import FunctionDataSource, GaugeDataSource, GaugePoller, PollResult, ResultCache
+from .dial import serve_dials
 from .gauge import Gauge
+from .group import GaugeGroup, GroupUpdateStats
+from .history import RollingWindow
+from .layer_cache import serve_static_layers
+from .parallel import build_gauges_parallel
+from .precompile import PrecompiledGauges, precompile_gauges
+from .shared_store import SharedValueStore
 
-__all__ = ['Gauge']
\ No newline at end of file
+__all__ = ['Gauge', 'GaugeDataSource', 'FunctionDataSource', 'GaugePoller', 'PollResult', 'ResultCache',
+           'build_gauges_parallel', 'SharedValueStore', 'PrecompiledGauges', 'precompile_gauges',
+           'GaugeGroup', 'GroupUpdateStats', 'RollingWindow', 'serve_dials', 'serve_static_layers',
+           'ZoneEngine', 'ZoneUpdate', 'RangeBoundaries', 'compile_ranges', 'zone_indices']
\ No newline at end of file
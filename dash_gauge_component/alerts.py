@@ -0,0 +1,132 @@
+from collections import namedtuple
+
+import numpy as np
+
+RangeBoundaries = namedtuple('RangeBoundaries', ['lower', 'upper'])
+RangeBoundaries.__doc__ = """
+Color ranges compiled into arrays, see :func:`compile_ranges`.
+
+lower : numpy.ndarray
+    The ``min`` of each range, of shape (gauges, ranges); NaN pads gauges with fewer ranges
+upper : numpy.ndarray
+    The ``max`` of each range, of the same shape
+"""
+
+ZoneUpdate = namedtuple('ZoneUpdate', ['zones', 'previous', 'changed'])
+ZoneUpdate.__doc__ = """
+The zones of a batch of values, see :meth:`ZoneEngine.update`.
+
+zones : numpy.ndarray
+    The index of the color range each value is in, -1 if it is in none
+previous : numpy.ndarray
+    The zones before this update, -1 for values seen for the first time
+changed : numpy.ndarray
+    Boolean mask of the values whose zone changed, i.e. the state transitions to alert on
+"""
+
+
+def compile_ranges(color_ranges):
+    """
+    Compile gauge color ranges into arrays for vectorized zone lookups.
+
+    Parameters
+    ----------
+    color_ranges : list of dict or list of list of dict
+        The ``color_ranges`` shared by all gauges, or those of each gauge
+
+    Returns
+    -------
+    RangeBoundaries
+        Arrays of shape (1, ranges) for shared ranges, or (gauges, max ranges) otherwise
+    """
+    if color_ranges and isinstance(color_ranges[0], dict):
+        color_ranges = [color_ranges]
+    width = max((len(ranges) for ranges in color_ranges), default=0)
+    lower = np.full((len(color_ranges), width), np.nan)
+    upper = np.full((len(color_ranges), width), np.nan)
+    for row, ranges in enumerate(color_ranges):
+        lower[row, :len(ranges)] = [color_range['min'] for color_range in ranges]
+        upper[row, :len(ranges)] = [color_range['max'] for color_range in ranges]
+    return RangeBoundaries(lower, upper)
+
+
+def zone_indices(values, boundaries):
+    """
+    Find the color range each value is in, in one vectorized pass.
+
+    As for a gauge's ``value_font_color="auto"``, a value is in the first range whose ``min`` and
+    ``max`` (both inclusive) surround it.
+
+    Parameters
+    ----------
+    values : array-like
+        The values, one per gauge
+    boundaries : RangeBoundaries
+        The compiled ranges, shared or one row per value
+
+    Returns
+    -------
+    numpy.ndarray
+        The index of the range of each value, -1 if it is in none
+    """
+    values = np.asarray(values, dtype=float)[:, np.newaxis]
+    inside = (values >= boundaries.lower) & (values <= boundaries.upper)
+    return np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+
+
+class ZoneEngine:
+    """
+    Tracks which color range many gauges are in, with hysteresis to suppress flapping.
+
+    A gauge only leaves its current zone once its value is more than ``hysteresis`` beyond
+    the zone's boundaries, so a value oscillating around a threshold does not alert on
+    every update.
+
+    Parameters
+    ----------
+    color_ranges : list of dict, list of list of dict or RangeBoundaries
+        The color ranges shared by all gauges, those of each gauge, or already compiled ones
+    hysteresis : float or array-like, optional
+        How far beyond its zone a value must go to leave it, shared or one per gauge (default 0)
+
+    Example
+    -------
+    ::
+
+        engine = ZoneEngine([gauge.color_ranges for gauge in gauges], hysteresis=2.0)
+        update = engine.update(latest_values)
+        for i in np.flatnonzero(update.changed):
+            alert(gauges[i], update.previous[i], update.zones[i])
+    """
+
+    def __init__(self, color_ranges, hysteresis=0.0):
+        if isinstance(color_ranges, RangeBoundaries):
+            self.boundaries = color_ranges
+        else:
+            self.boundaries = compile_ranges(color_ranges)
+        self.hysteresis = np.asarray(hysteresis, dtype=float)
+        self.zones = None
+
+    def update(self, values):
+        """Evaluate a new value per gauge, returning their zones and the transitions since the last update."""
+        values = np.asarray(values, dtype=float)
+        zones = zone_indices(values, self.boundaries)
+        previous = self.zones if self.zones is not None else np.full(len(values), -1)
+        if len(previous) != len(values):
+            raise ValueError(f"Expected {len(previous)} values, got {len(values)}")
+
+        # Keep values within the hysteresis band of their previous zone in that zone
+        rows = np.arange(len(values)) if len(self.boundaries.lower) > 1 else np.zeros(len(values), dtype=int)
+        had_zone = previous >= 0
+        kept = np.clip(previous, 0, None)
+        lower = self.boundaries.lower[rows, kept] - self.hysteresis
+        upper = self.boundaries.upper[rows, kept] + self.hysteresis
+        stays = had_zone & (values >= lower) & (values <= upper)
+        zones = np.where(stays, previous, zones)
+
+        self.zones = zones
+        return ZoneUpdate(zones, previous, zones != previous)
+
+    def reset(self):
+        """Forget the current zones, e.g. after gauges were added or removed."""
+        self.zones = None
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import threading
+import time
+from collections import namedtuple
+
+PollResult = namedtuple('PollResult', ['value', 'timestamp', 'stale', 'error'])
+PollResult.__doc__ = """
+The outcome of polling a single data source.
+
+value : float or None
+    The fetched value, or the last cached value if the fetch failed (None if there is none)
+timestamp : float or None
+    The ``time.time()`` at which ``value`` was fetched
+stale : bool
+    True if ``value`` comes from the cache because the latest fetch failed or timed out
+error : Exception or None
+    The exception raised by the latest fetch, if any
+"""
+
+
+class GaugeDataSource:
+    """
+    Base class for an asynchronous source of gauge values.
+
+    Subclasses implement :meth:`fetch`, a coroutine returning the current value of the metric
+    backing a gauge. Sources are polled concurrently by :class:`GaugePoller`.
+
+    Parameters
+    ----------
+    id : str or dict
+        The ID of the gauge this source feeds
+    timeout : float, optional
+        Seconds to wait for :meth:`fetch` before falling back to the cached value
+        (default None, use the poller's timeout)
+    """
+
+    def __init__(self, id, timeout=None):
+        self.id = id
+        self.timeout = timeout
+
+    async def fetch(self):
+        """Fetch the current value of this source."""
+        raise NotImplementedError("GaugeDataSource subclasses must implement fetch()")
+
+
+class FunctionDataSource(GaugeDataSource):
+    """
+    A data source backed by a coroutine function.
+
+    Parameters
+    ----------
+    id : str or dict
+        The ID of the gauge this source feeds
+    func : callable
+        A coroutine function taking no arguments and returning the current value
+    timeout : float, optional
+        Seconds to wait for ``func`` before falling back to the cached value
+    """
+
+    def __init__(self, id, func, timeout=None):
+        super().__init__(id, timeout=timeout)
+        self.func = func
+
+    async def fetch(self):
+        return await self.func()
+
+
+class ResultCache:
+    """
+    A thread-safe cache of the last successfully fetched value per source id.
+
+    A single cache can be shared by several pollers (e.g. one per callback) so that a value
+    fetched by one of them is available as a stale fallback to all of them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, source_id):
+        """Return the cached ``(value, timestamp)`` for ``source_id``, or None."""
+        with self._lock:
+            return self._entries.get(source_id)
+
+    def set(self, source_id, value, timestamp):
+        """Store a freshly fetched value for ``source_id``."""
+        with self._lock:
+            self._entries[source_id] = (value, timestamp)
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class GaugePoller:
+    """
+    Polls many gauge data sources concurrently.
+
+    Each poll fetches every source at once, with at most ``max_concurrency`` fetches in flight.
+    A fetch that raises or exceeds its timeout falls back to the last value held in the cache
+    and is reported as stale.
+
+    Results are keyed by source ID. Dict IDs, as used by pattern-matching gauges, are keyed by
+    their JSON with sorted keys, the string Dash makes of them (see :func:`source_key`).
+
+    Parameters
+    ----------
+    sources : list of GaugeDataSource
+        The sources to poll, one per gauge
+    timeout : float, optional
+        Default per-source timeout in seconds (default 1.0)
+    max_concurrency : int, optional
+        Maximum number of fetches in flight at once (default 10)
+    cache : ResultCache, optional
+        The cache to store fetched values in (default a new, private cache)
+    """
+
+    def __init__(self, sources, timeout=1.0, max_concurrency=10, cache=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        ids = [source_key(source.id) for source in sources]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Data source ids must be unique")
+        self.sources = list(sources)
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.cache = cache if cache is not None else ResultCache()
+
+    async def _poll_source(self, source, semaphore):
+        timeout = source.timeout if source.timeout is not None else self.timeout
+        async with semaphore:
+            try:
+                value = await asyncio.wait_for(source.fetch(), timeout)
+            except Exception as error:  # includes asyncio.TimeoutError
+                cached = self.cache.get(source_key(source.id))
+                if cached is None:
+                    return PollResult(None, None, True, error)
+                return PollResult(cached[0], cached[1], True, error)
+
+        timestamp = time.time()
+        self.cache.set(source_key(source.id), value, timestamp)
+        return PollResult(value, timestamp, False, None)
+
+    async def poll_async(self):
+        """Poll all sources concurrently, returning a dict of source id to :class:`PollResult`."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(*(self._poll_source(source, semaphore) for source in self.sources))
+        return {source_key(source.id): result for source, result in zip(self.sources, results)}
+
+    def poll(self):
+        """
+        Poll all sources from synchronous code, e.g. a Dash callback.
+
+        This runs its own event loop, so it cannot be called while one is running, e.g. in an
+        ``async`` Dash callback; await :meth:`poll_async` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # No running loop, as expected
+            return asyncio.run(self.poll_async())
+        raise RuntimeError("GaugePoller.poll() cannot be called from a running event loop, await poll_async() instead")
+
+    def values(self):
+        """Poll all sources and return a dict of source id to value, leaving out sources with no value."""
+        return {source_id: result.value for source_id, result in self.poll().items() if result.value is not None}
+
+    def update_figures(self, gauges):
+        """
+        Poll all sources and update the given gauges with the fetched values.
+
+        Gauges without a source, or whose source has no value yet, keep their current value.
+        Returns the refreshed figures in the order of ``gauges``, ready to be returned to the
+        ``Output(Gauge.graph_id(gauge.id), 'figure')`` outputs of a callback. As :meth:`poll`,
+        this cannot be called while an event loop is running.
+        """
+        values = self.values()
+        figures = []
+        for gauge in gauges:
+            key = source_key(gauge.id)
+            if key in values:
+                gauge.value = values[key]  # Also refreshes the gauge's figure
+            figures.append(gauge.children[0].figure)
+        return figures
+
+
+def source_key(id):
+    """Get the key of the results of a gauge ID: the ID itself, or the JSON with sorted keys of a dict ID."""
+    if isinstance(id, dict):
+        return json.dumps(id, sort_keys=True, separators=(',', ':'))
+    return id
@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from xml.sax.saxutils import escape, quoteattr
+
+import flask
+import numpy as np
+
+DIAL_SIZE = 300  # Size, in pixels, of the plot area the dial image is drawn for
+DIAL_EXTENT = 1.3  # Half the side of the dial image, in axis units, matching the axis ranges of gauge figures
+DIAL_ROUTE = '/_dash-gauge/dials/'
+MAX_DIALS = 1024  # Distinct dials kept in memory; past this, the least recently used ones are dropped
+
+_dials = OrderedDict()  # Dial options key -> (content hash, SVG), shared by the gauges with the same dial
+_svgs = {}  # Content hash -> SVG, for serve_dials
+_lock = threading.Lock()
+
+
+def figure_to_svg(traces, size=DIAL_SIZE, extent=DIAL_EXTENT):
+    """
+    Draw the line and text traces of a gauge figure, as dicts, into an SVG image.
+
+    The image covers the axis ranges ``[-extent, extent]``. Line widths and font sizes are taken
+    as pixels of a ``size`` pixels wide plot area; the image scales with the gauge as a whole.
+    """
+    scale = size / (2 * extent)
+    elements = []
+    for trace in traces:
+        x = ((np.asarray(trace['x'], dtype=float) + extent) * scale).tolist()
+        y = ((extent - np.asarray(trace['y'], dtype=float)) * scale).tolist()
+        if trace.get('mode') == 'text':
+            font = trace.get('textfont', {})
+            for x_text, y_text, text in zip(x, y, trace['text']):
+                elements.append(
+                    f'<text x="{x_text:.2f}" y="{y_text:.2f}" text-anchor="middle" dominant-baseline="central" '
+                    f'font-size="{font.get("size", 12)}" font-family={quoteattr(font.get("family", "Arial"))} '
+                    f'fill={quoteattr(font.get("color", "#444"))}>{escape(str(text))}</text>'
+                )
+        else:
+            line = trace.get('line', {})
+            closed = trace.get('fill') == 'toself'
+            path = 'M' + 'L'.join(f'{x_point:.1f} {y_point:.1f}' for x_point, y_point in zip(x, y))
+            if closed:
+                path += 'Z'
+            elements.append(
+                f'<path d="{path}" fill={quoteattr(trace.get("fillcolor", "none") if closed else "none")} '
+                f'stroke={quoteattr(line.get("color", "#444"))} stroke-width="{line.get("width", 2)}"/>'
+            )
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+            + ''.join(elements) + '</svg>')
+
+
+def dial_svg(key, render_traces):
+    """
+    Get the content hash and SVG of a dial, drawing it the first time its options ``key`` is seen.
+
+    ``render_traces`` returns the dial traces, as dicts, to draw. Every reconfigured dial is a new
+    entry, so only the ``MAX_DIALS`` most recently used dials are kept. Gauges serialized for a page
+    look their dial up again, so the dials of live gauges are drawn again if they were dropped.
+    """
+    with _lock:
+        dial = _dials.get(key)
+        if dial is not None:
+            _dials.move_to_end(key)
+            return dial
+    svg = figure_to_svg(render_traces())
+    content_hash = hashlib.sha256(svg.encode()).hexdigest()[:16]
+    with _lock:
+        _svgs[content_hash] = svg
+        dial = _dials[key] = (content_hash, svg)
+        while len(_dials) > MAX_DIALS:
+            _, (dropped_hash, _) = _dials.popitem(last=False)
+            if all(kept_hash != dropped_hash for kept_hash, _ in _dials.values()):
+                del _svgs[dropped_hash]
+    return dial
+
+
+def dial_source(key, render_traces, dial_image):
+    """
+    Get the ``source`` of a dial's layout image: a data URI, or a URL under the ``dial_image`` prefix.
+
+    URLs contain the hash of the image, so they can be cached for good: a changed dial has a new URL.
+    """
+    content_hash, svg = dial_svg(key, render_traces)
+    if dial_image is True:
+        return 'data:image/svg+xml;base64,' + base64.b64encode(svg.encode()).decode()
+    return f"{dial_image}{content_hash}.svg"
+
+
+def serve_dials(app, route=DIAL_ROUTE):
+    """
+    Serve the dial images of the gauges of a Dash app, so browsers cache them across gauges and page loads.
+
+    Images are served from the gauges built by the serving process, so each worker must build the gauges
+    of its layout itself, as it does when the layout is built at import time or per request.
+
+    Parameters
+    ----------
+    app : dash.Dash
+        The app whose server serves the images
+    route : str, optional
+        The path of the images (default '/_dash-gauge/dials/')
+
+    Returns
+    -------
+    str
+        The URL prefix of the images, to pass as ``dial_image`` to the gauges
+    """
+    def dial(content_hash):
+        svg = _svgs.get(content_hash)
+        if svg is None:
+            flask.abort(404)
+        return flask.Response(svg, mimetype='image/svg+xml',
+                              headers={'Cache-Control': 'public, max-age=31536000, immutable'})
+
+    app.server.add_url_rule(f"{app.config.routes_pathname_prefix.rstrip('/')}{route}<content_hash>.svg",
+                            'dash_gauge_dial', dial)
+    return f"{app.config.requests_pathname_prefix.rstrip('/')}{route}"
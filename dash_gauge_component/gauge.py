@@ -1,6 +1,21 @@
+import json
+import threading
+
 import numpy as np
 import plotly.graph_objects as go
-from dash import html, dcc
+from dash import Patch, html, dcc
+
+from .alerts import compile_ranges, zone_indices
+from .dial import DIAL_EXTENT, dial_source
+from .history import RollingWindow
+from .layer_cache import placeholder_figure, static_layers_hash, touch_static_layers
+from .template import TEMPLATE_NAME
+from .ticks import tick_layout
+
+
+# Gauge options that change the dial, i.e. what _add_dial_traces draws
+_DIAL_OPTIONS = ('min_value', 'max_value', 'color_ranges', 'start_angle', 'end_angle', 'gauge_thickness',
+                 'value_font_family', 'tick_font_size', 'tick_font_color', 'tick_label_radius', 'tick_count')
 
 
 class Gauge(html.Div):
@@ -12,10 +27,13 @@ class Gauge(html.Div):
 
     Parameters
     ----------
-    id : str
+    id : str or dict
         The ID of this component, used to identify dash components in callbacks
-    value : float
-        The value to display on the gauge
+        The graph inside has the ID ``f"{id}-graph"``, or ``{**id, 'subcomponent': 'graph'}`` for
+        pattern-matching dict IDs (see ``Gauge.graph_id``)
+    value : float or sequence of float
+        The value to display on the gauge, or one value per needle to show several needles (e.g. current, target
+        and last week); the value text shows the first one
     min_value : float, optional
         The minimum value of the gauge (default 0)
     max_value : float, optional
@@ -28,10 +46,12 @@ class Gauge(html.Div):
         A list of dictionaries defining color ranges for the gauge
         Each dict should have 'min', 'max', and 'color' keys
         Example: [{'min': 0, 'max': 50, 'color': '#FF0000'}, {'min': 50, 'max': 100, 'color': '#00FF00'}]
-    needle_color : str, optional
-        The color of the needle (default '#000000')
-    needle_thickness : float, optional
-        The thickness of the needle as a percentage of the gauge radius (default 2.0)
+    needle_color : str or sequence of str, optional
+        The color of the needle, or one color per needle (default '#000000')
+    needle_thickness : float or sequence of float, optional
+        The thickness of the needle as a percentage of the gauge radius, or one per needle (default 8.0)
+    needle_length : float or sequence of float, optional
+        The length of the needle as a fraction of the gauge radius, or one per needle (default 0.85)
     show_value : bool, optional
         Whether to display the value as text (default True)
     start_angle : float, optional
@@ -57,6 +77,34 @@ class Gauge(html.Div):
         Color for the tick labels (default "rgba(0,0,0,0.7)")
     tick_label_radius : float, optional
         Shows the distance from the center of the gauge to the tick labels as a fraction of the radius (default 1.1)
+    tick_count : int, optional
+        Number of major ticks to aim for; ticks are put on round numbers within the range, e.g. every 20
+        from 0 to 100, so the actual count may differ slightly. Both ends of the range are always
+        labelled (default 6)
+    show_history : bool, optional
+        Whether to draw a band between the min and max of the recent values, with a marker at their mean (default False)
+    history_window : int, optional
+        Number of most recent values the history band covers (default 60)
+    history_color : str, optional
+        Color of the history band (default "rgba(31,119,180,0.3)")
+    read_only : bool, optional
+        Whether the gauge is only displayed, e.g. on wallboards (default False)
+        Read-only gauges are static plots, so plotly.js builds no hover, drag or selection layers; they
+        resize with their container like interactive gauges
+    dial_image : bool or str, optional
+        Whether to draw the dial (background disc, color arcs, ticks and labels) as one pre-rendered SVG
+        image, leaving only the needles and the value text as geometry (default False)
+        True embeds the image in the figure as a data URI; a URL prefix, such as the one returned by
+        ``serve_dials(app)``, links to it instead, so browsers cache it across gauges and page loads.
+        The image is drawn for a 300px wide gauge and scales with the gauge as a whole.
+    cache_static_layers : bool, optional
+        Whether browsers keep the static layers of the figure (dial, ticks and labels) across page loads,
+        so that the page only carries the needles and the value text (default False)
+        The gauge then sends its static layers as a content hash next to the graph, in a store with the ID
+        ``Gauge.layers_id(id)``; register the gauges with ``serve_static_layers(app, gauges)``.
+    figure : plotly.graph_objects.Figure or dict, optional
+        A prebuilt figure for this gauge, used instead of rendering one (default None)
+        Used by build_gauges_parallel to hand over figures rendered in worker threads or processes
     """
 
     def __init__(
@@ -70,6 +118,7 @@ class Gauge(html.Div):
             color_ranges=None,
             needle_color='#000000',
             needle_thickness=8.0,
+            needle_length=0.85,  # Length of the needle as a fraction of the gauge radius
             show_value=True,
             start_angle=225,  # Start from the bottom left (225 degrees)
             end_angle=-45,  # End at bottom right (-45 degrees)
@@ -84,12 +133,23 @@ class Gauge(html.Div):
             tick_font_size=10,  # Font size for the tick labels
             tick_font_color="rgba(0,0,0,0.7)",  # Color for the tick labels
             tick_label_radius=1.1,
+            tick_count=6,  # Number of major ticks to aim for
+
+            show_history=False,  # Draw the rolling min/max band and mean marker
+            history_window=60,  # Number of recent values in the band
+            history_color="rgba(31,119,180,0.3)",  # Color of the band
+            read_only=False,  # Display only, e.g. on wallboards
+            dial_image=False,  # Draw the dial as one pre-rendered image
+            cache_static_layers=False,  # Let browsers keep the static layers across page loads
+            figure=None,
             **kwargs
     ):
+        if not min_value < max_value:
+            raise ValueError(f"min_value ({min_value}) must be less than max_value ({max_value})")
         self.id = id
         self.min_value = min_value
         self.max_value = max_value
-        self._value = self._validate_value(value)
+        self._state = (self._validate_value(value), None)  # The value and history band, swapped as one
         self.width = width
         self.height = height
         self.color_ranges = color_ranges or [
@@ -97,6 +157,10 @@ class Gauge(html.Div):
         ]
         self.needle_color = needle_color
         self.needle_thickness = needle_thickness
+        self.needle_length = needle_length
+        for option in ('needle_color', 'needle_thickness', 'needle_length'):
+            if isinstance(getattr(self, option), (list, tuple)) and len(getattr(self, option)) != self.needle_count:
+                raise ValueError(f"{option} must have one item per needle")
         self.show_value = show_value
         self.start_angle = start_angle
         self.end_angle = end_angle
@@ -111,28 +175,40 @@ class Gauge(html.Div):
         self.tick_font_size = tick_font_size
         self.tick_font_color = tick_font_color
         self.tick_label_radius = tick_label_radius
-
-        # Create the gauge figure
-        fig = self._create_gauge_figure()
+        self.tick_count = tick_count
+
+        self.show_history = show_history
+        self.history_window = history_window
+        self.history_color = history_color
+        self.read_only = read_only
+        self.dial_image = dial_image
+        self.cache_static_layers = cache_static_layers
+        self.history = RollingWindow(history_window) if show_history else None
+        self._state = (self.value, self._record_history(self.value))
+        self._lock = threading.RLock()  # Serializes value changes, so the figure follows the last value set
+        self._static_layers = None  # The static layers of the displayed figure as a dict, split off it on first use
+        self._layers_hash = None  # The static layers and their content hash, for cache_static_layers
+
+        # Create the gauge figure, unless a prebuilt one was handed over
+        fig = figure if figure is not None else self._create_gauge_figure()
+        if cache_static_layers and not isinstance(fig, dict):
+            fig = fig.to_dict()  # Split into its layers on every serialization
 
         # Create a responsive container for the gauge
         super().__init__(
             id=id,
             children=[
                 dcc.Graph(
-                    id=f"{id}-graph",
+                    id=self.graph_id(id),
                     figure=fig,
-                    config={
-                        'displayModeBar': False,
-                        'responsive': True,  # Ensure the graph is responsive
-                    },
+                    config=self._graph_config(),
                     style={
                         'width': width,
                         'height': height,
                         'min-width': '100px',  # Minimum width to prevent too small rendering
                         'min-height': '100px',  # Minimum height to prevent too small rendering
                     },
-                    responsive=True,
+                    responsive=True,  # Resize with the container, read-only or not
                 )
             ],
             style={
@@ -146,8 +222,36 @@ class Gauge(html.Div):
             **kwargs
         )
 
+    def __getstate__(self):
+        """Get the state to pickle or deep-copy, without the lock, which cannot be copied."""
+        state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled or deep-copied gauge, with a lock of its own."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _graph_config(self):
+        """Get the plotly.js config of the gauge's graph."""
+        if self.read_only:
+            return {
+                'staticPlot': True,  # No hover, drag or selection layers
+                'displayModeBar': False,
+                'responsive': True,
+            }
+        return {
+            'displayModeBar': False,
+            'responsive': True,  # Ensure the graph is responsive
+        }
+
     def _validate_value(self, value):
-        """Validate and clamp the value to be within min_value and max_value."""
+        """Validate and clamp the value (or each value of a sequence) to be within min_value and max_value."""
+        if np.ndim(value) > 0:
+            if len(value) == 0:
+                raise ValueError("value must have at least one item")
+            return [self._validate_value(item) for item in value]
         if value < self.min_value:
             return self.min_value
         elif value > self.max_value:
@@ -156,26 +260,405 @@ class Gauge(html.Div):
 
     @property
     def value(self):
-        """Get the current value."""
-        return self._value
+        """Get the current value, a list with one value per needle for gauges with several needles."""
+        return self._state[0]
+
+    @property
+    def needle_count(self):
+        """Get the number of needles of the gauge."""
+        return len(_as_list(self.value))
+
+    def _needle_values(self):
+        """Get the values the needles point at, as a list."""
+        return _as_list(self.value)
+
+    def _per_needle(self, option, count=None):
+        """Get an option that is either shared by all needles or given per needle, as a list with one item per needle."""
+        if isinstance(option, (list, tuple)):
+            return list(option)
+        return [option] * (self.needle_count if count is None else count)
 
     @value.setter
     def value(self, new_value):
-        """Set the value, ensuring it's within the valid range."""
-        self._value = self._validate_value(new_value)
+        """Set the value, ensuring it's within the valid range, record it in the history and refresh the figure."""
+        self._set_value(new_value)
+
+    def _set_value(self, new_value):
+        """
+        Set the value and swap in the refreshed figure, returning the new dynamic layers as a dict.
+
+        ``new_value`` may be a dict of needle index to value, merged into the current values.
+        The number of needles is fixed: a value for another number of needles, or a needle index
+        out of range, raises ``ValueError``.
+        The history records the first needle's value when the change sets it, after the figure rendered.
+        Value changes of a gauge are serialized, so its history and displayed figure always follow
+        the last value set, while renders in other threads read the previous or the new state whole.
+        """
+        with self._lock:
+            sets_first_needle = not isinstance(new_value, dict) or 0 in new_value
+            if isinstance(new_value, dict):
+                values = list(self._needle_values())
+                for i, needle_value in new_value.items():
+                    if not isinstance(i, (int, np.integer)) or not 0 <= i < len(values):
+                        raise ValueError(f"Needle index {i!r} is out of range for a gauge with {len(values)} needles")
+                    values[i] = needle_value
+                new_value = values if isinstance(self.value, list) else values[0]
+            value = self._validate_value(new_value)
+            if isinstance(value, list) != isinstance(self.value, list) or len(_as_list(value)) != self.needle_count:
+                raise ValueError(f"value must have one item per needle, the gauge has {self.needle_count}"
+                                 if isinstance(self.value, list) else "value must be a number for a single-needle gauge")
+            static = self._static_layers_dict()
+            history_stats = self._state[1]
+            if self.history is not None and sets_first_needle:
+                history_stats = self.history.stats_with(_as_list(value)[0])
+            state = (value, history_stats)
+            dynamic = self._dynamic_layers_dict(state)
+            # Record the value only once the figure rendered, so a failed change leaves the history as it was
+            if history_stats is not self._state[1]:
+                self.history.append(_as_list(value)[0])
+            self._state = state
+            self.children[0].figure = _compose_figure(static, dynamic)
+        return dynamic
+
+    def _record_history(self, value):
+        """Record the first needle's value in the history, returning the (min, max, mean) of the band, if any."""
+        if self.history is None:
+            return None
+        self.history.append(_as_list(value)[0])
+        return self.history.min, self.history.max, self.history.mean
+
+    def render(self, value=None):
+        """
+        Render the figure of the gauge, without changing the gauge.
+
+        Rendering is a pure function of the gauge's options and the value: the value and the
+        history band are read as one snapshot, so gauges can be rendered from several threads,
+        including while other threads set their value.
+
+        Parameters
+        ----------
+        value : float or sequence of float, optional
+            The value to render (default None, the current value); the history band is drawn as it is
+
+        Returns
+        -------
+        dict
+            The figure, for the gauge's graph
+        """
+        current, history_stats = self._state
+        state = (current if value is None else self._validate_value(value), history_stats)
+        return _compose_figure(self._static_layers_dict(), self._dynamic_layers_dict(state))
+
+    @staticmethod
+    def graph_id(id):
+        """Get the ID of the graph inside the gauge with the given ID, e.g. for callback outputs."""
+        if isinstance(id, dict):
+            return {**id, 'subcomponent': 'graph'}
+        return f"{id}-graph"
+
+    @staticmethod
+    def layers_id(id):
+        """Get the ID of the store of a gauge with ``cache_static_layers``, holding the hash of its static layers."""
+        if isinstance(id, dict):
+            return {**id, 'subcomponent': 'layers'}
+        return f"{id}-layers"
+
+    def to_plotly_json(self):
+        """
+        Serialize the gauge for the page.
+
+        A dial image served by URL is registered again, in case it was dropped from the bounded cache.
+
+        With ``cache_static_layers``, the graph gets the figure with stubs for its static traces, and a
+        store next to it the content hash of the static layers, for the browser to compose the figure.
+        """
+        if isinstance(self.dial_image, str):
+            self._dial_image()  # Keep serving the dial the page will request, drawing it again if it was dropped
+        as_json = super().to_plotly_json()
+        if not self.cache_static_layers:
+            return as_json
+        with self._lock:
+            static = self._static_layers_dict()
+            figure = self.children[0].figure
+        if not isinstance(figure, dict):
+            figure = figure.to_dict()
+        graph = self.children[0].to_plotly_json()
+        graph['props'] = {**graph['props'], 'figure': placeholder_figure(static, figure)}
+        store = dcc.Store(id=self.layers_id(self.id), data={'hash': self._static_layers_hash()})
+        as_json['props'] = {**as_json['props'], 'children': [graph, store] + list(self.children[1:])}
+        return as_json
+
+    def _static_layers_hash(self):
+        """Get the content hash of the static layers, registering them to be served if they are not (anymore)."""
+        static = self._static_layers_dict()
+        layers_hash = self._layers_hash
+        if layers_hash is None or layers_hash[0] is not static or not touch_static_layers(layers_hash[1]):
+            layers_hash = self._layers_hash = (static, static_layers_hash(static))
+        return layers_hash[1]
+
+    def needle_patch(self, value):
+        """
+        Set the value and compute the update of the displayed figure that moves the needles to it.
+
+        Parameters
+        ----------
+        value : float, sequence of float or dict
+            The new value, one value per needle, or a dict of needle index to value to move only
+            some of the needles of a gauge with several needles; raises ``ValueError`` for another
+            number of needles or a needle index out of range
+
+        Returns
+        -------
+        dash.Patch
+            A patch to return to the ``figure`` output of the gauge's graph, assigning only the
+            coordinates of the moved needles, the value text and, with ``show_history``, the history band
+        """
+        dynamic = self._set_value(value)
+        moved = sorted(value) if isinstance(value, dict) else range(self.needle_count)
+        trace_offset = len(self._static_layers['data'])
+        annotation_offset = len(self._static_layers['layout'].get('annotations', []))
+
+        # The history band and mean marker come first, then the needles; the center dot does not move
+        patch = Patch()
+        history_traces = 2 if self.show_history else 0
+        for i in list(range(history_traces)) + [history_traces + needle for needle in moved]:
+            patch['data'][trace_offset + i]['x'] = list(dynamic['data'][i]['x'])
+            patch['data'][trace_offset + i]['y'] = list(dynamic['data'][i]['y'])
+        if self.show_value and 0 in moved:
+            value_annotation = dynamic['layout']['annotations'][0]
+            patch['layout']['annotations'][annotation_offset]['text'] = value_annotation['text']
+            patch['layout']['annotations'][annotation_offset]['font']['color'] = value_annotation['font']['color']
+        return patch
+
+    def _static_layers_dict(self):
+        """Get the static layers of the displayed figure as a dict, splitting them off it on first use."""
+        with self._lock:
+            if self._static_layers is None:
+                figure = self.children[0].figure
+                if not isinstance(figure, dict):
+                    figure = figure.to_dict()
+                dynamic_traces = (2 if self.show_history else 0) + self.needle_count + 1  # With the center dot
+                dynamic_annotations = 1 if self.show_value else 0
+                layout = dict(figure['layout'])
+                annotations = layout.get('annotations', [])
+                if annotations:
+                    layout['annotations'] = annotations[:len(annotations) - dynamic_annotations]
+                self._static_layers = {'data': figure['data'][:len(figure['data']) - dynamic_traces], 'layout': layout}
+            return self._static_layers
+
+    def _dynamic_layers_dict(self, state):
+        """Render the layers that depend on the value and history band of ``state`` as a figure dict."""
+        fig = go.Figure()
+        self._add_dynamic_layers(fig, state)
+        return fig.to_dict()
+
+    @staticmethod
+    def diff(old_spec, new_spec):
+        """
+        Compute the minimal update from the figure of one gauge configuration to another.
+
+        Parameters
+        ----------
+        old_spec : dict
+            The keyword arguments of the gauge as currently displayed
+        new_spec : dict
+            The keyword arguments of the gauge as it should be displayed
+
+        Returns
+        -------
+        dash.Patch
+            A patch to return to the ``figure`` output of the gauge's graph, assigning only the
+            trace properties, annotations and layout keys that differ (e.g. only the colors of
+            recolored arcs)
+        """
+        patch = Patch()
+        _diff_into(patch, Gauge._figure_dict(old_spec), Gauge._figure_dict(new_spec))
+        return patch
+
+    @staticmethod
+    def _figure_dict(spec):
+        """Render the figure of a gauge spec as a plain dict."""
+        figure = Gauge(**{'id': 'gauge', **spec}).children[0].figure
+        return figure if isinstance(figure, dict) else figure.to_dict()
+
+    def replay(self, values, timestamps=None, frame_duration=50, max_slider_steps=100):
+        """
+        Create a figure animating the gauge over a history of values, e.g. to review an incident.
+
+        The dial is sent once; each animation frame only carries the needle and the value text.
+        All needles and labels are computed up front in one vectorized pass. Gauges with several
+        needles replay the history with their first needle.
+
+        Parameters
+        ----------
+        values : sequence of float
+            The history of values, oldest first
+        timestamps : sequence, optional
+            The time of each value, shown on the playback slider (default None, the sample numbers)
+        frame_duration : int, optional
+            Milliseconds each value is shown for during playback (default 50)
+        max_slider_steps : int, optional
+            Maximum number of slider steps, spread evenly over the history; long histories keep
+            every frame for playback but a lighter slider (default 100)
+
+        Returns
+        -------
+        dict
+            The figure, with play/pause buttons and a slider, for the gauge's graph
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1 or len(values) == 0:
+            raise ValueError("values must be a non-empty sequence of numbers")
+        timestamps = list(range(len(values)) if timestamps is None else timestamps)
+        if len(timestamps) != len(values):
+            raise ValueError("timestamps must have the same length as values")
+
+        values = np.clip(values, self.min_value, self.max_value)
+        color, thickness, length = (self._per_needle(option)[0] for option in
+                                    (self.needle_color, self.needle_thickness, self.needle_length))
+        x_needles, y_needles = self._needle_polygons(values, thickness, length)
+        x_needles, y_needles = x_needles.tolist(), y_needles.tolist()
+
+        fig = self._create_static_figure()
+        needle_index = len(fig.data)
+        self._add_needle_trace(fig, x_needles[0], y_needles[0], color)
+        self._add_center_dot(fig)
+        frame_data = [[{'x': x, 'y': y}] for x, y in zip(x_needles, y_needles)]
+        frame_traces = [needle_index]
 
-    def _create_gauge_figure(self):
-        """Create the gauge figure using Plotly."""
-        # Convert angles from degrees to radians
-        start_angle_rad = np.radians(self.start_angle)
-        end_angle_rad = np.radians(self.end_angle)
+        if self.show_value:
+            # Frames can only replace whole annotation lists, so the value text is a text trace here
+            labels = [self.value_format.format(value) for value in values.tolist()]
+            if self.value_font_color == "auto":
+                colors = self._value_colors(values)
+            else:
+                colors = [self.value_font_color] * len(values)
+            frame_traces.append(len(fig.data))
+            fig.add_trace(go.Scatter(
+                x=[0],
+                y=[-0.6],
+                mode='text',
+                text=[labels[0]],
+                textposition='middle center',
+                textfont=dict(
+                    size=self.value_font_size,
+                    color=colors[0],
+                    family=self.value_font_family,
+                    weight=self.value_font_weight,
+                ),
+            ))
+            for data, label, color in zip(frame_data, labels, colors):
+                data.append({'text': [label], 'textfont': {'color': color}})
+
+        names = [str(i) for i in range(len(values))]
+
+        def animate(frames, duration):
+            return [frames, dict(mode='immediate', frame=dict(duration=duration, redraw=False),
+                                 transition=dict(duration=0), fromcurrent=True)]
 
-        # Calculate the angle for the current value
-        value_normalized = (self.value - self.min_value) / (self.max_value - self.min_value)
-        value_angle_rad = start_angle_rad + value_normalized * (end_angle_rad - start_angle_rad)
+        steps = np.unique(np.linspace(0, len(values) - 1, min(len(values), max_slider_steps)).round().astype(int))
+        fig.update_layout(
+            updatemenus=[dict(
+                type='buttons',
+                direction='left',
+                x=0,
+                y=0,
+                xanchor='left',
+                yanchor='top',
+                pad=dict(t=10, r=10),
+                showactive=False,
+                buttons=[
+                    dict(label='Play', method='animate', args=animate(None, frame_duration)),
+                    dict(label='Pause', method='animate', args=animate([None], 0)),
+                ],
+            )],
+            sliders=[dict(
+                x=0.2,
+                y=0,
+                len=0.8,
+                xanchor='left',
+                yanchor='top',
+                pad=dict(t=10),
+                currentvalue=dict(visible=True, prefix=''),
+                steps=[dict(label=str(timestamps[i]), method='animate', args=animate([names[i]], 0))
+                       for i in steps.tolist()],
+            )],
+            margin=dict(b=80),  # Room for the playback controls
+        )
+
+        # Frames are added as plain dicts, validating thousands of go.Frame objects would take seconds
+        figure = fig.to_dict()
+        figure['frames'] = [
+            {'name': name, 'data': data, 'traces': frame_traces}
+            for name, data in zip(names, frame_data)
+        ]
+        return figure
+
+    def _create_gauge_figure(self, state=None):
+        """Create the gauge figure using Plotly, for ``state`` (default None, the current value and history band)."""
+        fig = self._create_static_figure()
+        self._add_dynamic_layers(fig, state)
+        return fig
 
+    def _create_static_figure(self):
+        """Create the static layers of the gauge figure: the dial, its ticks and labels, and the layout."""
         # Create the base figure
         fig = go.Figure()
+        if self.dial_image:
+            fig.add_layout_image(self._dial_image())
+        else:
+            self._add_dial_traces(fig)
+
+        # Configure the layout for a clean gauge appearance
+        # The margins, backgrounds and hidden axes come from the shared gauge template
+        fig.update_layout(
+            template=TEMPLATE_NAME,
+            xaxis=dict(
+                range=[-1.3, 1.3],  # Slightly larger range to accommodate labels
+                scaleanchor="y",  # This ensures x and y have the same scale
+                scaleratio=1,  # 1:1 aspect ratio
+                constrain='domain',  # Constrain the axis to maintain aspect ratio
+            ),
+            yaxis=dict(
+                range=[-1.3, 1.3],  # Slightly larger range to accommodate labels
+                constrain='domain',  # Constrain the axis to maintain aspect ratio
+            ),
+            width=None,  # Let the container determine the width
+            height=None,  # Let the container determine the height
+            uirevision='true',  # Maintain state when resizing
+        )
+
+        return fig
+
+    def _dial_image(self):
+        """Get the layout image showing the pre-rendered dial, drawn once per distinct dial."""
+        options = {option: getattr(self, option) for option in _DIAL_OPTIONS}
+        key = json.dumps(options, sort_keys=True, default=repr)
+
+        def render_traces():
+            fig = go.Figure()
+            self._add_dial_traces(fig)
+            return fig.to_dict()['data']
+
+        return dict(
+            source=dial_source(key, render_traces, self.dial_image),
+            xref='x',
+            yref='y',
+            x=-DIAL_EXTENT,
+            y=DIAL_EXTENT,
+            sizex=2 * DIAL_EXTENT,
+            sizey=2 * DIAL_EXTENT,
+            xanchor='left',
+            yanchor='top',
+            sizing='stretch',
+            layer='below',
+        )
+
+    def _add_dial_traces(self, fig):
+        """Add the dial as geometry: the background disc, the color arcs, and the ticks and their labels."""
+        # Convert angles from degrees to radians
+        start_angle_rad = np.radians(self.start_angle)
+        end_angle_rad = np.radians(self.end_angle)
 
         # Add a background circle for better aesthetics - use more points for smoother circle
         theta_circle = np.linspace(0, 2 * np.pi, 500)  # Increased from 300 to 500 points for smoother circle
@@ -192,8 +675,6 @@ class Gauge(html.Div):
             ),
             fill='toself',
             fillcolor='rgba(200,200,200,0.1)',
-            hoverinfo='skip',
-            showlegend=False,
         ))
 
         # Add the gauge background as arcs (not filled)
@@ -230,50 +711,38 @@ class Gauge(html.Div):
                     shape='spline',  # Use spline interpolation for smoother curves
                     smoothing=1.3,  # Increase the smoothing factor for even smoother curves
                 ),
-                hoverinfo='skip',
-                showlegend=False,
             ))
 
-        # Add major tick marks and labels
-        num_major_ticks = 6
-        major_tick_values = np.linspace(self.min_value, self.max_value, num_major_ticks)
-        major_tick_angles = np.linspace(start_angle_rad, end_angle_rad, num_major_ticks)
+        # Ticks are shared by all gauges with the same scale
+        ticks = tick_layout(self.min_value, self.max_value, self.start_angle, self.end_angle, self.tick_count)
 
         # Add minor tick marks
-        num_minor_ticks = 5  # Number of minor ticks between major ticks
-        for i in range(num_major_ticks - 1):
-            # Calculate angles for minor ticks between major ticks
-            minor_angles = np.linspace(major_tick_angles[i], major_tick_angles[i + 1], num_minor_ticks + 2)[1:-1]
-
-            # Add minor tick marks
-            for angle in minor_angles:
-                # Outer radius for minor ticks
-                r_outer_minor = 1.0
-                # Inner radius for minor ticks
-                r_inner_minor = 0.95
-
-                x_tick = [r_inner_minor * np.cos(angle), r_outer_minor * np.cos(angle)]
-                y_tick = [r_inner_minor * np.sin(angle), r_outer_minor * np.sin(angle)]
-
-                fig.add_trace(go.Scatter(
-                    x=x_tick,
-                    y=y_tick,
-                    mode='lines',
-                    line=dict(
-                        color='rgba(0,0,0,0.3)',
-                        width=1,
-                    ),
-                    hoverinfo='skip',
-                    showlegend=False,
-                ))
+        for angle in ticks.minor_angles:
+            # Outer radius for minor ticks
+            r_outer_minor = 1.0
+            # Inner radius for minor ticks
+            r_inner_minor = 0.95
+
+            x_tick = [r_inner_minor * np.cos(angle), r_outer_minor * np.cos(angle)]
+            y_tick = [r_inner_minor * np.sin(angle), r_outer_minor * np.sin(angle)]
+
+            fig.add_trace(go.Scatter(
+                x=x_tick,
+                y=y_tick,
+                mode='lines',
+                line=dict(
+                    color='rgba(0,0,0,0.3)',
+                    width=1,
+                ),
+            ))
 
         # Outer radius for major ticks
         r_outer = 1.0
         # Inner radius for major ticks
         r_inner = 0.9
 
-        # Add major tick marks and labels
-        for i, angle in enumerate(major_tick_angles):
+        # Add major tick marks
+        for angle in ticks.major_angles:
             x_tick = [r_inner * np.cos(angle), r_outer * np.cos(angle)]
             y_tick = [r_inner * np.sin(angle), r_outer * np.sin(angle)]
 
@@ -285,91 +754,158 @@ class Gauge(html.Div):
                     color='rgba(0,0,0,0.7)',
                     width=2,
                 ),
-                hoverinfo='skip',
-                showlegend=False,
             ))
 
-            # Add tick labels
-            fig.add_annotation(
-                x=self.tick_label_radius * np.cos(angle),
-                y=self.tick_label_radius * np.sin(angle),
-                text=f"{major_tick_values[i]:.0f}",
-                showarrow=False,
-                font=dict(
-                    size=self.tick_font_size,
-                    color=self.tick_font_color,
-                    family=self.value_font_family
-                ),
-            )
+        # Add the tick labels, all in one text trace as annotations are costly to lay out on resize
+        major_angles = np.asarray(ticks.major_angles)
+        fig.add_trace(go.Scatter(
+            x=(self.tick_label_radius * np.cos(major_angles)).tolist(),
+            y=(self.tick_label_radius * np.sin(major_angles)).tolist(),
+            mode='text',
+            text=list(ticks.labels),
+            textposition='middle center',
+            textfont=dict(
+                size=self.tick_font_size,
+                color=self.tick_font_color,
+                family=self.value_font_family
+            ),
+            cliponaxis=False,  # Like annotations, labels may overflow the axes
+        ))
 
-        # Add the needle with a triangular shape
-        needle_length = 0.85  # Length of the needle as a fraction of the gauge radius
-        needle_width = self.needle_thickness * 0.02  # Width of the needle base
+    def _value_angles(self, values):
+        """Compute the angles, in radians, at which the gauge shows many values."""
+        values = np.clip(np.asarray(values, dtype=float), self.min_value, self.max_value)
+        start_angle_rad = np.radians(self.start_angle)
+        end_angle_rad = np.radians(self.end_angle)
+
+        value_normalized = (values - self.min_value) / (self.max_value - self.min_value)
+        return start_angle_rad + value_normalized * (end_angle_rad - start_angle_rad)
 
-        # Calculate needle points for a triangular shape
-        needle_tip_x = needle_length * np.cos(value_angle_rad)
-        needle_tip_y = needle_length * np.sin(value_angle_rad)
+    def _needle_polygons(self, values, needle_thickness, needle_length):
+        """
+        Compute the triangular needles pointing at many values in one vectorized pass.
 
-        # Calculate the perpendicular angle for the base of the needle
+        ``needle_thickness`` and ``needle_length`` are either shared by all needles or given per value.
+        Returns the x and y coordinates of the closed needle polygons, as two arrays of shape (len(values), 4).
+        """
+        value_angle_rad = self._value_angles(values)
+        needle_length = np.asarray(needle_length, dtype=float)
+        needle_width = np.asarray(needle_thickness, dtype=float) * 0.02  # Width of the needle base
+
+        # Calculate needle tips, and base points on the perpendicular to the needle
+        tip_x = needle_length * np.cos(value_angle_rad)
+        tip_y = needle_length * np.sin(value_angle_rad)
         perp_angle = value_angle_rad + np.pi / 2
+        base_x = needle_width * np.cos(perp_angle)
+        base_y = needle_width * np.sin(perp_angle)
+
+        x = np.stack([base_x, tip_x, -base_x, base_x], axis=-1)
+        y = np.stack([base_y, tip_y, -base_y, base_y], axis=-1)
+        return x, y
 
-        # Calculate base points of the needle
-        base_x1 = needle_width * np.cos(perp_angle)
-        base_y1 = needle_width * np.sin(perp_angle)
-        base_x2 = -needle_width * np.cos(perp_angle)
-        base_y2 = -needle_width * np.sin(perp_angle)
+    def _value_colors(self, values):
+        """Get the color of the first color range containing each value, for value_font_color="auto"."""
+        zones = zone_indices(values, compile_ranges(self.color_ranges))
 
-        # Create the needle shape
-        x_needle = [base_x1, needle_tip_x, base_x2, base_x1]
-        y_needle = [base_y1, needle_tip_y, base_y2, base_y1]
+        # if couldn't find the color, then, raise an exception
+        if (zones < 0).any():
+            raise ValueError("value_font_color must be specified if value is outside of color_ranges")
+        return [self.color_ranges[zone]['color'] for zone in zones.tolist()]
 
-        # Add the needle
+    def _add_needle_trace(self, fig, x_needle, y_needle, color):
+        """Add a needle with the given polygon and color."""
         fig.add_trace(go.Scatter(
             x=x_needle,
             y=y_needle,
             mode='lines',
             line=dict(
-                color=self.needle_color,
+                color=color,
                 width=1,
             ),
             fill='toself',
-            fillcolor=self.needle_color,
-            hoverinfo='skip',
-            showlegend=False,
+            fillcolor=color,
         ))
 
-        # Add a center dot for the needle
+    def _add_center_dot(self, fig):
+        """Add the center dot of the needles, in the style of the first needle."""
         fig.add_trace(go.Scatter(
             x=[0],
             y=[0],
             mode='markers',
             marker=dict(
-                color=self.needle_color,
-                size=self.needle_thickness * 5,  # Multiply by 5 for better visibility
+                color=self._per_needle(self.needle_color)[0],
+                size=self._per_needle(self.needle_thickness)[0] * 5,  # Multiply by 5 for better visibility
                 line=dict(
                     color='rgba(255,255,255,0.8)',
                     width=1,
                 ),
             ),
-            hoverinfo='skip',
-            showlegend=False,
         ))
 
+    def _add_history_traces(self, fig, history_stats):
+        """Add the band between the min and max of the recent values, and the marker at their mean."""
+        r_inner, r_outer = 0.72, 0.84  # Inside the ticks, just within the background circle
+        min_angle, max_angle, mean_angle = self._value_angles(history_stats)
+
+        # A fixed number of points, so drawing and patching the band costs the same whatever the window
+        theta = np.linspace(min_angle, max_angle, 50)
+        x_band = np.concatenate([r_outer * np.cos(theta), r_inner * np.cos(theta[::-1]), [r_outer * np.cos(theta[0])]])
+        y_band = np.concatenate([r_outer * np.sin(theta), r_inner * np.sin(theta[::-1]), [r_outer * np.sin(theta[0])]])
+
+        fig.add_trace(go.Scatter(
+            x=x_band.tolist(),
+            y=y_band.tolist(),
+            mode='lines',
+            line=dict(
+                color=self.history_color,
+                width=1,
+            ),
+            fill='toself',
+            fillcolor=self.history_color,
+        ))
+
+        fig.add_trace(go.Scatter(
+            x=[r_inner * np.cos(mean_angle), r_outer * np.cos(mean_angle)],
+            y=[r_inner * np.sin(mean_angle), r_outer * np.sin(mean_angle)],
+            mode='lines',
+            line=dict(
+                color='rgba(0,0,0,0.6)',
+                width=2,
+            ),
+        ))
+
+    def _add_dynamic_layers(self, fig, state=None):
+        """
+        Add the layers that depend on the value: the history band, the needle and the value text.
+
+        ``state`` is the ``(value, history band)`` to draw (default None, the current ones); the gauge
+        itself is only read, so figures for any value can be rendered concurrently.
+        """
+        value, history_stats = self._state if state is None else state
+        values = _as_list(value)
+        if self.show_history:
+            self._add_history_traces(fig, history_stats)
+
+        # Add the needles with a triangular shape, each in its own trace as a fill has a single color
+        x_needles, y_needles = self._needle_polygons(
+            values, self._per_needle(self.needle_thickness, len(values)), self._per_needle(self.needle_length, len(values)))
+        for x_needle, y_needle, color in zip(x_needles.tolist(), y_needles.tolist(),
+                                             self._per_needle(self.needle_color, len(values))):
+            self._add_needle_trace(fig, x_needle, y_needle, color)
+
+        # Add a center dot for the needles
+        self._add_center_dot(fig)
+
         # Add the value text if requested
         if self.show_value:
             # Use a responsive font size that scales with the gauge
             # This ensures the text is always proportional to the gauge size
             # Format the value using the provided format string
-            formatted_value = self.value_format.format(self.value)
-            if self.value_font_color == "auto":
-                for color_data in self.color_ranges:
-                    if color_data['min'] <= self.value <= color_data['max']:
-                        self.value_font_color = color_data['color']
-                        break
-
-                # if still couldn't find the color, then, raise an exception
-                if self.value_font_color == "auto":
-                    raise ValueError("value_font_color must be specified if value is outside of color_ranges")
+            value = values[0]
+            formatted_value = self.value_format.format(value)
+            value_font_color = self.value_font_color
+            if value_font_color == "auto":
+                value_font_color = self._value_colors([value])[0]
 
             fig.add_annotation(
                 x=0,
@@ -378,7 +914,7 @@ class Gauge(html.Div):
                 showarrow=False,
                 font=dict(
                     size=self.value_font_size,  # Base size that will be scaled by the container
-                    color=self.value_font_color,  # Use the provided font color
+                    color=value_font_color,  # Use the provided font color
                     family=self.value_font_family,  # Use the provided font family
                     weight=self.value_font_weight,
                 ),
@@ -386,33 +922,41 @@ class Gauge(html.Div):
                 yanchor='middle',
             )
 
-        # Configure the layout for a clean gauge appearance
-        fig.update_layout(
-            margin=dict(l=20, r=20, t=20, b=20),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                range=[-1.3, 1.3],  # Slightly larger range to accommodate labels
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-                fixedrange=True,
-                scaleanchor="y",  # This ensures x and y have the same scale
-                scaleratio=1,  # 1:1 aspect ratio
-                constrain='domain',  # Constrain the axis to maintain aspect ratio
-            ),
-            yaxis=dict(
-                range=[-1.3, 1.3],  # Slightly larger range to accommodate labels
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-                fixedrange=True,
-                constrain='domain',  # Constrain the axis to maintain aspect ratio
-            ),
-            autosize=True,  # Allow the figure to be resized automatically
-            width=None,  # Let the container determine the width
-            height=None,  # Let the container determine the height
-            uirevision='true',  # Maintain state when resizing
-        )
 
-        return fig
+def _as_list(value):
+    """Get a value as a list with one value per needle."""
+    return value if isinstance(value, list) else [value]
+
+
+def _compose_figure(static, dynamic):
+    """Stack the dynamic layers of a gauge on its static layers, both as figure dicts."""
+    layout = dict(static['layout'])
+    annotations = layout.get('annotations', []) + dynamic['layout'].get('annotations', [])
+    if annotations:
+        layout['annotations'] = annotations
+    return {'data': static['data'] + dynamic['data'], 'layout': layout}
+
+
+def _diff_into(patch, old, new):
+    """Record in ``patch`` the operations turning the figure dict ``old`` into ``new``."""
+    for key, new_value in new.items():
+        if key not in old:
+            patch[key] = new_value
+            continue
+        old_value = old[key]
+        if old_value == new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _diff_into(patch[key], old_value, new_value)
+        elif (isinstance(old_value, list) and isinstance(new_value, list) and len(old_value) == len(new_value)
+              and all(isinstance(item, dict) for item in old_value + new_value)):
+            # Traces and annotations: patch each item in place rather than resending the whole list
+            for i, (old_item, new_item) in enumerate(zip(old_value, new_value)):
+                if old_item != new_item:
+                    _diff_into(patch[key][i], old_item, new_item)
+        else:
+            patch[key] = new_value
+
+    for key in old:
+        if key not in new:
+            del patch[key]
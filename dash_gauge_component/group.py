@@ -0,0 +1,116 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+from dash import ALL, Output, no_update
+
+GroupUpdateStats = namedtuple('GroupUpdateStats', ['updated', 'skipped'])
+
+
+class GaugeGroup:
+    """
+    Batched updates of many gauges from a single pattern-matching callback.
+
+    The group remembers the last value sent to each gauge, so an update only sends a
+    needle patch to the gauges whose value changed and ``no_update`` to the others.
+    The last sent values are those of the group, not of a browser session: an app serving
+    several sessions that each refresh on their own needs a group per session.
+
+    Likewise, they are those of one process. Under several server processes, e.g. gunicorn
+    workers, a worker that did not send the latest value compares against an older one and
+    may skip a gauge that the browser shows with another worker's value, leaving its needle
+    stuck. Pass ``skip_unchanged=False`` there, to send a patch to every gauge given a value.
+    Updates of the group from several threads are serialized.
+
+    Parameters
+    ----------
+    gauges : list of Gauge
+        The gauges of the group; their IDs must be dicts with the same ``'type'`` and distinct
+        ``'index'`` keys, e.g. ``{'type': 'cpu-gauge', 'index': 'host-1'}``
+    tolerance : float, optional
+        Changes of a value by at most this much are not sent (default 0, send any change)
+    skip_unchanged : bool, optional
+        Whether gauges whose value did not change since the last update get ``no_update`` (default True)
+
+    Example
+    -------
+    ::
+
+        group = GaugeGroup(gauges)
+
+        @app.callback(group.output, Input('interval', 'n_intervals'))
+        def refresh(_):
+            return group.update(fetch_values(), ctx.outputs_list)
+    """
+
+    def __init__(self, gauges, tolerance=0, skip_unchanged=True):
+        self.gauges = {}
+        for gauge in gauges:
+            if not isinstance(gauge.id, dict) or 'type' not in gauge.id or 'index' not in gauge.id:
+                raise ValueError("Gauges of a group need dict IDs with 'type' and 'index' keys")
+            if gauge.id['index'] in self.gauges:
+                raise ValueError(f"Duplicate gauge index {gauge.id['index']!r}")
+            self.gauges[gauge.id['index']] = gauge
+
+        types = {gauge.id['type'] for gauge in self.gauges.values()}
+        if len(types) > 1:
+            raise ValueError(f"Gauges of a group must share the same 'type', got {sorted(types)}")
+        self.type = types.pop() if types else None
+        self.tolerance = tolerance
+        self.skip_unchanged = skip_unchanged
+        self._lock = threading.Lock()  # Serializes updates, so each change is compared and sent once
+        self.last_sent = {index: gauge.value for index, gauge in self.gauges.items()}
+        self.last_stats = GroupUpdateStats(0, 0)
+
+    @property
+    def output(self):
+        """The pattern-matching ``Output`` addressing the figures of all gauges of the group."""
+        return Output({'type': self.type, 'index': ALL, 'subcomponent': 'graph'}, 'figure')
+
+    def update(self, values, outputs_list=None):
+        """
+        Compute the figure updates of the group for new values.
+
+        Parameters
+        ----------
+        values : dict
+            New values by gauge index, with one value per needle for gauges with several needles;
+            gauges left out keep their value
+        outputs_list : list of dict, optional
+            ``dash.ctx.outputs_list`` of the callback, giving the order of the outputs
+            (default None, the order in which the gauges were given to the group)
+
+        Returns
+        -------
+        list
+            A needle patch for each gauge whose value changed and ``no_update`` for the others,
+            in output order. The counts are kept in ``last_stats``.
+        """
+        unknown = set(values) - set(self.gauges)
+        if unknown:
+            raise KeyError(f"Unknown gauge indices: {sorted(unknown, key=repr)}")
+
+        if outputs_list is None:
+            order = list(self.gauges)
+        else:
+            order = [output['id']['index'] for output in outputs_list]
+
+        with self._lock:
+            updates = []
+            for index in order:
+                gauge = self.gauges[index]
+                if index in values:
+                    value = gauge._validate_value(values[index])
+                    changed = np.any(np.abs(np.subtract(value, self.last_sent[index])) > self.tolerance)
+                    if changed or not self.skip_unchanged:
+                        updates.append(gauge.needle_patch(value))
+                        self.last_sent[index] = value
+                        continue
+                updates.append(no_update)
+
+            updated = sum(update is not no_update for update in updates)
+            self.last_stats = GroupUpdateStats(updated, len(updates) - updated)
+        return updates
+
+    def __len__(self):
+        return len(self.gauges)
@@ -0,0 +1,110 @@
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    The last ``capacity`` values of a gauge, with their min, max and mean.
+
+    Values are kept in a preallocated NumPy ring buffer. The min and max are tracked with
+    monotonic queues and the mean with a running sum, so appending a value and reading the
+    statistics take constant (amortized) time whatever the window length.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of most recent values in the window
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._buffer = np.empty(capacity, dtype=float)
+        self._count = 0  # Number of values appended so far
+        self._sum = 0.0
+        # Sample numbers of candidate minimums (increasing values) and maximums (decreasing values)
+        self._min_candidates = deque()
+        self._max_candidates = deque()
+
+    def append(self, value):
+        """Add a value, evicting the oldest one if the window is full."""
+        value = float(value)
+        n = self._count
+        slot = n % self.capacity
+        if n >= self.capacity:
+            self._sum -= self._buffer[slot]
+            evicted = n - self.capacity
+            if self._min_candidates[0] == evicted:
+                self._min_candidates.popleft()
+            if self._max_candidates[0] == evicted:
+                self._max_candidates.popleft()
+
+        self._buffer[slot] = value
+        self._sum += value
+        self._count = n + 1
+
+        while self._min_candidates and self._buffer[self._min_candidates[-1] % self.capacity] >= value:
+            self._min_candidates.pop()
+        self._min_candidates.append(n)
+        while self._max_candidates and self._buffer[self._max_candidates[-1] % self.capacity] <= value:
+            self._max_candidates.pop()
+        self._max_candidates.append(n)
+
+        # Recompute the running sum once per window to stop rounding errors from accumulating
+        if slot == self.capacity - 1:
+            self._sum = float(self._buffer.sum())
+
+    def stats_with(self, value):
+        """
+        The (min, max, mean) the window would have after appending ``value``, without appending it.
+
+        This lets a value be recorded only once everything depending on the new statistics succeeded.
+        """
+        value = float(value)
+        if self._count < self.capacity:
+            if not self._count:
+                return value, value, value
+            return min(self.min, value), max(self.max, value), (self._sum + value) / (self._count + 1)
+        # The oldest value is evicted: the front candidates drop out if they are that value
+        evicted = self._count - self.capacity
+        minimums = [n for n in islice(self._min_candidates, 2) if n != evicted]
+        maximums = [n for n in islice(self._max_candidates, 2) if n != evicted]
+        low = min([self._buffer[n % self.capacity] for n in minimums[:1]] + [value])
+        high = max([self._buffer[n % self.capacity] for n in maximums[:1]] + [value])
+        mean = (self._sum - self._buffer[evicted % self.capacity] + value) / self.capacity
+        return float(low), float(high), mean
+
+    @property
+    def min(self):
+        """The smallest value in the window."""
+        self._check_not_empty()
+        return float(self._buffer[self._min_candidates[0] % self.capacity])
+
+    @property
+    def max(self):
+        """The largest value in the window."""
+        self._check_not_empty()
+        return float(self._buffer[self._max_candidates[0] % self.capacity])
+
+    @property
+    def mean(self):
+        """The mean of the values in the window."""
+        self._check_not_empty()
+        return self._sum / len(self)
+
+    def values(self):
+        """A copy of the values in the window, oldest first."""
+        if self._count <= self.capacity:
+            return self._buffer[:self._count].copy()
+        slot = self._count % self.capacity
+        return np.concatenate([self._buffer[slot:], self._buffer[:slot]])
+
+    def _check_not_empty(self):
+        if not self._count:
+            raise ValueError("The window is empty")
+
+    def __len__(self):
+        return min(self._count, self.capacity)
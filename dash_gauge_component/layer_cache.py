@@ -0,0 +1,232 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import flask
+from dash import Input, Output, State
+from plotly.io.json import to_json_plotly
+
+from .data_source import source_key
+
+LAYERS_ROUTE = '/_dash-gauge/layers'
+MAX_LAYERS = 1024  # Distinct static layers kept in memory; past this, the least recently used ones are dropped
+
+_layers = OrderedDict()  # Content hash -> static layers as JSON, for serve_static_layers
+_lock = threading.Lock()
+
+# A stand-in for each static trace in the figure the page carries, keeping the indices of the dynamic traces
+STATIC_TRACE_STUB = {'type': 'scatter', 'visible': False}
+
+# Runs in the browser: composes the figures of the gauges, replacing the stubs of their static traces with
+# the layers kept in localStorage. The current figures are read as states, so needle patches that arrived
+# before are kept. Missing layers are fetched by hash, in one request; the server answers for the gauges
+# whose hash it no longer knows (dropped from its cache, or the page came from another worker) with their
+# current layers, by ID. Each hash, and each gauge with a given hash, is requested once per page, so the
+# callback cannot keep fetching. After fetching, the callback triggers itself again through its first store,
+# to compose every figure at once from up-to-date states. __LAYERS_URL__ is replaced when registered.
+RESTORE_FIGURES = """
+async function(...args) {
+    const stores = args.slice(0, args.length / 2);
+    const figures = args.slice(args.length / 2);
+    const clientside = window.dash_clientside;
+    const inputs = clientside.callback_context.inputs_list;
+    const prefix = 'dash-gauge-layers:';
+    const cache = window.dashGaugeLayers = window.dashGaugeLayers || {layers: {}, gauges: {}, requested: {}};
+    const lookup = hash => {
+        if (!(hash in cache.layers)) {
+            try { cache.layers[hash] = JSON.parse(window.localStorage.getItem(prefix + hash)) || undefined; } catch (e) {}
+        }
+        return cache.layers[hash];
+    };
+    const gaugeKey = i => JSON.stringify(inputs[i].id) + ':' + stores[i].hash;
+    const layerOf = i => stores[i] && (lookup(stores[i].hash) || cache.gauges[gaugeKey(i)]);
+    const request = async query => {
+        const response = await fetch(__LAYERS_URL__ + '?' + query);
+        return response.ok ? response.json() : null;
+    };
+    let fetched = false;
+
+    const missing = [...new Set(stores.filter(store => store && !lookup(store.hash) && !cache.requested[store.hash])
+        .map(store => store.hash))];
+    if (missing.length) {
+        missing.forEach(hash => { cache.requested[hash] = true; });
+        const keep = key => !key.startsWith(prefix) || stores.some(store => store && prefix + store.hash === key);
+        for (const [hash, layer] of Object.entries(await request('hashes=' + missing.join(',')) || {})) {
+            cache.layers[hash] = layer;
+            const item = JSON.stringify(layer);
+            try {
+                window.localStorage.setItem(prefix + hash, item);
+            } catch (e) {
+                // Storage full: drop the layers no gauge of this page uses, e.g. of older dials, and retry once
+                Object.keys(window.localStorage).filter(key => !keep(key))
+                    .forEach(key => window.localStorage.removeItem(key));
+                try { window.localStorage.setItem(prefix + hash, item); } catch (e) {}
+            }
+        }
+        fetched = true;
+    }
+
+    const unknown = stores.map((store, i) => i).filter(i => stores[i] && !layerOf(i) && !cache.requested[gaugeKey(i)]);
+    if (unknown.length) {
+        unknown.forEach(i => { cache.requested[gaugeKey(i)] = true; });
+        const ids = JSON.stringify(unknown.map(i => inputs[i].id));
+        const layers = await request('gauges=' + encodeURIComponent(ids)) || [];
+        unknown.forEach((i, j) => { if (layers[j]) cache.gauges[gaugeKey(i)] = layers[j]; });
+        fetched = true;
+    }
+
+    if (fetched) {
+        const restored = Object.assign({}, stores[0], {restored: ((stores[0] || {}).restored || 0) + 1});
+        clientside.set_props(inputs[0].id, {data: restored});
+        return stores.map(() => clientside.no_update);
+    }
+
+    return stores.map((store, i) => {
+        const layer = layerOf(i);
+        const figure = figures[i];
+        if (!layer || !figure) return clientside.no_update;
+        const annotations = figure.layout.annotations || [];
+        const staticAnnotations = layer.layout.annotations || [];
+        const layout = Object.assign({}, figure.layout);
+        const composed = staticAnnotations.concat(annotations.slice(staticAnnotations.length));
+        if (composed.length) layout.annotations = composed;
+        return {data: layer.data.concat(figure.data.slice(layer.data.length)), layout: layout};
+    });
+}
+"""
+
+
+def static_layers_hash(static):
+    """
+    Get the content hash of the static layers of a gauge, as a figure dict, keeping them for serve_static_layers.
+
+    Gauges with the same dial share their static layers, so the browser keeps and fetches them once.
+    Every reconfigured dial is a new entry, so only the ``MAX_LAYERS`` most recently used layers are kept.
+    """
+    layers_json = to_json_plotly(static)
+    content_hash = hashlib.sha256(layers_json.encode()).hexdigest()[:16]
+    with _lock:
+        _layers[content_hash] = layers_json
+        _layers.move_to_end(content_hash)
+        while len(_layers) > MAX_LAYERS:
+            _layers.popitem(last=False)
+    return content_hash
+
+
+def touch_static_layers(content_hash):
+    """Mark the static layers of ``content_hash`` as used, returning False if they were dropped since."""
+    with _lock:
+        if content_hash not in _layers:
+            return False
+        _layers.move_to_end(content_hash)
+        return True
+
+
+def placeholder_figure(static, figure):
+    """
+    Get the figure a gauge caching its static layers sends to the page.
+
+    The static traces and annotations of the figure dict ``figure`` are replaced by invisible stubs,
+    so that patches of the dynamic layers address the same indices before and after the browser
+    restored the static layers.
+    """
+    static_annotations = len(static['layout'].get('annotations', []))
+    layout = dict(figure['layout'])
+    if static_annotations:
+        layout['annotations'] = ([{'visible': False}] * static_annotations
+                                 + layout['annotations'][static_annotations:])
+    return {'data': [STATIC_TRACE_STUB] * len(static['data']) + figure['data'][len(static['data']):],
+            'layout': layout}
+
+
+def serve_static_layers(app, gauges, route=LAYERS_ROUTE):
+    """
+    Let browsers keep the static layers of gauges across page loads, so that pages only transfer the needles.
+
+    Gauges built with ``cache_static_layers=True`` send their static layers (dial, ticks and labels) as a
+    content hash. A clientside callback restores the layers from the browser's ``localStorage`` when the
+    hash matches, fetches the missing ones in one request to ``route``, and composes the figures. A changed
+    dial has a new hash, so stale layers are never shown.
+
+    The callback writes the figures with ``allow_duplicate``, so other callbacks may update them too, e.g.
+    with needle patches, including before the static layers are restored.
+
+    As for ``serve_dials``, layers are served from the gauges built by the serving process, so each worker
+    must build the gauges of its layout itself. When the server no longer knows a hash the page asks for,
+    e.g. dropped past ``MAX_LAYERS``, it answers with the current layers of the gauge registered here with
+    the same ID; gauges it does not know keep their placeholder figure.
+
+    Parameters
+    ----------
+    app : dash.Dash
+        The app whose server serves the layers
+    gauges : list of Gauge
+        The gauges of the app's layout built with ``cache_static_layers=True``
+    route : str, optional
+        The path of the layers (default '/_dash-gauge/layers')
+    """
+    gauges = list(gauges)
+    if not gauges:
+        raise ValueError("gauges must contain at least one gauge")
+    for gauge in gauges:
+        if not gauge.cache_static_layers:
+            raise ValueError(f"Gauge {gauge.id!r} must be built with cache_static_layers=True")
+
+    # The gauges by the key of their store's ID, to answer for the layers the page asks for by gauge
+    registry = app.server.extensions.setdefault('dash_gauge_layers', {})
+    for gauge in gauges:
+        registry[source_key(gauge.layers_id(gauge.id))] = gauge
+        gauge._static_layers_hash()  # Serve the layers before the first page load, e.g. in other workers
+
+    path = f"{app.config.routes_pathname_prefix.rstrip('/')}{route}"
+    if 'dash_gauge_layers' not in app.server.view_functions:
+        app.server.add_url_rule(path, 'dash_gauge_layers', _layers_response)
+
+    url = f"{app.config.requests_pathname_prefix.rstrip('/')}{route}"
+    app.clientside_callback(
+        RESTORE_FIGURES.replace('__LAYERS_URL__', json.dumps(url)),
+        [Output(gauge.graph_id(gauge.id), 'figure', allow_duplicate=True) for gauge in gauges],
+        [Input(gauge.layers_id(gauge.id), 'data') for gauge in gauges],
+        [State(gauge.graph_id(gauge.id), 'figure') for gauge in gauges],
+        prevent_initial_call='initial_duplicate',
+    )
+
+
+def _layers_response():
+    """
+    Respond with the known static layers among the comma-separated ``hashes``, as a JSON object,
+    or with the current static layers of the gauges of the JSON list of store IDs ``gauges``.
+    """
+    if 'gauges' in flask.request.args:
+        return _gauge_layers_response(flask.request.args['gauges'])
+    hashes = list(dict.fromkeys(flask.request.args.get('hashes', '').split(',')))
+    with _lock:
+        known = [(content_hash, _layers[content_hash]) for content_hash in hashes if content_hash in _layers]
+    body = '{' + ','.join(f'"{content_hash}":{layers_json}' for content_hash, layers_json in known) + '}'
+    # Layers never change under a hash, so a set of hashes can be cached for good, unless some are missing
+    cache_control = 'public, max-age=31536000, immutable' if len(known) == len(hashes) else 'no-store'
+    return flask.Response(body, mimetype='application/json', headers={'Cache-Control': cache_control})
+
+
+def _gauge_layers_response(store_ids_json):
+    """Respond with the current static layers of each gauge of the JSON list of store IDs, or null if unknown."""
+    try:
+        store_ids = json.loads(store_ids_json)
+        if not isinstance(store_ids, list):
+            raise ValueError(store_ids_json)
+        keys = [source_key(store_id) for store_id in store_ids]
+    except (TypeError, ValueError):
+        flask.abort(400)
+    registry = flask.current_app.extensions.get('dash_gauge_layers', {})
+    layers = []
+    for key in keys:
+        gauge = registry.get(key) if isinstance(key, str) else None
+        if gauge is None:
+            layers.append('null')
+        else:
+            gauge._static_layers_hash()  # Served by hash again, for the next page loads
+            layers.append(to_json_plotly(gauge._static_layers_dict()))
+    # The gauges' dials may change, so these are never cached
+    return flask.Response('[' + ','.join(layers) + ']', mimetype='application/json',
+                          headers={'Cache-Control': 'no-store'})
@@ -0,0 +1,67 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from .gauge import Gauge
+
+
+def _render_figure(spec):
+    """Render the figure of a gauge spec as a plain dict, so it can be sent back from a worker process."""
+    figure = Gauge(**spec).children[0].figure
+    return figure if isinstance(figure, dict) else figure.to_dict()
+
+
+def _build_gauge(spec):
+    """Build a gauge from its spec."""
+    return Gauge(**spec)
+
+
+def build_gauges_parallel(specs, executor='thread', max_workers=None, chunksize=1):
+    """
+    Build many gauges at once, spreading the figure work across a pool of workers.
+
+    Parameters
+    ----------
+    specs : list of dict
+        The keyword arguments of each gauge, e.g. ``{'id': 'gauge-1', 'value': 42, 'max_value': 200}``
+    executor : str or concurrent.futures.Executor, optional
+        ``'thread'`` for a thread pool, ``'process'`` for a process pool, or an existing executor
+        to reuse (default 'thread')
+    max_workers : int, optional
+        Number of workers of a pool created here (default None, let the pool decide)
+        Ignored if an existing executor is given
+    chunksize : int, optional
+        Number of specs sent to a worker process at a time (default 1)
+        Larger chunks amortise the cost of inter-process communication for big layouts
+
+    Returns
+    -------
+    list of Gauge
+        The gauges, in the same order as ``specs``
+
+    With a process pool, only the figures are rendered in the workers; they are sent back as
+    plain dicts and the ``Gauge`` components are assembled in the calling process. Specs must
+    therefore be picklable. Dial images are drawn again in the calling process, once per distinct
+    dial, so that ``serve_dials`` can serve them.
+    """
+    specs = list(specs)
+    if isinstance(executor, Executor):
+        return _build_with(executor, specs, chunksize)
+    if executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    elif executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError("executor must be 'thread', 'process' or a concurrent.futures.Executor")
+    with pool:
+        return _build_with(pool, specs, chunksize)
+
+
+def _build_with(executor, specs, chunksize):
+    if isinstance(executor, ProcessPoolExecutor):
+        figures = executor.map(_render_figure, specs, chunksize=chunksize)
+        gauges = [Gauge(**spec, figure=figure) for spec, figure in zip(specs, figures)]
+        for gauge in gauges:
+            if gauge.dial_image:
+                gauge._dial_image()  # Drawn in the workers, so that this process can serve the images too
+        return gauges
+    # Executor.map yields results in the order of its inputs
+    return list(executor.map(_build_gauge, specs))
@@ -0,0 +1,174 @@
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import struct
+
+import plotly
+
+from . import dial as dial_module
+from . import gauge as gauge_module
+from . import template as template_module
+from . import ticks as ticks_module
+from .gauge import Gauge
+
+_MAGIC = b'DGPC'
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct('<4sIQ')  # magic, format version, header length
+
+# Gauge options that do not affect the figure
+_NON_FIGURE_OPTIONS = {'self', 'id', 'value', 'width', 'height', 'read_only', 'cache_static_layers', 'figure',
+                       'kwargs'}
+
+
+def renderer_fingerprint():
+    """
+    Identify the code that renders gauge figures.
+
+    Artifacts written by a different version of the gauge renderer or of plotly are stale as a
+    whole, since every figure in them may have been rendered differently.
+    """
+    digest = hashlib.sha256()
+    for module in (gauge_module, dial_module, template_module, ticks_module):
+        with open(inspect.getsourcefile(module), 'rb') as source:
+            digest.update(source.read())
+    digest.update(plotly.__version__.encode())
+    return digest.hexdigest()
+
+
+def spec_hash(spec):
+    """
+    Hash the options of a gauge spec that determine its static layers.
+
+    Options left out of the spec hash the same as their defaults; the id, value, sizes, read-only
+    mode and static layer caching do not change the static layers and are ignored.
+    """
+    options = {
+        name: parameter.default
+        for name, parameter in inspect.signature(Gauge.__init__).parameters.items()
+        if name not in _NON_FIGURE_OPTIONS
+    }
+    options.update((name, value) for name, value in spec.items() if name not in _NON_FIGURE_OPTIONS)
+    canonical = json.dumps(options, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def precompile_gauges(specs, path):
+    """
+    Render the static layers of gauge specs into an artifact file, e.g. at deploy time.
+
+    Parameters
+    ----------
+    specs : list of dict
+        The keyword arguments of each gauge; gauges differing only by id, value, size or read-only mode share an entry
+    path : str
+        Where to write the artifact
+
+    Returns
+    -------
+    int
+        The number of distinct static layers written
+    """
+    blobs = {}
+    for spec in specs:
+        key = spec_hash(spec)
+        if key not in blobs:
+            static_figure = Gauge(**spec, figure={})._create_static_figure()
+            blobs[key] = json.dumps(static_figure.to_dict(), separators=(',', ':')).encode()
+
+    entries = {}
+    offset = 0
+    for key, blob in blobs.items():
+        entries[key] = [offset, len(blob)]
+        offset += len(blob)
+    header = json.dumps({'fingerprint': renderer_fingerprint(), 'entries': entries}).encode()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as artifact:
+        artifact.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)))
+        artifact.write(header)
+        for blob in blobs.values():
+            artifact.write(blob)
+    os.replace(tmp_path, path)  # Workers never see a partially written artifact
+    return len(blobs)
+
+
+class PrecompiledGauges:
+    """
+    Gauge static layers loaded from an artifact written by :func:`precompile_gauges`.
+
+    The artifact is memory-mapped, so workers forked from the same file share its pages and
+    only the entries actually used are parsed. Entries whose spec changed since precompiling
+    are missed by hash and rendered as usual; if the renderer itself changed, the whole
+    artifact is ignored.
+
+    Parameters
+    ----------
+    path : str
+        The artifact to load
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_length = _PREAMBLE.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a precompiled gauge artifact")
+
+        self._data_offset = _PREAMBLE.size + header_length
+        self._parsed = {}
+        if version != _FORMAT_VERSION:
+            self.stale = True
+            self._entries = {}
+        else:
+            header = json.loads(self._mmap[_PREAMBLE.size:self._data_offset])
+            self.stale = header['fingerprint'] != renderer_fingerprint()
+            self._entries = {} if self.stale else header['entries']
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, spec):
+        return spec_hash(spec) in self._entries
+
+    def static_figure(self, spec):
+        """Return the static layers of a spec as a figure dict, or None if the artifact has no fresh entry."""
+        key = spec_hash(spec)
+        if key not in self._parsed:
+            if key not in self._entries:
+                return None
+            offset, length = self._entries[key]
+            start = self._data_offset + offset
+            self._parsed[key] = json.loads(self._mmap[start:start + length])
+        return self._parsed[key]
+
+    def build(self, spec):
+        """Build a gauge from its spec, reusing its precompiled static layers when available."""
+        static_figure = self.static_figure(spec)
+        if static_figure is None:
+            return Gauge(**spec)
+
+        gauge = Gauge(**spec, figure={})
+        if gauge.dial_image:
+            gauge._dial_image()  # So that this process can serve the dial image the artifact links to
+        gauge._static_layers = static_figure
+        gauge.children[0].figure = gauge.render()
+        return gauge
+
+    def build_all(self, specs):
+        """Build gauges from their specs, in order."""
+        return [self.build(spec) for spec in specs]
+
+    def close(self):
+        """Unmap the artifact."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
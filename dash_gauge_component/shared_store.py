@@ -0,0 +1,180 @@
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_MAGIC = b'DGVS'
+_VERSION = 1
+_HEADER_DTYPE = np.dtype([('magic', 'S4'), ('version', '<u4'), ('count', '<u8')])
+_RECORD_DTYPE = np.dtype([('sequence', '<u8'), ('value', '<f8'), ('timestamp', '<f8')])
+
+
+class SharedValueStore:
+    """
+    Latest gauge values shared between processes, e.g. gunicorn workers.
+
+    The store is a fixed-layout array of ``(sequence, value, timestamp)`` records in a
+    ``multiprocessing.shared_memory`` block, one record per gauge id. Any process can attach
+    to the block by name and read the values in place, without copying or messaging.
+
+    A store has exactly one writer: one process, e.g. a poller, calling :meth:`update` from one
+    thread at a time. Other processes only read. Writes of that process take a lock, so its threads
+    cannot interleave updates, but nothing serializes writes across processes.
+
+    Reads are lock-free: the writer makes the record's sequence odd while it writes, and even again
+    when done. Readers retry if the sequence is odd or changes under them, so they never observe a
+    half-written record. A writer that dies mid-write leaves its record odd; reads of it then raise
+    ``TimeoutError`` after ``read_timeout`` seconds rather than spin.
+
+    The sequence protocol relies on the stores of the writer becoming visible to readers in
+    program order. Python does not add memory barriers, so this holds on x86, whose stores are
+    not reordered, but is not guaranteed on weakly ordered CPUs such as ARM.
+
+    Parameters
+    ----------
+    gauge_ids : list of str
+        The ids of the gauges in the store; every process must pass the same ids in the same order
+    name : str, optional
+        The name of the shared memory block (default None, generate one when creating)
+    create : bool, optional
+        Whether to create a new block rather than attach to an existing one (default False)
+    read_timeout : float, optional
+        Seconds a read waits for a record being written before raising ``TimeoutError`` (default 1.0)
+        Long enough for a writer that was only descheduled mid-write to finish
+
+    Example
+    -------
+    Create the store in the gunicorn master (e.g. with ``--preload``), write from the single poller
+    process and attach by name in the workers, which only read. Before Python 3.13, only processes
+    descending from the creator may attach::
+
+        store = SharedValueStore(gauge_ids, name='gauges', create=True)  # master
+        store.update('gauge-1', 42.0)  # poller process
+        value, timestamp, sequence = SharedValueStore(gauge_ids, name='gauges').read('gauge-1')  # worker
+    """
+
+    def __init__(self, gauge_ids, name=None, create=False, read_timeout=1.0):
+        self.gauge_ids = list(gauge_ids)
+        self.read_timeout = read_timeout
+        self._write_lock = threading.Lock()  # Serializes the updates of this process's threads
+        self._index = {gauge_id: i for i, gauge_id in enumerate(self.gauge_ids)}
+        if len(self._index) != len(self.gauge_ids):
+            raise ValueError("Gauge ids must be unique")
+
+        size = _HEADER_DTYPE.itemsize + _RECORD_DTYPE.itemsize * len(self.gauge_ids)
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        elif name is None:
+            raise ValueError("name is required to attach to an existing store")
+        else:
+            self._shm = self._attach(name)
+
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf)
+        self._records = np.ndarray((len(self.gauge_ids),), dtype=_RECORD_DTYPE, buffer=self._shm.buf,
+                                   offset=_HEADER_DTYPE.itemsize)
+        if create:
+            self._records[:] = (0, np.nan, np.nan)
+            self._header[()] = (_MAGIC, _VERSION, len(self.gauge_ids))
+        elif (self._header['magic'] != _MAGIC or self._header['version'] != _VERSION
+              or self._header['count'] != len(self.gauge_ids)):
+            self.close()
+            raise ValueError(f"Shared memory block {name!r} does not hold a store of {len(self.gauge_ids)} gauges")
+
+        self._sequences = self._records['sequence']
+        self._values = self._records['value']
+        self._timestamps = self._records['timestamp']
+
+    @staticmethod
+    def _attach(name):
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        # Before 3.13, attaching registers the block with the resource tracker. Processes forked
+        # or spawned from the creator (gunicorn workers, multiprocessing children) share its
+        # tracker, so this is harmless; an unrelated process would unlink the block on exit.
+        return shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self):
+        """The name of the shared memory block, used to attach from other processes."""
+        return self._shm.name
+
+    def update(self, gauge_id, value, timestamp=None):
+        """Write the latest value of a gauge; only the store's single writing process may update it."""
+        i = self._index[gauge_id]
+        with self._write_lock:
+            sequence = int(self._sequences[i])
+            self._sequences[i] = sequence + 1
+            self._values[i] = value
+            self._timestamps[i] = time.time() if timestamp is None else timestamp
+            self._sequences[i] = sequence + 2
+
+    def update_many(self, values, timestamp=None):
+        """Write the latest values of several gauges from a dict of gauge id to value."""
+        timestamp = time.time() if timestamp is None else timestamp
+        for gauge_id, value in values.items():
+            self.update(gauge_id, value, timestamp)
+
+    def read(self, gauge_id, timeout=None):
+        """
+        Read a gauge's latest ``(value, timestamp, sequence)``.
+
+        ``sequence`` counts the updates of the gauge, so it can be compared with a previously
+        read one to tell whether the value changed. Value and timestamp are NaN before the
+        first update.
+
+        Raises ``TimeoutError`` if the record stays mid-write for ``timeout`` seconds (default
+        ``read_timeout``), as it does when its writer died during an update.
+        """
+        i = self._index[gauge_id]
+        timeout = self.read_timeout if timeout is None else timeout
+        deadline = None
+        while True:
+            before = int(self._sequences[i])
+            if not before & 1:
+                value = float(self._values[i])
+                timestamp = float(self._timestamps[i])
+                if int(self._sequences[i]) == before:
+                    return value, timestamp, before // 2
+            if deadline is None:
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError(f"The record of gauge {gauge_id!r} stayed mid-write, its writer may have died")
+            time.sleep(0)  # Let the writer finish
+
+    def read_many(self, gauge_ids=None):
+        """Read the latest value of several gauges (default all) as a dict of gauge id to value."""
+        gauge_ids = self.gauge_ids if gauge_ids is None else gauge_ids
+        return {gauge_id: self.read(gauge_id)[0] for gauge_id in gauge_ids}
+
+    @property
+    def values(self):
+        """
+        A read-only view of all values in the shared block, in the order of ``gauge_ids``.
+
+        The view is not copied, so it always reflects the latest writes; use :meth:`read`
+        where a value must be consistent with its timestamp and sequence.
+        """
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def close(self):
+        """Detach this process from the shared memory block."""
+        self._header = self._records = None
+        self._sequences = self._values = self._timestamps = None
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory block; call once, from the creating process."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.gauge_ids)
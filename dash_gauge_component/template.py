@@ -0,0 +1,37 @@
+import plotly.graph_objects as go
+import plotly.io as pio
+
+TEMPLATE_NAME = 'dash_gauge'
+
+
+def gauge_template():
+    """
+    Create the plotly template holding the layout and trace defaults shared by all gauges.
+
+    Every gauge figure embeds this small template instead of plotly's default one, and leaves
+    out the settings it holds, so figures only carry what differs between gauges. The axis
+    ranges and aspect ratio constraints stay on each figure, as plotly.js derives autoranging
+    and axis matching from the figure's own axis settings.
+    """
+    hidden_axis = dict(
+        showgrid=False,
+        zeroline=False,
+        showticklabels=False,
+        fixedrange=True,
+    )
+    return go.layout.Template(
+        layout=dict(
+            margin=dict(l=20, r=20, t=20, b=20),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            xaxis=hidden_axis,
+            yaxis=hidden_axis,
+            autosize=True,  # Allow the figure to be resized automatically
+        ),
+        data=dict(
+            scatter=[go.Scatter(hoverinfo='skip', showlegend=False)],
+        ),
+    )
+
+
+pio.templates[TEMPLATE_NAME] = gauge_template()
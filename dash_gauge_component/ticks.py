@@ -0,0 +1,128 @@
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+MINOR_TICKS = 5  # Number of minor ticks between major ticks
+
+TickLayout = namedtuple('TickLayout', ['values', 'labels', 'major_angles', 'minor_angles'])
+TickLayout.__doc__ = """
+The ticks of a gauge scale, see :func:`tick_layout`.
+
+values : tuple of float
+    The values of the major ticks
+labels : tuple of str
+    The label of each major tick
+major_angles : tuple of float
+    The angle of each major tick, in radians
+minor_angles : tuple of float
+    The angles of the minor ticks, in radians
+"""
+
+
+def nice_number(x, round_result):
+    """
+    Get a "nice" number, 1, 2, 5 or 10 times a power of ten, close to ``x``.
+
+    With ``round_result`` the nearest nice number is returned, otherwise the smallest one that
+    is at least ``x`` (Heckbert, "Nice numbers for graph labels", Graphics Gems, 1990).
+    """
+    exponent = math.floor(math.log10(x))
+    fraction = x / 10 ** exponent
+    if round_result:
+        nice = 1 if fraction < 1.5 else 2 if fraction < 3 else 5 if fraction < 7 else 10
+    else:
+        nice = 1 if fraction <= 1 else 2 if fraction <= 2 else 5 if fraction <= 5 else 10
+    return nice * 10 ** exponent
+
+
+def _is_multiple(x, step):
+    """Whether ``x`` is a whole multiple of ``step``, tolerating rounding errors."""
+    return abs(x / step - round(x / step)) < 1e-9
+
+
+def _decimals(x):
+    """The number of decimals needed to print ``x`` exactly, up to 9."""
+    return next((d for d in range(10) if abs(round(x, d) - x) <= 1e-9 * max(1, abs(x))), 9)
+
+
+def dividing_step(min_value, max_value, count):
+    """
+    Get the nice step (1, 2, 2.5 or 5 times a power of ten) that both ends of the scale are multiples of,
+    giving the number of major ticks closest to ``count``, or None if no such step gives between about
+    half and twice ``count`` ticks.
+    """
+    span = max_value - min_value
+    target = count - 1
+    steps = [mantissa * 10 ** exponent
+             for exponent in range(math.floor(math.log10(span)) - 3, math.floor(math.log10(span)) + 1)
+             for mantissa in (1, 2, 2.5, 5)]
+    candidates = [step for step in steps
+                  if _is_multiple(min_value, step) and _is_multiple(max_value, step)
+                  and max(1, math.ceil(target / 2)) <= round(span / step) <= 2 * target]
+    if not candidates:
+        return None
+    # The closest number of ticks; on a tie, the fewer ticks
+    return min(candidates, key=lambda step: (abs(round(span / step) - target), -step))
+
+
+@lru_cache(maxsize=256)
+def tick_layout(min_value, max_value, start_angle, end_angle, count):
+    """
+    Compute the ticks of a gauge scale, memoized so that gauges with the same scale share them.
+
+    Major ticks are put on the multiples of a nice step, aiming for about ``count`` of them. Where
+    possible the step divides the scale, so that both ends fall on major ticks; otherwise ``min_value``
+    and ``max_value`` get major ticks of their own, replacing the multiples less than half a step from
+    them. Minor ticks split each step into equal parts.
+
+    Parameters
+    ----------
+    min_value, max_value : float
+        The range of the gauge; ``min_value`` must be less than ``max_value``
+    start_angle, end_angle : float
+        The angles of the ends of the gauge, in degrees
+    count : int
+        The number of major ticks to aim for, at least 2
+
+    Returns
+    -------
+    TickLayout
+    """
+    if count < 2:
+        raise ValueError("tick_count must be at least 2")
+    if not min_value < max_value:
+        raise ValueError(f"min_value ({min_value}) must be less than max_value ({max_value})")
+    step = dividing_step(min_value, max_value, count)
+    if step is None:
+        step = nice_number(nice_number(max_value - min_value, False) / (count - 1), True)
+    minor_step = step / (MINOR_TICKS + 1)
+
+    # Tolerate rounding errors on the ends, so that ticks on min_value and max_value are kept
+    first = math.ceil(min_value / minor_step - 1e-9)
+    last = math.floor(max_value / minor_step + 1e-9)
+    ticks = [(i * minor_step, i % (MINOR_TICKS + 1) == 0) for i in range(first, last + 1)]
+
+    # Ends off the multiples of the step get a major tick, replacing the ticks near them
+    for end in (min_value, max_value):
+        if not _is_multiple(end, step):
+            ticks = [(value, major and abs(value - end) >= step / 2) for value, major in ticks
+                     if abs(value - end) > minor_step / 2]
+            ticks.append((end, True))
+    ticks.sort()
+    values = np.array([value for value, _ in ticks])
+    is_major = [major for _, major in ticks]
+
+    start_angle_rad = np.radians(start_angle)
+    end_angle_rad = np.radians(end_angle)
+    angles = start_angle_rad + (values - min_value) / (max_value - min_value) * (end_angle_rad - start_angle_rad)
+
+    decimals = max(_decimals(value) for value in (step, min_value, max_value))
+    major_values = [round(value, decimals) for value, major in zip(values.tolist(), is_major) if major]
+    return TickLayout(
+        values=tuple(major_values),
+        labels=tuple(f"{value:.{decimals}f}" for value in major_values),
+        major_angles=tuple(angle for angle, major in zip(angles.tolist(), is_major) if major),
+        minor_angles=tuple(angle for angle, major in zip(angles.tolist(), is_major) if not major),
+    )
@@ -12,7 +12,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "dash>=2.0.0",
+        "dash>=2.16.0",
         "plotly>=5.0.0",
         "numpy>=1.19.0",
     ],
@@ -0,0 +1,50 @@
+"""Gauge factories and figure helpers shared by the tests and the benchmarks."""
+import copy
+
+from dash_gauge_component import Gauge
+
+# The red, yellow and green dial of the examples
+COLOR_RANGES = [
+    {'min': 0, 'max': 33, 'color': '#FF0000'},
+    {'min': 33, 'max': 67, 'color': '#FFFF00'},
+    {'min': 67, 'max': 100, 'color': '#00FF00'},
+]
+
+
+def make_specs(count, id_type=None, **options):
+    """
+    Specs of ``count`` gauges with the shared dial and spread values.
+
+    IDs are ``f"gauge-{i}"``, or pattern-matching dict IDs of type ``id_type``; ``options`` apply to every gauge.
+    """
+    return [
+        {
+            'id': f"gauge-{i}" if id_type is None else {'type': id_type, 'index': i},
+            'value': (i * 7) % 100,
+            'color_ranges': COLOR_RANGES,
+            **options,
+        }
+        for i in range(count)
+    ]
+
+
+def make_gauges(count, id_type=None, **options):
+    """Gauges built from ``make_specs``."""
+    return [Gauge(**spec) for spec in make_specs(count, id_type, **options)]
+
+
+def apply_patch(figure, patch):
+    """Apply a dash.Patch to a figure dict the way the Dash renderer does."""
+    figure = copy.deepcopy(figure)
+    for operation in patch.to_plotly_json()['operations']:
+        *path, last = operation['location']
+        target = figure
+        for key in path:
+            target = target[key]
+        if operation['operation'] == 'Assign':
+            target[last] = operation['params']['value']
+        elif operation['operation'] == 'Delete':
+            del target[last]
+        else:
+            raise AssertionError(f"Unexpected patch operation {operation['operation']}")
+    return figure
@@ -0,0 +1,112 @@
+import random
+import unittest
+
+import numpy as np
+
+from dash_gauge_component import Gauge, ZoneEngine, compile_ranges, zone_indices
+
+RANGES = [
+    {'min': 0, 'max': 50, 'color': '#00FF00'},
+    {'min': 50, 'max': 80, 'color': '#FFFF00'},
+    {'min': 80, 'max': 100, 'color': '#FF0000'},
+]
+
+
+def reference_zone(value, color_ranges):
+    """The zone as the gauge's value_font_color="auto" loop used to find it."""
+    for i, color_range in enumerate(color_ranges):
+        if color_range['min'] <= value <= color_range['max']:
+            return i
+    return -1
+
+
+class TestZoneIndices(unittest.TestCase):
+    def test_matches_gauge_range_logic(self):
+        """Test that vectorized lookups agree with the first-matching-range rule, including at boundaries."""
+        values = [-1, 0, 25, 50, 65, 80, 99.9, 100, 101, float('nan')]
+        self.assertEqual(zone_indices(values, compile_ranges(RANGES)).tolist(),
+                         [reference_zone(value, RANGES) for value in values])
+
+    def test_per_gauge_ranges(self):
+        """Test that each gauge can have its own ranges, with different numbers of ranges."""
+        rng = random.Random(11)
+        per_gauge = [RANGES, RANGES[:1], [{'min': 10, 'max': 20, 'color': '#000000'}, {'min': 30, 'max': 40, 'color': '#FFFFFF'}]]
+        per_gauge = [rng.choice(per_gauge) for _ in range(300)]
+        values = [rng.uniform(-10, 110) for _ in range(300)]
+
+        boundaries = compile_ranges(per_gauge)
+        self.assertEqual(boundaries.lower.shape, (300, 3))
+        self.assertEqual(zone_indices(values, boundaries).tolist(),
+                         [reference_zone(value, ranges) for value, ranges in zip(values, per_gauge)])
+
+    def test_gauge_auto_color_uses_zones(self):
+        """Test that the gauge's automatic value color follows the zone of its value."""
+        figure = Gauge(id="zone-gauge", value=65, color_ranges=RANGES, value_font_color="auto").children[0].figure
+        self.assertEqual(figure.layout.annotations[-1].font.color, '#FFFF00')
+        with self.assertRaises(ValueError):
+            Gauge(id="gap-gauge", value=45, color_ranges=RANGES[1:], value_font_color="auto", min_value=0)
+
+
+class TestZoneEngine(unittest.TestCase):
+    def test_transitions(self):
+        """Test that zone changes are reported once, with their previous zone."""
+        engine = ZoneEngine(RANGES)
+        first = engine.update([10, 60, 90])
+        self.assertEqual(first.zones.tolist(), [0, 1, 2])
+        self.assertEqual(first.previous.tolist(), [-1, -1, -1])
+
+        update = engine.update([55, 60, 70])
+        self.assertEqual(update.zones.tolist(), [1, 1, 1])
+        self.assertEqual(update.previous.tolist(), [0, 1, 2])
+        self.assertEqual(update.changed.tolist(), [True, False, True])
+
+        self.assertFalse(engine.update([55, 60, 70]).changed.any())
+
+    def test_hysteresis_suppresses_flapping(self):
+        """Test that values oscillating around a threshold stay in their zone until they clear the band."""
+        engine = ZoneEngine(RANGES, hysteresis=2.0)
+        engine.update([49])
+        transitions = [engine.update([value]).changed[0] for value in (51, 49.5, 51.9, 48)]
+        self.assertEqual(transitions, [False, False, False, False])
+        self.assertEqual(engine.zones.tolist(), [0])
+
+        self.assertTrue(engine.update([52.5]).changed[0])
+        self.assertEqual(engine.zones.tolist(), [1])
+        # Back below the threshold, but still within the band of the new zone
+        self.assertFalse(engine.update([48.5]).changed[0])
+        self.assertTrue(engine.update([47.9]).changed[0])
+
+    def test_per_gauge_hysteresis(self):
+        """Test that each gauge can have its own hysteresis band."""
+        engine = ZoneEngine(RANGES, hysteresis=[0.0, 5.0])
+        engine.update([49, 49])
+        self.assertEqual(engine.update([52, 52]).changed.tolist(), [True, False])
+
+    def test_matches_scalar_reference(self):
+        """Test the vectorized engine against a per-value loop over random walks."""
+        rng = np.random.default_rng(5)
+        walks = np.clip(50 + np.cumsum(rng.normal(0, 3, (200, 50)), axis=0), 0, 100)
+        engine = ZoneEngine(RANGES, hysteresis=1.5)
+        state = [-1] * 50
+        for values in walks:
+            expected = []
+            for value, zone in zip(values, state):
+                if zone >= 0 and RANGES[zone]['min'] - 1.5 <= value <= RANGES[zone]['max'] + 1.5:
+                    expected.append(zone)
+                else:
+                    expected.append(reference_zone(value, RANGES))
+            self.assertEqual(engine.update(values).zones.tolist(), expected)
+            state = expected
+
+    def test_value_count_is_fixed(self):
+        """Test that updates must keep the same number of gauges until reset."""
+        engine = ZoneEngine(RANGES)
+        engine.update([1, 2])
+        with self.assertRaises(ValueError):
+            engine.update([1, 2, 3])
+        engine.reset()
+        self.assertEqual(len(engine.update([1, 2, 3]).zones), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
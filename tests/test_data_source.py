@@ -0,0 +1,139 @@
+import asyncio
+import time
+import unittest
+
+from dash_gauge_component import Gauge, GaugeDataSource, GaugePoller, ResultCache
+
+
+class FakeSource(GaugeDataSource):
+    """A local data source returning a fixed value after an injected latency."""
+
+    def __init__(self, id, value, latency=0.0, fail=False, timeout=None):
+        super().__init__(id, timeout=timeout)
+        self.value = value
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(f"source {self.id} failed")
+        return self.value
+
+
+class ConcurrencyProbe(GaugeDataSource):
+    """A data source recording how many fetches are in flight at once."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(self):
+        ConcurrencyProbe.in_flight += 1
+        ConcurrencyProbe.max_in_flight = max(ConcurrencyProbe.max_in_flight, ConcurrencyProbe.in_flight)
+        await asyncio.sleep(0.01)
+        ConcurrencyProbe.in_flight -= 1
+        return 1
+
+
+class TestGaugePoller(unittest.TestCase):
+    def test_sources_are_polled_concurrently(self):
+        """Test that 100 slow sources take about as long as one."""
+        sources = [FakeSource(f"gauge-{i}", i, latency=0.1) for i in range(100)]
+        poller = GaugePoller(sources, max_concurrency=100)
+
+        start = time.perf_counter()
+        results = poller.poll()
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 2.0, "Sources should be fetched concurrently.")
+        self.assertEqual([results[f"gauge-{i}"].value for i in range(100)], list(range(100)))
+        self.assertFalse(any(result.stale for result in results.values()))
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency fetches are in flight."""
+        ConcurrencyProbe.in_flight = ConcurrencyProbe.max_in_flight = 0
+        poller = GaugePoller([ConcurrencyProbe(f"gauge-{i}") for i in range(20)], max_concurrency=3)
+        poller.poll()
+        self.assertEqual(ConcurrencyProbe.max_in_flight, 3)
+
+    def test_timeout_falls_back_to_stale_value(self):
+        """Test that a timed out source reports its last cached value as stale."""
+        source = FakeSource("slow", 10, latency=0.0)
+        poller = GaugePoller([source], timeout=0.05)
+        self.assertEqual(poller.poll()["slow"].value, 10)
+
+        source.value = 20
+        source.latency = 1.0
+        result = poller.poll()["slow"]
+        self.assertTrue(result.stale)
+        self.assertEqual(result.value, 10)
+        self.assertIsInstance(result.error, asyncio.TimeoutError)
+
+    def test_per_source_timeout_overrides_default(self):
+        """Test that a source's own timeout takes precedence over the poller's."""
+        source = FakeSource("patient", 5, latency=0.1, timeout=1.0)
+        result = GaugePoller([source], timeout=0.01).poll()["patient"]
+        self.assertFalse(result.stale)
+        self.assertEqual(result.value, 5)
+
+    def test_failure_without_cache_has_no_value(self):
+        """Test that a failing source with nothing cached yields no value."""
+        poller = GaugePoller([FakeSource("broken", 1, fail=True)])
+        result = poller.poll()["broken"]
+        self.assertTrue(result.stale)
+        self.assertIsNone(result.value)
+        self.assertIsInstance(result.error, RuntimeError)
+        self.assertEqual(poller.values(), {})
+
+    def test_cache_is_shared_between_pollers(self):
+        """Test that a value fetched by one poller is a fallback for another."""
+        cache = ResultCache()
+        GaugePoller([FakeSource("shared", 42)], cache=cache).poll()
+        result = GaugePoller([FakeSource("shared", 0, fail=True)], cache=cache).poll()["shared"]
+        self.assertTrue(result.stale)
+        self.assertEqual(result.value, 42)
+
+    def test_duplicate_ids_are_rejected(self):
+        """Test that two sources cannot feed the same gauge."""
+        with self.assertRaises(ValueError):
+            GaugePoller([FakeSource("dup", 1), FakeSource("dup", 2)])
+
+    def test_update_figures(self):
+        """Test that polled values are fed into the gauges' figures."""
+        gauges = [Gauge(id="a", value=0), Gauge(id="b", value=0), Gauge(id="c", value=30)]
+        poller = GaugePoller([FakeSource("a", 25), FakeSource("b", 150), FakeSource("c", 0, fail=True)])
+
+        figures = poller.update_figures(gauges)
+
+        self.assertEqual(len(figures), 3)
+        self.assertEqual([gauge.value for gauge in gauges], [25, 100, 30])
+        self.assertEqual(figures[0]['layout']['annotations'][-1]['text'], "25.0")
+        self.assertEqual(figures[2]['layout']['annotations'][-1]['text'], "30.0")
+
+    def test_dict_ids(self):
+        """Test that pattern-matching gauges with dict IDs can be polled, keyed as Dash stringifies their IDs."""
+        gauges = [Gauge(id={'type': 'cpu', 'index': i}, value=0) for i in range(2)]
+        poller = GaugePoller([FakeSource({'type': 'cpu', 'index': i}, 10 * (i + 1)) for i in range(2)])
+
+        self.assertEqual(poller.values(), {'{"index":0,"type":"cpu"}': 10, '{"index":1,"type":"cpu"}': 20})
+        poller.update_figures(gauges)
+        self.assertEqual([gauge.value for gauge in gauges], [10, 20])
+        with self.assertRaises(ValueError):
+            GaugePoller([FakeSource({'type': 'cpu', 'index': 0}, 1), FakeSource({'index': 0, 'type': 'cpu'}, 2)])
+
+    def test_poll_async_in_running_loop(self):
+        """Test that poll_async serves code already running in an event loop, where poll cannot."""
+        poller = GaugePoller([FakeSource("a", 25)])
+
+        async def callback():
+            with self.assertRaises(RuntimeError):
+                poller.poll()
+            return await poller.poll_async()
+
+        self.assertEqual(asyncio.run(callback())["a"].value, 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
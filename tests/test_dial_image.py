@@ -0,0 +1,129 @@
+import base64
+import io
+import re
+import unittest
+from unittest import mock
+from xml.etree import ElementTree
+
+import dash
+from dash import html
+from dash._utils import to_json
+import numpy as np
+import plotly.io as pio
+import pytest
+
+from dash_gauge_component import Gauge, build_gauges_parallel, serve_dials
+from dash_gauge_component import dial
+from dash_gauge_component.dial import DIAL_EXTENT, DIAL_SIZE
+from tests.helpers import COLOR_RANGES
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def make_gauge(**kwargs):
+    return Gauge(**{'id': "dial-gauge", 'value': 40, 'color_ranges': COLOR_RANGES, 'start_angle': -150,
+                    'end_angle': 150, **kwargs})
+
+
+class TestDialImage(unittest.TestCase):
+    def test_figure_holds_only_live_geometry(self):
+        """Test that the figure has the dial as an image and only the needle, center dot and value text."""
+        figure = make_gauge(dial_image=True).children[0].figure.to_dict()
+        self.assertEqual([trace['mode'] for trace in figure['data']], ['lines', 'markers'])
+        self.assertEqual(len(figure['layout']['annotations']), 1)
+        image, = figure['layout']['images']
+        self.assertTrue(image['source'].startswith('data:image/svg+xml;base64,'))
+
+        gauge = make_gauge(dial_image=True)
+        locations = [tuple(op['location']) for op in gauge.needle_patch(90).to_plotly_json()['operations']]
+        self.assertEqual(locations[:2], [('data', 0, 'x'), ('data', 0, 'y')])
+
+    def test_dial_matches_full_geometry(self):
+        """Test that the image draws every dial trace of the full-geometry figure at the same place and style."""
+        full = make_gauge().children[0].figure.to_dict()
+        dial_traces = full['data'][:-2]  # Without the needle and the center dot
+        source = make_gauge(dial_image=True).children[0].figure.layout.images[0].source
+        svg = ElementTree.fromstring(base64.b64decode(source.split(',', 1)[1]))
+
+        scale = DIAL_SIZE / (2 * DIAL_EXTENT)
+        paths = iter(svg.findall(f'{SVG}path'))
+        texts = svg.findall(f'{SVG}text')
+        for trace in dial_traces:
+            if trace['mode'] == 'text':
+                self.assertEqual([text.text for text in texts], list(trace['text']))
+                np.testing.assert_allclose([float(text.get('x')) / scale - DIAL_EXTENT for text in texts],
+                                           trace['x'], atol=0.01)
+                self.assertEqual({text.get('fill') for text in texts}, {trace['textfont']['color']})
+                continue
+            path = next(paths)
+            points = np.array(re.findall(r'(-?[\d.]+) (-?[\d.]+)', path.get('d')), dtype=float)
+            np.testing.assert_allclose(points[:, 0] / scale - DIAL_EXTENT, trace['x'], atol=0.01)
+            np.testing.assert_allclose(DIAL_EXTENT - points[:, 1] / scale, trace['y'], atol=0.01)
+            self.assertEqual(path.get('stroke'), trace['line']['color'])
+            self.assertEqual(float(path.get('stroke-width')), trace['line']['width'])
+            self.assertEqual(path.get('fill'), trace.get('fillcolor', 'none'))
+        self.assertIsNone(next(paths, None))
+
+    def test_rendered_dial_looks_like_full_geometry(self):
+        """Test that, at the size the dial is drawn for, the image renders like the full-geometry figure."""
+        image_module = pytest.importorskip('PIL.Image')
+        margin = 20  # The margins of the gauge template
+        images = []
+        for gauge in (make_gauge(), make_gauge(dial_image=True)):
+            try:
+                png = pio.to_image(gauge.children[0].figure, format='png', width=DIAL_SIZE + 2 * margin,
+                                   height=DIAL_SIZE + 2 * margin)
+            except (ImportError, RuntimeError, ValueError) as error:  # No kaleido, or no browser for it
+                self.skipTest(f"Static image export is unavailable: {error}")
+            images.append(np.asarray(image_module.open(io.BytesIO(png)).convert('RGB'), dtype=int))
+        differing = np.abs(images[0] - images[1]).max(axis=-1) > 64
+        self.assertLess(differing.mean(), 0.03, "The dial image should only differ from the geometry by antialiasing.")
+
+    def test_dials_are_served_and_shared(self):
+        """Test that gauges with the same dial link to the same image, served with long-lived caching."""
+        app = dash.Dash(__name__)
+        prefix = serve_dials(app)
+        first, second = (make_gauge(id=f"gauge-{i}", value=i * 10, dial_image=prefix) for i in range(2))
+        recolored = make_gauge(id="recolored", dial_image=prefix, needle_color='#0000FF',
+                               color_ranges=[{'min': 0, 'max': 100, 'color': '#123456'}])
+        source = first.children[0].figure.layout.images[0].source
+        self.assertEqual(second.children[0].figure.layout.images[0].source, source)
+        self.assertNotEqual(recolored.children[0].figure.layout.images[0].source, source)
+
+        app.layout = html.Div([first, second, recolored])
+        client = app.server.test_client()
+        response = client.get(source)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'image/svg+xml')
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('#FFFF00', response.get_data(as_text=True))
+        self.assertEqual(client.get(f"{prefix}0000000000000000.svg").status_code, 404)
+
+    def test_process_built_dials_are_served(self):
+        """Test that dials drawn in worker processes are drawn again where they are served."""
+        app = dash.Dash(__name__)
+        prefix = serve_dials(app)
+        with mock.patch.dict(dial._dials, clear=True), mock.patch.dict(dial._svgs, clear=True):
+            gauges = build_gauges_parallel([{'id': f"built-{i}", 'value': i, 'color_ranges': COLOR_RANGES,
+                                             'dial_image': prefix} for i in range(2)],
+                                           executor='process', max_workers=2)
+            app.layout = html.Div(gauges)
+            source = gauges[0].children[0].figure['layout']['images'][0]['source']
+            self.assertEqual(app.server.test_client().get(source).status_code, 200)
+
+    def test_dial_cache_is_bounded(self):
+        """Test that only the most recently used dials are kept, and that gauges serialized for a page register theirs again."""
+        with mock.patch.dict(dial._dials, clear=True), mock.patch.dict(dial._svgs, clear=True), \
+                mock.patch.object(dial, 'MAX_DIALS', 2):
+            gauges = [make_gauge(id=f"gauge-{i}", dial_image='/dials/', max_value=100 + i) for i in range(3)]
+            sources = [gauge.children[0].figure.layout.images[0].source for gauge in gauges]
+            self.assertEqual(len(dial._dials), 2)
+            self.assertEqual({f"/dials/{content_hash}.svg" for content_hash in dial._svgs}, set(sources[1:]))
+
+            to_json(html.Div(gauges[:1]))
+            self.assertEqual(len(dial._dials), 2)
+            self.assertIn(sources[0], {f"/dials/{content_hash}.svg" for content_hash in dial._svgs})
+
+
+if __name__ == "__main__":
+    unittest.main()
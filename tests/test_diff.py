@@ -0,0 +1,82 @@
+import copy
+import random
+import unittest
+
+from dash import Patch
+
+from dash_gauge_component import Gauge
+from tests.helpers import apply_patch
+
+COLORS = ['#FF0000', '#FFFF00', '#00FF00', '#1f77b4', '#FF5733']
+
+
+def random_spec(rng):
+    """A random gauge configuration."""
+    boundaries = sorted(rng.sample(range(1, 100), rng.randint(0, 3)))
+    edges = [0] + boundaries + [100]
+    spec = {
+        'id': 'gauge',
+        'value': rng.uniform(0, 100),
+        'color_ranges': [{'min': lo, 'max': hi, 'color': rng.choice(COLORS)} for lo, hi in zip(edges, edges[1:])],
+        'needle_color': rng.choice(COLORS),
+        'show_value': rng.random() < 0.8,
+        'value_font_color': rng.choice(['auto', 'rgba(0,0,0,0.8)']),
+    }
+    if rng.random() < 0.3:
+        spec['needle_thickness'] = rng.choice([2.0, 8.0, 12.0])
+    if rng.random() < 0.3:
+        spec['start_angle'], spec['end_angle'] = rng.choice([(225, -45), (180, 0), (-90, 90)])
+    if rng.random() < 0.3:
+        spec['tick_font_color'] = rng.choice(COLORS)
+    return spec
+
+
+class TestGaugeDiff(unittest.TestCase):
+    def test_applying_patch_equals_full_rebuild(self):
+        """Property: for random pairs of configurations, old figure + diff == new figure."""
+        rng = random.Random(20240601)
+        for _ in range(40):
+            old_spec, new_spec = random_spec(rng), random_spec(rng)
+            patch = Gauge.diff(old_spec, new_spec)
+            self.assertIsInstance(patch, Patch)
+            self.assertEqual(apply_patch(Gauge._figure_dict(old_spec), patch), Gauge._figure_dict(new_spec),
+                             f"Patch from {old_spec} to {new_spec} does not rebuild the new figure.")
+
+    def test_identical_specs_give_empty_patch(self):
+        """Test that nothing is sent when the configuration did not change."""
+        spec = random_spec(random.Random(1))
+        self.assertEqual(Gauge.diff(spec, dict(spec)).to_plotly_json()['operations'], [])
+
+    def test_recolor_only_touches_arc_colors(self):
+        """Test that recoloring ranges only assigns the colors of the recolored arcs."""
+        ranges = [
+            {'min': 0, 'max': 50, 'color': '#FF0000'},
+            {'min': 50, 'max': 80, 'color': '#FFFF00'},
+            {'min': 80, 'max': 100, 'color': '#00FF00'},
+        ]
+        recolored = copy.deepcopy(ranges)
+        recolored[1]['color'] = '#FF5733'
+
+        operations = Gauge.diff({'value': 30, 'color_ranges': ranges},
+                                {'value': 30, 'color_ranges': recolored}).to_plotly_json()['operations']
+
+        # The background circle is trace 0, so the second arc is trace 2
+        self.assertEqual(operations, [
+            {'operation': 'Assign', 'location': ['data', 2, 'line', 'color'], 'params': {'value': '#FF5733'}},
+        ])
+
+    def test_value_change_only_touches_needle_and_text(self):
+        """Test that a value change leaves the dial untouched."""
+        old_figure = Gauge._figure_dict({'value': 10})
+        operations = Gauge.diff({'value': 10}, {'value': 90}).to_plotly_json()['operations']
+        needle_index = len(old_figure['data']) - 2
+        value_annotation_index = len(old_figure['layout']['annotations']) - 1
+        self.assertEqual({tuple(op['location']) for op in operations}, {
+            ('data', needle_index, 'x'),
+            ('data', needle_index, 'y'),
+            ('layout', 'annotations', value_annotation_index, 'text'),
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
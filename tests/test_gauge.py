@@ -5,6 +5,20 @@ from dash import html
 from dash_gauge_component import Gauge
 
 
+def resizes_with_container(graph):
+    """
+    Whether dcc.Graph resizes a graph when its container resizes, as its ``isResponsive`` decides.
+
+    Its resize observer only relays out responsive graphs: ``responsive`` if a boolean, else, for
+    'auto', ``config.responsive`` with an autosized layout of unset width or height.
+    """
+    if isinstance(graph.responsive, bool):
+        return graph.responsive
+    layout = graph.figure.to_dict()['layout'] if hasattr(graph.figure, 'to_dict') else graph.figure.get('layout')
+    return bool(graph.config.get('responsive') and (
+        not layout or (layout.get('autosize', True) and (layout.get('height') is None or layout.get('width') is None))))
+
+
 class TestGauge(unittest.TestCase):
     def test_initialization(self):
         """Test that the Gauge component initializes correctly with default values."""
@@ -125,6 +139,18 @@ class TestGauge(unittest.TestCase):
             if annotation.text == "$99.99":  # The formatted value should be "$99.99"
                 self.assertEqual(annotation.text, "$99.99", "Currency formatting is incorrect.")
 
+    def test_read_only(self):
+        """Test that read-only gauges are static plots that still resize with their container."""
+        graph = Gauge(id="wallboard-gauge", value=50, read_only=True).children[0]
+        self.assertTrue(graph.config['staticPlot'], "Read-only gauges should be static plots.")
+        self.assertTrue(resizes_with_container(graph), "Read-only gauges should resize with their container.")
+        self.assertEqual(graph.figure, Gauge(id="other", value=50).children[0].figure,
+                         "The read-only mode should not change the figure.")
+
+        graph = Gauge(id="interactive-gauge", value=50).children[0]
+        self.assertNotIn('staticPlot', graph.config, "Gauges should be interactive by default.")
+        self.assertTrue(resizes_with_container(graph), "Gauges should resize with their container.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import unittest
+
+from dash import ALL, Patch, no_update
+
+from dash_gauge_component import Gauge, GaugeGroup, GroupUpdateStats
+from tests.helpers import COLOR_RANGES, make_gauges as make_spread_gauges
+
+
+def make_gauges(count):
+    return make_spread_gauges(count, id_type='load-gauge', value=10)
+
+
+class TestGaugeGroup(unittest.TestCase):
+    def test_output_pattern(self):
+        """Test that the group addresses the graphs of all its gauges."""
+        group = GaugeGroup(make_gauges(3))
+        self.assertEqual(group.output.component_id, {'type': 'load-gauge', 'index': ALL, 'subcomponent': 'graph'})
+        self.assertEqual(group.output.component_property, 'figure')
+        self.assertEqual(make_gauges(1)[0].children[0].id,
+                         {'type': 'load-gauge', 'index': 0, 'subcomponent': 'graph'})
+
+    def test_only_changed_gauges_are_updated(self):
+        """Test that unchanged and missing gauges get no_update."""
+        group = GaugeGroup(make_gauges(200))
+        values = {i: 10 for i in range(200)}
+        values.update({i: 50 for i in range(0, 200, 17)})  # 12 gauges moved
+
+        updates = group.update(values)
+
+        self.assertEqual(len(updates), 200)
+        self.assertEqual(group.last_stats, GroupUpdateStats(updated=12, skipped=188))
+        for i, update in enumerate(updates):
+            if i % 17 == 0:
+                self.assertIsInstance(update, Patch)
+            else:
+                self.assertIs(update, no_update)
+
+        # Sending the same values again updates nothing
+        group.update(values)
+        self.assertEqual(group.last_stats, GroupUpdateStats(updated=0, skipped=200))
+
+    def test_needle_only_patch(self):
+        """Test that an update only moves the needle and changes the value text."""
+        gauge = make_gauges(1)[0]
+        figure = gauge.children[0].figure
+        needle_index = len(figure.data) - 2
+        value_index = len(figure.layout.annotations) - 1
+
+        patch = GaugeGroup([gauge]).update({0: 75})[0]
+
+        locations = [tuple(op['location']) for op in patch.to_plotly_json()['operations']]
+        self.assertEqual(locations, [
+            ('data', needle_index, 'x'),
+            ('data', needle_index, 'y'),
+            ('layout', 'annotations', value_index, 'text'),
+            ('layout', 'annotations', value_index, 'font', 'color'),
+        ])
+        expected = Gauge(id='expected', value=75, color_ranges=COLOR_RANGES).children[0].figure
+        operations = patch.to_plotly_json()['operations']
+        self.assertEqual(operations[0]['params']['value'], list(expected.data[needle_index].x))
+        self.assertEqual(operations[2]['params']['value'], "75.0")
+
+    def test_values_are_clamped_and_tolerance_applies(self):
+        """Test that changes within tolerance, including after clamping, are skipped."""
+        group = GaugeGroup(make_gauges(2), tolerance=0.5)
+        group.update({0: 10.4, 1: 150})
+        self.assertEqual(group.last_stats, GroupUpdateStats(updated=1, skipped=1))
+        group.update({1: 120})  # Clamped to 100, as already sent
+        self.assertEqual(group.last_stats, GroupUpdateStats(updated=0, skipped=2))
+
+    def test_concurrent_updates_send_each_change_once(self):
+        """Test that callbacks racing in several threads send each changed value once."""
+        group = GaugeGroup(make_gauges(50))
+        start = threading.Barrier(8)
+        updated = []
+
+        def update():
+            start.wait()
+            updates = group.update({i: 90 for i in range(50)})
+            updated.append(sum(update is not no_update for update in updates))
+
+        threads = [threading.Thread(target=update) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(updated), 50)
+
+    def test_without_skipping_unchanged(self):
+        """Test that, for several workers, every gauge given a value gets a patch."""
+        group = GaugeGroup(make_gauges(3), skip_unchanged=False)
+        group.update({0: 10, 1: 10})
+        self.assertEqual(group.last_stats, GroupUpdateStats(updated=2, skipped=1))
+
+    def test_outputs_list_order(self):
+        """Test that updates follow the callback's output order."""
+        group = GaugeGroup(make_gauges(3))
+        outputs_list = [{'id': {'type': 'load-gauge', 'index': i, 'subcomponent': 'graph'}, 'property': 'figure'}
+                        for i in (2, 0, 1)]
+        updates = group.update({2: 90}, outputs_list)
+        self.assertIsInstance(updates[0], Patch)
+        self.assertIs(updates[1], no_update)
+        self.assertIs(updates[2], no_update)
+
+    def test_invalid_groups(self):
+        """Test that gauges without suitable IDs and unknown indices are rejected."""
+        with self.assertRaises(ValueError):
+            GaugeGroup([Gauge(id='plain-id', value=1)])
+        with self.assertRaises(ValueError):
+            GaugeGroup(make_gauges(2) + make_gauges(1))
+        with self.assertRaises(KeyError):
+            GaugeGroup(make_gauges(2)).update({5: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import random
+import time
+import unittest
+
+import numpy as np
+
+from dash_gauge_component import Gauge, RollingWindow
+
+
+class TestRollingWindow(unittest.TestCase):
+    def test_matches_brute_force(self):
+        """Test min, max and mean against recomputing them over the window after every append."""
+        rng = random.Random(3)
+        for capacity in (1, 2, 7, 50):
+            window = RollingWindow(capacity)
+            stream = []
+            for _ in range(500):
+                value = rng.choice([rng.uniform(-100, 100), rng.randint(0, 3)])  # Include repeated values
+                window.append(value)
+                stream.append(value)
+                recent = stream[-capacity:]
+                self.assertEqual(len(window), len(recent))
+                self.assertEqual(window.min, min(recent))
+                self.assertEqual(window.max, max(recent))
+                self.assertAlmostEqual(window.mean, sum(recent) / len(recent), places=9)
+            np.testing.assert_array_equal(window.values(), stream[-capacity:])
+
+    def test_stats_with_previews_append(self):
+        """Test that stats_with gives the statistics after an append, without appending."""
+        rng = random.Random(5)
+        for capacity in (1, 2, 7):
+            window = RollingWindow(capacity)
+            for _ in range(200):
+                value = rng.choice([rng.uniform(-100, 100), rng.randint(0, 3)])
+                low, high, mean = window.stats_with(value)
+                count = len(window)
+                window.append(value)
+                self.assertEqual(count + (count < capacity), len(window))
+                self.assertEqual((low, high), (window.min, window.max))
+                self.assertAlmostEqual(mean, window.mean, places=9)
+
+    def test_empty_window(self):
+        """Test that an empty window has no statistics."""
+        window = RollingWindow(5)
+        self.assertEqual(len(window), 0)
+        self.assertEqual(window.values().tolist(), [])
+        with self.assertRaises(ValueError):
+            window.min
+        with self.assertRaises(ValueError):
+            RollingWindow(0)
+
+    def test_append_cost_does_not_grow_with_window(self):
+        """Test that appending to a long window costs about the same as to a short one."""
+        values = np.random.default_rng(0).uniform(0, 100, 20000).tolist()
+
+        def append_time(capacity):
+            window = RollingWindow(capacity)
+            start = time.perf_counter()
+            for value in values:
+                window.append(value)
+                window.min, window.max, window.mean
+            return time.perf_counter() - start
+
+        self.assertLess(append_time(10000), append_time(10) * 3)
+
+
+class TestHistoryBand(unittest.TestCase):
+    def test_band_follows_recent_values(self):
+        """Test that the band spans the min and max of the window and the marker sits at the mean."""
+        gauge = Gauge(id="history-gauge", value=20, show_history=True, history_window=3)
+        for value in (80, 50, 60):  # 20 falls out of the window
+            gauge.value = value
+        self.assertEqual((gauge.history.min, gauge.history.max, gauge.history.mean), (50, 80, 190 / 3))
+
+        figure = gauge._create_gauge_figure()
+        band, mean_marker = figure.data[-4], figure.data[-3]
+        self.assertEqual(band.fill, 'toself')
+
+        min_angle, max_angle, mean_angle = gauge._value_angles([50, 80, 190 / 3])
+        self.assertAlmostEqual(np.arctan2(band.y[0], band.x[0]), min_angle)
+        self.assertAlmostEqual(np.arctan2(band.y[49], band.x[49]), max_angle)
+        self.assertAlmostEqual(np.arctan2(mean_marker.y[1], mean_marker.x[1]), mean_angle)
+
+    def test_patch_only_moves_band_and_needle(self):
+        """Test that a patch sends the band, mean marker and needle, with a size independent of the window."""
+        sizes = []
+        for window in (5, 5000):
+            gauge = Gauge(id="history-gauge", value=20, show_history=True, history_window=window)
+            band_index = len(gauge.children[0].figure.data) - 4
+            operations = gauge.needle_patch(70).to_plotly_json()['operations']
+            locations = [tuple(op['location']) for op in operations]
+            self.assertEqual(locations, [
+                ('data', band_index, 'x'), ('data', band_index, 'y'),
+                ('data', band_index + 1, 'x'), ('data', band_index + 1, 'y'),
+                ('data', band_index + 2, 'x'), ('data', band_index + 2, 'y'),
+                ('layout', 'annotations', 0, 'text'),
+                ('layout', 'annotations', 0, 'font', 'color'),
+            ])
+            sizes.append(sum(len(op['params']['value']) for op in operations[:2]))
+        self.assertEqual(sizes[0], sizes[1])
+
+    def test_failed_change_is_not_recorded(self):
+        """Test that a value change whose figure fails to render leaves the history and value as they were."""
+        gauge = Gauge(id="history-gauge", value=20, show_history=True, history_window=5, value_font_color="auto",
+                      color_ranges=[{'min': 0, 'max': 30, 'color': '#FF0000'}, {'min': 60, 'max': 100, 'color': '#00FF00'}])
+        with self.assertRaises(ValueError):
+            gauge.value = 45  # Outside every color range
+        self.assertEqual(gauge.value, 20)
+        self.assertEqual(gauge.history.values().tolist(), [20])
+
+    def test_only_first_needle_changes_are_recorded(self):
+        """Test that updating only other needles of a multi-needle gauge leaves the band as it was."""
+        gauge = Gauge(id="history-gauge", value=[20, 50], show_history=True, history_window=5)
+        gauge.value = {1: 70}
+        gauge.needle_patch({1: 80})
+        self.assertEqual(gauge.history.values().tolist(), [20])
+        gauge.value = {0: 40, 1: 10}
+        gauge.value = [60, 10]
+        self.assertEqual(gauge.history.values().tolist(), [20, 40, 60])
+        self.assertEqual(gauge._state[1], (20, 60, 40))
+
+    def test_no_history_by_default(self):
+        """Test that gauges without history have no band."""
+        gauge = Gauge(id="plain-gauge", value=20)
+        self.assertIsNone(gauge.history)
+        self.assertEqual(len(gauge.children[0].figure.data), len(Gauge(id="other", value=90).children[0].figure.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
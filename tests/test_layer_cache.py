@@ -0,0 +1,239 @@
+import json
+import shutil
+import subprocess
+import unittest
+from unittest import mock
+
+import dash
+from dash import html
+from dash._utils import to_json
+
+from dash_gauge_component import Gauge, build_gauges_parallel, layer_cache, serve_static_layers
+from dash_gauge_component.layer_cache import LAYERS_ROUTE, RESTORE_FIGURES, STATIC_TRACE_STUB
+from tests.helpers import COLOR_RANGES, apply_patch, make_specs
+
+# Runs RESTORE_FIGURES over two page loads in node, with an in-memory localStorage, a fetch answering
+# RESPONSES by decoded URL (404 otherwise), and set_props triggering the callback again, at most 10 times.
+# FIGURES are the figures of the first page load as they are when the callback runs, e.g. after a patch.
+NODE_PAGE_LOADS = """
+const localStorage = {};  // Items as own enumerable properties, as in browsers
+Object.defineProperties(localStorage, {
+    getItem: {value: key => Object.prototype.hasOwnProperty.call(localStorage, key) ? localStorage[key] : null},
+    setItem: {value: (key, value) => { localStorage[key] = String(value); }},
+    removeItem: {value: key => { delete localStorage[key]; }},
+});
+const responses = RESPONSES;
+const requests = [];
+global.fetch = async url => {
+    url = decodeURIComponent(url);
+    requests.push(url);
+    return url in responses ? {ok: true, json: async () => responses[url]} : {ok: false};
+};
+const restore = RESTORE;
+
+async function pageLoad(stores, figures) {
+    let triggers = [];
+    global.window.dash_clientside.set_props = (id, props) => triggers.push({id, props});
+    const runs = [await restore(...stores, ...figures)];
+    while (triggers.length && runs.length <= 10) {
+        stores = [Object.assign({}, stores[0], triggers[0].props.data)].concat(stores.slice(1));
+        triggers = [];
+        runs.push(await restore(...stores, ...figures));
+    }
+    return runs;
+}
+
+(async () => {
+    global.window = {localStorage, dash_clientside: {
+        no_update: null,
+        callback_context: {inputs_list: INPUTS.map(id => ({id, property: 'data'}))},
+    }};
+    const first = await pageLoad(STORES, FIGURES);
+    const firstRequests = requests.splice(0);
+    window.dashGaugeLayers = undefined;  // A new page load, with only localStorage left
+    const second = await pageLoad(STORES, PLACEHOLDERS);
+    console.log(JSON.stringify({first, firstRequests, second, secondRequests: requests}));
+})();
+"""
+
+
+def make_app(gauges):
+    app = dash.Dash(__name__)
+    app.layout = html.Div(gauges)
+    serve_static_layers(app, gauges)
+    return app
+
+
+def serialized(gauge):
+    return json.loads(to_json(gauge))['props']['children']
+
+
+class TestLayerCache(unittest.TestCase):
+    def setUp(self):
+        self.gauges = [Gauge(id=f"cached-{i}", value=i * 30, color_ranges=COLOR_RANGES, cache_static_layers=True)
+                       for i in range(3)]
+
+    def test_page_carries_only_dynamic_layers(self):
+        """Test that the graph gets stubs for the static traces and the store the static layers' hash."""
+        gauge = self.gauges[1]
+        graph, store = serialized(gauge)
+        figure = graph['props']['figure']
+        static_traces = len(gauge._static_layers_dict()['data'])
+        self.assertEqual(figure['data'][:static_traces], [STATIC_TRACE_STUB] * static_traces)
+        self.assertEqual([trace['mode'] for trace in figure['data'][static_traces:]], ['lines', 'markers'])
+        self.assertEqual(figure['layout']['annotations'][-1]['text'], '30.0')
+        self.assertEqual(store['props'], {'id': Gauge.layers_id(gauge.id), 'data': {'hash': store['props']['data']['hash']}})
+
+        # The page carries the current value; the gauge itself keeps its whole figure
+        gauge.value = 80
+        self.assertEqual(serialized(gauge)[0]['props']['figure']['layout']['annotations'][-1]['text'], '80.0')
+        self.assertEqual(len(gauge.children[0].figure['data']), len(Gauge(id="plain", value=80,
+                                                                             color_ranges=COLOR_RANGES).render()['data']))
+        self.assertEqual(Gauge.layers_id({'type': 'gauge', 'index': 1}),
+                         {'type': 'gauge', 'index': 1, 'subcomponent': 'layers'})
+
+    def test_layers_are_shared_and_served(self):
+        """Test that gauges with the same dial share one hash, served once with long-lived caching."""
+        hashes = {serialized(gauge)[1]['props']['data']['hash'] for gauge in self.gauges}
+        self.assertEqual(len(hashes), 1)
+        content_hash, = hashes
+        other = Gauge(id="other", value=10, cache_static_layers=True)
+        self.assertNotEqual(serialized(other)[1]['props']['data']['hash'], content_hash)
+
+        client = make_app(self.gauges).server.test_client()
+        response = client.get(f"{LAYERS_ROUTE}?hashes={content_hash},{content_hash}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        layers = response.get_json()
+        self.assertEqual(list(layers), [content_hash])
+        self.assertEqual(len(layers[content_hash]['data']), len(self.gauges[0]._static_layers_dict()['data']))
+
+        # A response missing some hashes must not be cached, or they could never be restored
+        response = client.get(f"{LAYERS_ROUTE}?hashes={content_hash},0000000000000000")
+        self.assertEqual(response.headers['Cache-Control'], 'no-store')
+        self.assertEqual(response.get_json(), layers)
+
+        layout = client.get('/_dash-layout').get_data()
+        self.assertLess(len(layout), len(to_json(html.Div([Gauge(id=f"plain-{i}", value=i * 30, color_ranges=COLOR_RANGES)
+                                                          for i in range(3)]))) / 10)
+
+    def test_layers_by_gauge(self):
+        """Test that the current layers of registered gauges are served by store ID, never cached."""
+        client = make_app(self.gauges + [Gauge(id={'type': 'cached', 'index': 1}, value=10, cache_static_layers=True)]
+                          ).server.test_client()
+        store_ids = [Gauge.layers_id('cached-1'), Gauge.layers_id('unknown'),
+                     {'subcomponent': 'layers', 'index': 1, 'type': 'cached'}]
+        response = client.get(LAYERS_ROUTE, query_string={'gauges': json.dumps(store_ids)})
+        self.assertEqual(response.headers['Cache-Control'], 'no-store')
+        layers = response.get_json()
+        self.assertEqual(layers[0], json.loads(to_json(self.gauges[1]._static_layers_dict())))
+        self.assertIsNone(layers[1])
+        self.assertEqual(len(layers[2]['data']), len(Gauge(id="plain", value=10)._static_layers_dict()['data']))
+        self.assertEqual(client.get(LAYERS_ROUTE, query_string={'gauges': 'not json'}).status_code, 400)
+
+    def test_serve_static_layers_checks_gauges(self):
+        """Test that only gauges built with cache_static_layers can be registered."""
+        with self.assertRaises(ValueError):
+            serve_static_layers(dash.Dash(__name__), [])
+        with self.assertRaises(ValueError):
+            serve_static_layers(dash.Dash(__name__), [Gauge(id="plain", value=10)])
+
+    def test_callback_allows_other_figure_outputs(self):
+        """Test that the composing callback shares the graphs' figure outputs with other callbacks."""
+        app = make_app(self.gauges)
+        callback, = app._callback_list
+        self.assertEqual(callback['inputs'][0], {'id': 'cached-0-layers', 'property': 'data'})
+        self.assertEqual(callback['state'][0], {'id': 'cached-0-graph', 'property': 'figure'})
+        outputs = callback['output'].strip('.').split('...')
+        self.assertEqual(len(outputs), len(self.gauges))
+        self.assertTrue(all(output.startswith(f'cached-{i}-graph.figure@') for i, output in enumerate(outputs)))
+        self.assertFalse(callback['prevent_initial_call'])  # Still composes the figures on page load
+
+    def run_page_loads(self, gauges, responses, figures=None):
+        """Run the page loads of NODE_PAGE_LOADS for the gauges, returning its output."""
+        node = shutil.which('node')
+        if node is None:
+            self.skipTest("node is not installed")
+        stores = [serialized(gauge)[1]['props']['data'] for gauge in gauges]
+        placeholders = [serialized(gauge)[0]['props']['figure'] for gauge in gauges]
+        script = (NODE_PAGE_LOADS.replace('RESPONSES', json.dumps(responses))
+                  .replace('INPUTS', json.dumps([Gauge.layers_id(gauge.id) for gauge in gauges]))
+                  .replace('STORES', json.dumps(stores)).replace('PLACEHOLDERS', json.dumps(placeholders))
+                  .replace('FIGURES', json.dumps(figures or placeholders))
+                  .replace('RESTORE', RESTORE_FIGURES.replace('__LAYERS_URL__', json.dumps(LAYERS_ROUTE))))
+        process = subprocess.run([node], input=script, capture_output=True, text=True)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        return json.loads(process.stdout)
+
+    def test_browser_composes_figures(self):
+        """Test that the browser composes the gauges' figures, fetching the static layers on the first page load only."""
+        content_hash = serialized(self.gauges[0])[1]['props']['data']['hash']
+        url = f"{LAYERS_ROUTE}?hashes={content_hash}"
+        layers = make_app(self.gauges).server.test_client().get(url).get_json()
+        # A needle patch reaching the first gauge before its static layers
+        placeholders = [serialized(gauge)[0]['props']['figure'] for gauge in self.gauges]
+        patched = [apply_patch(placeholders[0], self.gauges[0].needle_patch(90))] + placeholders[1:]
+        result = self.run_page_loads(self.gauges, {url: layers}, patched)
+
+        # The first page load fetches the layers, then composes the figures when triggered again
+        self.assertEqual(result['firstRequests'], [url])
+        fetching, composed = result['first']
+        self.assertEqual(fetching, [None] * len(self.gauges))
+        expected = [json.loads(to_json(gauge.render())) for gauge in self.gauges]
+        self.assertEqual(composed, expected)  # Including the patched needle of the first gauge
+
+        # The next page load composes the figures from localStorage, without fetching nor triggering again
+        self.assertEqual(result['secondRequests'], [])
+        self.assertEqual(result['second'], [expected])
+
+    def test_browser_asks_for_unknown_layers_once(self):
+        """Test that layers the server does not know by hash are asked for by gauge, once, and still composed."""
+        other = Gauge(id="other", value=40, max_value=200, cache_static_layers=True)
+        gauges = self.gauges[:1] + [other]
+        app = make_app(gauges)
+        hashes = [serialized(gauge)[1]['props']['data']['hash'] for gauge in gauges]
+        hashes_url = f"{LAYERS_ROUTE}?hashes={','.join(hashes)}"
+        gauges_url = f"{LAYERS_ROUTE}?gauges={json.dumps([Gauge.layers_id('other')], separators=(',', ':'))}"
+        client = app.server.test_client()
+        known = client.get(hashes_url).get_json()
+        del known[hashes[1]]  # As if dropped from the server's cache
+        result = self.run_page_loads(gauges, {hashes_url: known, gauges_url: client.get(gauges_url).get_json()})
+
+        self.assertEqual(result['firstRequests'], [hashes_url, gauges_url])
+        self.assertEqual(len(result['first']), 2)
+        self.assertEqual(result['first'][-1], [json.loads(to_json(gauge.render())) for gauge in gauges])
+
+        # A gauge the server does not know at all keeps its placeholder, without further requests
+        result = self.run_page_loads(gauges, {hashes_url: known})
+        self.assertEqual(result['firstRequests'], [hashes_url, gauges_url])
+        self.assertEqual(result['first'][-1], [json.loads(to_json(gauges[0].render())), None])
+        # The next page load asks again, only for what it lacks
+        self.assertEqual(result['secondRequests'], [f"{LAYERS_ROUTE}?hashes={hashes[1]}", gauges_url])
+
+    def test_figures_of_specs(self):
+        """Test that diffs and process-built gauges render specs with cache_static_layers."""
+        old_spec = {'value': 30, 'color_ranges': COLOR_RANGES, 'cache_static_layers': True}
+        new_spec = {**old_spec, 'value': 70}
+        self.assertEqual(apply_patch(Gauge._figure_dict(old_spec), Gauge.diff(old_spec, new_spec)),
+                         Gauge._figure_dict(new_spec))
+
+        specs = make_specs(3, cache_static_layers=True)
+        for gauge, spec in zip(build_gauges_parallel(specs, executor='process', max_workers=2), specs):
+            self.assertEqual(gauge.render(), Gauge(**spec).render())
+            self.assertTrue(gauge.cache_static_layers)
+
+    def test_layers_are_bounded(self):
+        """Test that only the most recently used layers are kept, and that gauges register theirs again."""
+        gauge = self.gauges[0]
+        content_hash = serialized(gauge)[1]['props']['data']['hash']
+        with mock.patch.object(layer_cache, 'MAX_LAYERS', 2):
+            for i in range(3):
+                serialized(Gauge(id=f"other-{i}", value=10, max_value=200 + i, cache_static_layers=True))
+            self.assertNotIn(content_hash, layer_cache._layers)
+            self.assertEqual(len(layer_cache._layers), 2)
+            self.assertEqual(serialized(gauge)[1]['props']['data']['hash'], content_hash)
+            self.assertIn(content_hash, layer_cache._layers)
+
+
+if __name__ == "__main__":
+    unittest.main()
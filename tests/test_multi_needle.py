@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from dash_gauge_component import Gauge, GaugeGroup
+
+
+class TestMultipleNeedles(unittest.TestCase):
+    def make_gauge(self, **kwargs):
+        return Gauge(
+            id="compare-gauge",
+            value=[60, 80, 45],  # current, target, last week
+            needle_color=['#000000', '#00AA00', '#999999'],
+            needle_thickness=[8.0, 4.0, 4.0],
+            needle_length=[0.85, 0.95, 0.7],
+            **kwargs
+        )
+
+    def test_needles_match_single_needle_gauges(self):
+        """Test that each needle is drawn as a single-needle gauge with the same style would draw it."""
+        gauge = self.make_gauge()
+        figure = gauge.children[0].figure
+        self.assertEqual(gauge.value, [60, 80, 45])
+        self.assertEqual(gauge.needle_count, 3)
+
+        needles = figure.data[-4:-1]
+        for needle, value, color, thickness, length in zip(
+                needles, [60, 80, 45], ['#000000', '#00AA00', '#999999'], [8.0, 4.0, 4.0], [0.85, 0.95, 0.7]):
+            single = Gauge(id="single", value=value, needle_color=color, needle_thickness=thickness,
+                           needle_length=length).children[0].figure.data[-2]
+            self.assertEqual(needle.fillcolor, color)
+            np.testing.assert_allclose(needle.x, single.x)
+            np.testing.assert_allclose(needle.y, single.y)
+
+        # The value text shows the first needle's value
+        self.assertEqual(figure.layout.annotations[-1].text, "60.0")
+        # One set of dial traces, not one per needle
+        self.assertEqual(len(figure.data), len(Gauge(id="single", value=60).children[0].figure.data) + 2)
+
+    def test_values_are_clamped_per_needle(self):
+        """Test that each needle's value is clamped to the gauge's range."""
+        gauge = Gauge(id="compare-gauge", value=[-5, 50, 150])
+        self.assertEqual(gauge.value, [0, 50, 100])
+        gauge.value = (10, 200, 30)
+        self.assertEqual(gauge.value, [10, 100, 30])
+
+    def test_patch_subset_of_needles(self):
+        """Test that a dict of needle index to value only patches those needles."""
+        gauge = self.make_gauge()
+        needle_index = len(gauge.children[0].figure.data) - 4
+
+        patch = gauge.needle_patch({1: 90})
+        locations = [tuple(op['location']) for op in patch.to_plotly_json()['operations']]
+        self.assertEqual(locations, [('data', needle_index + 1, 'x'), ('data', needle_index + 1, 'y')])
+        self.assertEqual(gauge.value, [60, 90, 45])
+
+        patch = gauge.needle_patch({0: 10, 2: 20})
+        locations = [tuple(op['location']) for op in patch.to_plotly_json()['operations']]
+        self.assertEqual(locations[:4], [('data', needle_index, 'x'), ('data', needle_index, 'y'),
+                                         ('data', needle_index + 2, 'x'), ('data', needle_index + 2, 'y')])
+        self.assertEqual(patch.to_plotly_json()['operations'][4]['params']['value'], "10.0")
+
+        # A full vector moves every needle
+        self.assertEqual(len(gauge.needle_patch([1, 2, 3]).to_plotly_json()['operations']), 8)
+
+    def test_needle_count_is_fixed(self):
+        """Test that values for another number of needles and out-of-range needle indices are rejected."""
+        gauge = self.make_gauge()
+        figure = gauge.children[0].figure
+        for value in (50, [1, 2], [1, 2, 3, 4], {3: 90}, {-1: 90}):
+            with self.assertRaises(ValueError):
+                gauge.value = value
+            with self.assertRaises(ValueError):
+                gauge.needle_patch(value)
+        self.assertEqual(gauge.value, [60, 80, 45])
+        self.assertIs(gauge.children[0].figure, figure)
+
+        single = Gauge(id="single-gauge", value=10)
+        with self.assertRaises(ValueError):
+            single.value = [10, 20]
+        single.needle_patch({0: 30})
+        self.assertEqual(single.value, 30)
+
+    def test_style_lengths_must_match(self):
+        """Test that per-needle styles need one item per needle."""
+        with self.assertRaises(ValueError):
+            Gauge(id="bad", value=[1, 2], needle_color=['#000000'])
+        with self.assertRaises(ValueError):
+            Gauge(id="bad", value=[])
+
+    def test_group_of_multi_needle_gauges(self):
+        """Test that groups detect changes in any needle."""
+        gauges = [Gauge(id={'type': 'compare', 'index': i}, value=[10, 20]) for i in range(2)]
+        group = GaugeGroup(gauges)
+        group.update({0: [10, 20], 1: [10, 25]})
+        self.assertEqual(tuple(group.last_stats), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from dash_gauge_component import Gauge, build_gauges_parallel
+from tests.helpers import make_specs
+
+
+class TestBuildGaugesParallel(unittest.TestCase):
+    def assert_matches_serial(self, gauges, specs):
+        self.assertEqual([gauge.id for gauge in gauges], [spec['id'] for spec in specs])
+        for gauge, spec in zip(gauges, specs):
+            self.assertIsInstance(gauge, Gauge)
+            expected = Gauge(**spec).children[0].figure.to_dict()
+            actual = gauge.children[0].figure
+            if not isinstance(actual, dict):
+                actual = actual.to_dict()
+            self.assertEqual(actual, expected, f"Figure of {gauge.id} differs from a serial build.")
+
+    def test_thread_pool(self):
+        """Test that a thread pool builds gauges in spec order, identical to a serial build."""
+        specs = make_specs(20)
+        self.assert_matches_serial(build_gauges_parallel(specs, executor='thread', max_workers=4), specs)
+
+    def test_process_pool(self):
+        """Test that a process pool builds gauges in spec order, identical to a serial build."""
+        specs = make_specs(8)
+        gauges = build_gauges_parallel(specs, executor='process', max_workers=2, chunksize=3)
+        self.assert_matches_serial(gauges, specs)
+
+    def test_existing_executor_is_reused(self):
+        """Test that a caller's executor is used and left open."""
+        specs = make_specs(4)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            self.assert_matches_serial(build_gauges_parallel(specs, executor=pool), specs)
+            # The pool must still accept work afterwards
+            self.assertEqual(pool.submit(len, specs).result(), 4)
+
+    def test_invalid_executor(self):
+        """Test that an unknown executor name is rejected."""
+        with self.assertRaises(ValueError):
+            build_gauges_parallel(make_specs(1), executor='gpu')
+
+
+if __name__ == "__main__":
+    unittest.main()
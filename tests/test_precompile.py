@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from dash_gauge_component import Gauge, PrecompiledGauges, precompile_gauges
+from dash_gauge_component import precompile
+from tests.helpers import COLOR_RANGES
+
+SPECS = [
+    {'id': 'basic', 'value': 75},
+    {'id': 'multi-color', 'value': 94, 'color_ranges': COLOR_RANGES, 'value_font_color': 'auto',
+     'value_format': "{:.0f}%", 'tick_label_radius': 1.2},
+    {'id': 'multi-color-2', 'value': 12, 'color_ranges': COLOR_RANGES, 'value_font_color': 'auto',
+     'value_format': "{:.0f}%", 'tick_label_radius': 1.2},
+    {'id': 'custom-angle', 'value': 60, 'start_angle': -90, 'end_angle': 90, 'show_value': False},
+]
+
+
+class TestPrecompiledGauges(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'gauges.dgpc')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build_matches_full_render(self):
+        """Test that gauges built from the artifact have the same figures as freshly rendered ones."""
+        # The two multi-color gauges only differ by id and value, so they share static layers
+        self.assertEqual(precompile_gauges(SPECS, self.path), 3)
+
+        with PrecompiledGauges(self.path) as artifact:
+            self.assertFalse(artifact.stale)
+            for spec, gauge in zip(SPECS, artifact.build_all(SPECS)):
+                self.assertIn(spec, artifact)
+                expected = Gauge(**spec).children[0].figure.to_dict()
+                self.assertEqual(gauge.children[0].figure, expected, f"Figure of {spec['id']} differs.")
+                self.assertEqual(gauge.value, spec['value'])
+
+    def test_changed_spec_is_rendered(self):
+        """Test that a spec changed since precompiling misses the artifact and is rendered as usual."""
+        precompile_gauges(SPECS, self.path)
+        changed = dict(SPECS[0], needle_color='#FF5733')
+
+        with PrecompiledGauges(self.path) as artifact:
+            self.assertNotIn(changed, artifact)
+            self.assertIsNone(artifact.static_figure(changed))
+            gauge = artifact.build(changed)
+            self.assertEqual(gauge.children[0].figure.to_dict(), Gauge(**changed).children[0].figure.to_dict())
+
+    def test_defaults_hash_like_explicit_values(self):
+        """Test that an option left at its default hashes the same as when passed explicitly."""
+        self.assertEqual(precompile.spec_hash({'id': 'a', 'value': 1}),
+                         precompile.spec_hash({'id': 'b', 'value': 2, 'needle_color': '#000000'}))
+        self.assertNotEqual(precompile.spec_hash({'value': 1}), precompile.spec_hash({'value': 1, 'max_value': 50}))
+
+    def test_renderer_change_makes_artifact_stale(self):
+        """Test that an artifact written by another renderer version is ignored as a whole."""
+        precompile_gauges(SPECS, self.path)
+        with mock.patch.object(precompile, 'renderer_fingerprint', return_value='another renderer'):
+            with PrecompiledGauges(self.path) as artifact:
+                self.assertTrue(artifact.stale)
+                self.assertEqual(len(artifact), 0)
+                self.assertIsInstance(artifact.build(SPECS[0]), Gauge)
+
+    def test_not_an_artifact(self):
+        """Test that loading an unrelated file fails."""
+        with open(self.path, 'wb') as f:
+            f.write(b'not an artifact at all')
+        with self.assertRaises(ValueError):
+            PrecompiledGauges(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import time
+import unittest
+
+import numpy as np
+from dash._utils import to_json
+
+from dash_gauge_component import Gauge
+from tests.helpers import COLOR_RANGES
+
+
+class TestGaugeReplay(unittest.TestCase):
+    def test_frames_carry_only_needle_and_value(self):
+        """Test that each frame updates the needle and value text, matching a full render of its value."""
+        gauge = Gauge(id="replay-gauge", value=0, color_ranges=COLOR_RANGES, value_font_color="auto")
+        values = [10, 55.5, 130, -5]
+        figure = gauge.replay(values, timestamps=['10:00', '10:01', '10:02', '10:03'])
+
+        self.assertEqual(len(figure['frames']), 4)
+        needle_index, label_index = figure['frames'][0]['traces']
+        self.assertEqual(figure['data'][label_index]['mode'], 'text')
+
+        for frame, value, color in zip(figure['frames'], [10, 55.5, 100, 0], ['#FF0000', '#FFFF00', '#00FF00', '#FF0000']):
+            self.assertEqual(frame['traces'], [needle_index, label_index])
+            needle, label = frame['data']
+            self.assertEqual(set(needle), {'x', 'y'})
+
+            expected = Gauge(id="expected", value=value, color_ranges=COLOR_RANGES).children[0].figure
+            np.testing.assert_allclose(needle['x'], expected.data[needle_index].x)
+            np.testing.assert_allclose(needle['y'], expected.data[needle_index].y)
+            self.assertEqual(label, {'text': [f"{value:.1f}"], 'textfont': {'color': color}})
+
+        # The dial is sent once, with the first value
+        self.assertEqual(figure['data'][needle_index]['x'], figure['frames'][0]['data'][0]['x'])
+        self.assertEqual([step['label'] for step in figure['layout']['sliders'][0]['steps']],
+                         ['10:00', '10:01', '10:02', '10:03'])
+        self.assertEqual([button['label'] for button in figure['layout']['updatemenus'][0]['buttons']],
+                         ['Play', 'Pause'])
+
+    def test_without_value_text(self):
+        """Test that frames only carry the needle when the value is hidden."""
+        figure = Gauge(id="replay-gauge", value=0, show_value=False).replay([1, 2, 3])
+        self.assertEqual([len(frame['data']) for frame in figure['frames']], [1, 1, 1])
+        self.assertEqual(len(figure['frames'][0]['traces']), 1)
+
+    def test_long_history(self):
+        """Test that a 10,000-sample history builds and serializes quickly, with a bounded slider."""
+        gauge = Gauge(id="replay-gauge", value=0)
+        values = np.random.default_rng(7).uniform(0, 100, 10000)
+
+        start = time.perf_counter()
+        figure = gauge.replay(values, max_slider_steps=50)
+        to_json(figure)
+        self.assertLess(time.perf_counter() - start, 3.0)
+
+        self.assertEqual(len(figure['frames']), 10000)
+        steps = figure['layout']['sliders'][0]['steps']
+        self.assertEqual(len(steps), 50)
+        self.assertEqual(steps[0]['args'][0], ['0'])
+        self.assertEqual(steps[-1]['args'][0], ['9999'])
+
+    def test_invalid_histories(self):
+        """Test that empty histories and mismatched timestamps are rejected."""
+        gauge = Gauge(id="replay-gauge", value=0)
+        with self.assertRaises(ValueError):
+            gauge.replay([])
+        with self.assertRaises(ValueError):
+            gauge.replay([1, 2], timestamps=[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import math
+import multiprocessing
+import threading
+import time
+import unittest
+
+from dash_gauge_component import SharedValueStore
+
+GAUGE_IDS = [f"gauge-{i}" for i in range(16)]
+UPDATES = 20000
+
+
+def write_values(name, count):
+    """Writer process: update every gauge with value == timestamp == k, for k in 1..count."""
+    store = SharedValueStore(GAUGE_IDS, name=name)
+    for k in range(1, count + 1):
+        for gauge_id in GAUGE_IDS:
+            store.update(gauge_id, float(k), timestamp=float(k))
+    store.close()
+
+
+class TestSharedValueStore(unittest.TestCase):
+    def setUp(self):
+        self.store = SharedValueStore(GAUGE_IDS, create=True)
+
+    def tearDown(self):
+        self.store.close()
+        self.store.unlink()
+
+    def test_initial_state(self):
+        """Test that a new store has no values and zero updates."""
+        value, timestamp, sequence = self.store.read("gauge-0")
+        self.assertTrue(math.isnan(value))
+        self.assertTrue(math.isnan(timestamp))
+        self.assertEqual(sequence, 0)
+        self.assertEqual(len(self.store), len(GAUGE_IDS))
+
+    def test_update_and_read(self):
+        """Test that updates are visible and counted."""
+        self.store.update("gauge-3", 42.5, timestamp=100.0)
+        self.store.update("gauge-3", 43.5, timestamp=101.0)
+        self.assertEqual(self.store.read("gauge-3"), (43.5, 101.0, 2))
+
+        self.store.update_many({"gauge-0": 1.0, "gauge-1": 2.0})
+        self.assertEqual(self.store.read_many(["gauge-0", "gauge-1"]), {"gauge-0": 1.0, "gauge-1": 2.0})
+
+    def test_values_view_is_shared_and_read_only(self):
+        """Test that the values view reflects later writes without copying and cannot be written."""
+        view = self.store.values
+        self.store.update("gauge-5", 7.0)
+        self.assertEqual(view[5], 7.0)
+        with self.assertRaises(ValueError):
+            view[5] = 8.0
+        del view
+
+    def test_attach_by_name(self):
+        """Test that a second handle on the same block sees the same values."""
+        self.store.update("gauge-1", 12.0)
+        other = SharedValueStore(GAUGE_IDS, name=self.store.name)
+        self.assertEqual(other.read("gauge-1")[0], 12.0)
+        other.update("gauge-2", 13.0)
+        self.assertEqual(self.store.read("gauge-2")[0], 13.0)
+        other.close()
+
+    def test_attach_with_different_layout_is_rejected(self):
+        """Test that attaching with a different set of gauges fails."""
+        with self.assertRaises(ValueError):
+            SharedValueStore(GAUGE_IDS[:4], name=self.store.name)
+
+    def test_read_of_abandoned_record_times_out(self):
+        """Test that a record left mid-write, as by a writer that died, makes reads fail rather than spin."""
+        self.store.update("gauge-1", 5.0)
+        self.store._sequences[1] += 1  # Odd, as between the two sequence stores of an update
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutError):
+            self.store.read("gauge-1", timeout=0.05)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.store.read_timeout, 1.0)
+        self.assertEqual(self.store.read("gauge-2")[2], 0, "Other records should stay readable.")
+
+    def test_threads_of_the_writer_do_not_lose_updates(self):
+        """Test that updates from several threads of the writing process are all counted and leave records readable."""
+        def write():
+            for k in range(5000):
+                self.store.update("gauge-0", float(k))
+
+        threads = [threading.Thread(target=write) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(int(self.store._sequences[0]), 2 * 4 * 5000)
+        self.assertEqual(self.store.read("gauge-0", timeout=0)[2], 4 * 5000)
+
+    def test_readers_never_see_torn_records(self):
+        """Test reads from another process while a writer process updates every gauge."""
+        writer = multiprocessing.get_context('spawn').Process(target=write_values, args=(self.store.name, UPDATES))
+        writer.start()
+
+        last_sequences = {gauge_id: 0 for gauge_id in GAUGE_IDS}
+        while writer.is_alive():
+            for gauge_id in GAUGE_IDS:
+                value, timestamp, sequence = self.store.read(gauge_id)
+                if sequence:
+                    self.assertEqual(value, timestamp, "Read a half-written record.")
+                    self.assertEqual(value, float(sequence))
+                self.assertGreaterEqual(sequence, last_sequences[gauge_id])
+                last_sequences[gauge_id] = sequence
+        writer.join()
+
+        self.assertEqual(writer.exitcode, 0)
+        for gauge_id in GAUGE_IDS:
+            self.assertEqual(self.store.read(gauge_id), (float(UPDATES), float(UPDATES), UPDATES))
+
+
+if __name__ == "__main__":
+    unittest.main()
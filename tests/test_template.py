@@ -0,0 +1,27 @@
+import unittest
+
+import plotly.io as pio
+
+from dash_gauge_component import Gauge
+from dash_gauge_component.template import TEMPLATE_NAME
+
+
+class TestGaugeTemplate(unittest.TestCase):
+    def test_figures_use_the_gauge_template(self):
+        """Test that figures embed the gauge template instead of plotly's default one."""
+        figure = Gauge(id="gauge", value=50).children[0].figure.to_dict()
+        self.assertEqual(figure['layout']['template'], pio.templates[TEMPLATE_NAME].to_plotly_json())
+        self.assertNotIn('margin', figure['layout'])
+        self.assertEqual(figure['layout']['xaxis']['range'], [-1.3, 1.3])
+
+    def test_traces_leave_out_shared_defaults(self):
+        """Test that no trace repeats the defaults held by the template."""
+        gauge = Gauge(id="gauge", value=50, show_history=True)
+        for figure in (gauge.children[0].figure.to_dict(), gauge.render(20), gauge.replay([1, 2, 3])):
+            for trace in figure['data']:
+                self.assertNotIn('hoverinfo', trace)
+                self.assertNotIn('showlegend', trace)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import copy
+import pickle
+import threading
+import unittest
+
+import numpy as np
+
+from dash_gauge_component import Gauge
+from tests.helpers import COLOR_RANGES
+
+
+def make_gauge(**kwargs):
+    return Gauge(id="stressed", value=10, color_ranges=COLOR_RANGES, value_format="{:.0f}",
+                 value_font_color="auto", show_history=True, history_window=16, **kwargs)
+
+
+class TestPureRender(unittest.TestCase):
+    def test_setter_refreshes_figure(self):
+        """Test that setting the value swaps in the figure of the new value."""
+        gauge = Gauge(id="gauge", value=20)
+        gauge.value = 80
+        self.assertEqual(gauge.children[0].figure, Gauge(id="other", value=80).children[0].figure.to_dict())
+
+    def test_render_does_not_change_the_gauge(self):
+        """Test that rendering another value leaves the value, history and figure alone."""
+        gauge = make_gauge()
+        figure = gauge.children[0].figure
+        rendered = gauge.render(75)
+
+        self.assertEqual(gauge.value, 10)
+        self.assertEqual(len(gauge.history), 1)
+        self.assertIs(gauge.children[0].figure, figure)
+        self.assertEqual(gauge.value_font_color, "auto")
+        self.assertEqual(rendered['layout']['annotations'][-1]['text'], "75")
+        self.assertEqual(rendered['layout']['annotations'][-1]['font']['color'], '#00FF00')
+        self.assertEqual(gauge.render(), figure.to_dict())
+
+    def test_copy_and_pickle(self):
+        """Test that gauges can be deep-copied and pickled, as Dash does with component trees, each copy with its own lock."""
+        gauge = make_gauge()
+        gauge.value = 60
+        for clone in (copy.deepcopy(gauge), pickle.loads(pickle.dumps(gauge))):
+            self.assertIsNot(clone._lock, gauge._lock)
+            self.assertEqual(clone.render(), gauge.render())
+            clone.value = 80
+            self.assertEqual(gauge.value, 60)
+            self.assertEqual(clone.history.values().tolist(), [10, 60, 80])
+
+
+class TestConcurrentRender(unittest.TestCase):
+    def assert_consistent(self, gauge, figure):
+        """Check that the needle of a figure points at the value its text shows."""
+        value = float(figure['layout']['annotations'][-1]['text'])
+        x, y = gauge._needle_polygons([value], gauge.needle_thickness, gauge.needle_length)
+        needle = figure['data'][-2]
+        np.testing.assert_allclose(needle['x'], x[0])
+        np.testing.assert_allclose(needle['y'], y[0])
+        self.assertEqual(figure['layout']['annotations'][-1]['font']['color'], gauge._value_colors([value])[0])
+
+    def test_stress(self):
+        """Test that renders and reads of the figure stay consistent while other threads set the value."""
+        gauge = make_gauge()
+        errors = []
+        set_values = {10}
+        start = threading.Barrier(8)
+
+        def setter(seed):
+            rng = np.random.default_rng(seed)
+            start.wait()
+            for value in rng.integers(0, 101, 30).tolist():
+                set_values.add(value)
+                gauge.value = value
+
+        def reader(seed):
+            rng = np.random.default_rng(seed)
+            start.wait()
+            for _ in range(30):
+                try:
+                    self.assert_consistent(gauge, gauge.render())
+                    self.assert_consistent(gauge, gauge.render(int(rng.integers(0, 101))))
+                    self.assert_consistent(gauge, gauge.children[0].figure)
+                except Exception as error:  # Reported from the main thread
+                    errors.append(error)
+
+        threads = [threading.Thread(target=setter if i % 2 else reader, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(gauge.value_font_color, "auto")
+        self.assertEqual(len(gauge.history), 16)
+        self.assertTrue(set(gauge.history.values().tolist()) <= set_values)
+        self.assertEqual(gauge.history.values()[-1], gauge.value)
+        self.assertEqual(gauge.children[0].figure, gauge.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from dash_gauge_component import Gauge
+from dash_gauge_component.ticks import nice_number, tick_layout
+
+
+class TestNiceTicks(unittest.TestCase):
+    def test_nice_numbers(self):
+        """Test that numbers are rounded to 1, 2, 5 or 10 times a power of ten."""
+        self.assertEqual([nice_number(x, True) for x in (1.2, 2.6, 4, 8, 0.025)], [1, 2, 5, 10, 0.02])
+        self.assertEqual([nice_number(x, False) for x in (1.2, 2.6, 4, 8, 490)], [2, 5, 5, 10, 500])
+
+    def test_default_scale_is_unchanged(self):
+        """Test that the default scale keeps its ticks every 20, with 5 minor ticks in between."""
+        ticks = tick_layout(0, 100, 225, -45, 6)
+        self.assertEqual(ticks.labels, ('0', '20', '40', '60', '80', '100'))
+        self.assertEqual(len(ticks.minor_angles), 25)
+        np.testing.assert_allclose(ticks.major_angles, np.linspace(np.radians(225), np.radians(-45), 6))
+
+    def test_ticks_fall_on_round_numbers(self):
+        """Test that ticks of awkward ranges are on round numbers within the range."""
+        self.assertEqual(tick_layout(0, 1, 180, 0, 6).labels, ('0.0', '0.2', '0.4', '0.6', '0.8', '1.0'))
+        self.assertEqual(tick_layout(-50, 50, 180, 0, 11).labels[:3], ('-50', '-40', '-30'))
+        with self.assertRaises(ValueError):
+            tick_layout(0, 100, 180, 0, 1)
+
+    def test_ends_are_labelled(self):
+        """Test that both ends of common scales get a labelled major tick at the default count."""
+        expected = {
+            (-50, 50): ('-50', '-25', '0', '25', '50'),
+            (0, 150): ('0', '25', '50', '75', '100', '125', '150'),
+            (0, 7): ('0', '1', '2', '3', '4', '5', '6', '7'),
+            (3, 97): ('3', '20', '40', '60', '80', '97'),
+            (10, 500): ('10', '100', '200', '300', '400', '500'),
+            (0.5, 3.5): ('0.5', '1.0', '1.5', '2.0', '2.5', '3.0', '3.5'),
+        }
+        for (min_value, max_value), labels in expected.items():
+            ticks = tick_layout(min_value, max_value, 225, -45, 6)
+            self.assertEqual(ticks.labels, labels)
+            self.assertAlmostEqual(ticks.major_angles[0], np.radians(225))
+            self.assertAlmostEqual(ticks.major_angles[-1], np.radians(-45))
+            self.assertTrue(all(ticks.major_angles[0] > angle > ticks.major_angles[-1] for angle in ticks.minor_angles))
+
+    def test_empty_or_reversed_range_is_rejected(self):
+        """Test that a scale must go up."""
+        for min_value, max_value in ((100, 0), (5, 5)):
+            with self.assertRaisesRegex(ValueError, "must be less than max_value"):
+                tick_layout(min_value, max_value, 225, -45, 6)
+            with self.assertRaisesRegex(ValueError, "must be less than max_value"):
+                Gauge(id="gauge", value=3, min_value=min_value, max_value=max_value)
+
+    def test_ticks_are_shared(self):
+        """Test that gauges with the same scale reuse the same ticks."""
+        tick_layout.cache_clear()
+        Gauge(id="first", value=10, max_value=250)
+        Gauge(id="second", value=20, max_value=250, needle_color='#FF0000')
+        self.assertEqual(tick_layout.cache_info().hits, 1)
+
+    def test_labels_are_one_text_trace(self):
+        """Test that tick labels are drawn by a single text trace rather than annotations."""
+        figure = Gauge(id="gauge", value=50, tick_count=11).children[0].figure
+        self.assertEqual(len(figure.layout.annotations), 1)  # The value text
+        labels = [trace for trace in figure.data if trace.mode == 'text']
+        self.assertEqual(len(labels), 1)
+        self.assertEqual(labels[0].text, tuple(str(value) for value in range(0, 101, 10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
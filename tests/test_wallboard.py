@@ -0,0 +1,132 @@
+"""
+A wallboard page of many gauges, to compare the client render cost of read-only and interactive gauges.
+
+Run it once per mode and open it in Chrome (start Chrome with --enable-precise-memory-info for exact heap
+sizes):
+
+    python tests/test_wallboard.py --gauges 200
+    python tests/test_wallboard.py --gauges 200 --read-only
+
+Once all gauges are drawn, the page shrinks and widens the board in steps, as a browser resize would, and
+shows a JSON report: the time until all gauges were drawn, the JS heap and DOM sizes, the frame times
+during the resize sweep, and the number of relayouts. Relayouts keep being counted, so resizing the window
+by hand afterwards and pressing "Report" shows the cost of window resizes too.
+"""
+import argparse
+
+import dash
+from dash import html, dcc, Input, Output
+
+from dash_gauge_component import Gauge
+
+# Runs in the browser: waits for every gauge to be drawn, then sweeps the board width while timing frames
+MEASURE = """
+function(n_clicks, gauges) {
+    const report = document.getElementById('wallboard-report');
+    const board = document.getElementById('wallboard');
+    const stats = window.wallboardStats = window.wallboardStats || {relayouts: 0, frames: []};
+
+    const write = () => {
+        const frames = stats.frames.slice().sort((a, b) => a - b);
+        const at = q => frames.length ? frames[Math.min(frames.length - 1, Math.floor(q * frames.length))] : null;
+        const result = {
+            gauges: gauges,
+            drawn_ms: stats.drawn,
+            js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1e6 : null,
+            dom_nodes: document.getElementsByTagName('*').length,
+            sweep_frames: frames.length,
+            frame_ms_mean: frames.length ? frames.reduce((a, b) => a + b, 0) / frames.length : null,
+            frame_ms_p95: at(0.95),
+            frame_ms_max: at(1),
+            long_frames: frames.filter(frame => frame > 50).length,
+            relayouts: stats.relayouts,
+        };
+        report.textContent = JSON.stringify(result, null, 2);
+        console.log('wallboard', JSON.stringify(result));
+    };
+
+    if (stats.started) {
+        write();
+        return window.dash_clientside.no_update;
+    }
+    stats.started = true;
+
+    const sweep = () => {
+        const widths = [];
+        for (let i = 0; i <= 10; i++) widths.push(100 - 4 * i);
+        for (let i = 9; i >= 0; i--) widths.push(100 - 4 * i);
+        let last = performance.now();
+        let sweeping = true;
+        const frame = now => {
+            stats.frames.push(now - last);
+            last = now;
+            if (sweeping) requestAnimationFrame(frame);
+        };
+        requestAnimationFrame(frame);
+        widths.forEach((width, i) => setTimeout(() => { board.style.width = width + '%'; }, 200 * i));
+        setTimeout(() => { sweeping = false; write(); }, 200 * widths.length + 1000);
+    };
+
+    const waitForGauges = () => {
+        const plots = document.querySelectorAll('#wallboard .js-plotly-plot');
+        if (plots.length < gauges || Array.from(plots).some(gd => !gd._fullLayout)) {
+            requestAnimationFrame(waitForGauges);
+            return;
+        }
+        stats.drawn = performance.now();
+        plots.forEach(gd => gd.on('plotly_relayout', () => { stats.relayouts += 1; }));
+        sweep();
+    };
+    waitForGauges();
+    return window.dash_clientside.no_update;
+}
+"""
+
+
+def create_app(gauges, read_only):
+    """Create the wallboard app, with the container-relative gauges of the responsive test page."""
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.H1(f"Wallboard, {gauges} {'read-only' if read_only else 'interactive'} gauges",
+                style={'textAlign': 'center'}),
+        html.Button("Report", id='wallboard-measure'),
+        dcc.Store(id='wallboard-gauges', data=gauges),
+        html.Pre(id='wallboard-report', children="Drawing..."),
+        html.Div(
+            id='wallboard',
+            children=[
+                html.Div([
+                    Gauge(
+                        id=f"wallboard-gauge-{i}",
+                        value=(i * 7) % 101,
+                        width="100%",  # 100% of container width
+                        height="100%",  # 100% of container height
+                        color_ranges=[
+                            {'min': 0, 'max': 60, 'color': '#00AA00'},
+                            {'min': 60, 'max': 85, 'color': '#FFAA00'},
+                            {'min': 85, 'max': 100, 'color': '#DD0000'},
+                        ],
+                        read_only=read_only,
+                    ),
+                ], style={'height': '160px'})
+                for i in range(gauges)
+            ],
+            style={'display': 'grid', 'gridTemplateColumns': 'repeat(10, 1fr)', 'width': '100%'},
+        ),
+    ])
+    app.clientside_callback(
+        MEASURE,
+        Output('wallboard-report', 'title'),
+        Input('wallboard-measure', 'n_clicks'),
+        Input('wallboard-gauges', 'data'),
+    )
+    return app
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gauges', type=int, default=200)
+    parser.add_argument('--read-only', action='store_true')
+    parser.add_argument('--port', type=int, default=8058)
+    args = parser.parse_args()
+    create_app(args.gauges, args.read_only).run(debug=False, port=args.port)